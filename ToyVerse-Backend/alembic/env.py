@@ -0,0 +1,57 @@
+
+from alembic import context
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.core.database import Base
+from app.core.db_profiles import configure_engine, engine_options
+import app.models
+
+target_metadata = Base.metadata
+
+def get_url() -> str:
+
+    return context.config.get_main_option("sqlalchemy.url") or settings.database_url
+
+def run_migrations_offline() -> None:
+
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+
+    connection = context.config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+
+    url = get_url()
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+
+    with engine.connect() as connection:
+        _run(connection)
+
+    engine.dispose()
+
+def _run(connection) -> None:
+
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,42 @@
+"""hot path indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_cart_items_user_id_product_id', 'cart_items', ['user_id', 'product_id']),
+    ('ix_orders_user_id_created_at', 'orders', ['user_id', 'created_at']),
+    ('ix_orders_status_created_at', 'orders', ['status', 'created_at']),
+    ('ix_orders_created_at', 'orders', ['created_at']),
+    ('ix_reviews_user_id_product_id', 'reviews', ['user_id', 'product_id']),
+    ('ix_product_interactions_product_id_timestamp', 'product_interactions', ['product_id', 'timestamp']),
+    ('ix_product_interactions_user_id_timestamp', 'product_interactions', ['user_id', 'timestamp']),
+    ('ix_product_interactions_session_id_timestamp', 'product_interactions', ['session_id', 'timestamp']),
+    ('ix_product_interactions_timestamp', 'product_interactions', ['timestamp']),
+    ('ix_activity_logs_actor_created_at', 'activity_logs', ['actor', 'created_at']),
+    ('ix_activity_logs_created_at', 'activity_logs', ['created_at']),
+]
+
+def existing_indexes(table):
+    if op.get_context().as_sql:
+        return set()
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        if name not in existing_indexes(table):
+            op.create_index(name, table, columns, unique=False)
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
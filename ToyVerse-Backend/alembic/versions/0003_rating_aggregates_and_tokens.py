@@ -0,0 +1,113 @@
+"""rating aggregates and token tables
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+RATING_COLUMNS = ['rating_sum', 'rating_count'] + [f'rating_{star}_count' for star in range(1, 6)]
+
+def inspector():
+    if op.get_context().as_sql:
+        return None
+    return sa.inspect(op.get_bind())
+
+def existing_tables():
+    current = inspector()
+    return set(current.get_table_names()) if current else set()
+
+def existing_columns(table):
+    current = inspector()
+    return {column['name'] for column in current.get_columns(table)} if current else set()
+
+def existing_indexes(table):
+    current = inspector()
+    return {index['name'] for index in current.get_indexes(table)} if current else set()
+
+def backfill_rating_aggregates():
+    review_counts = {
+        'rating_sum': "SELECT COALESCE(SUM(r.rating), 0) FROM reviews r WHERE r.product_id = products.id",
+        'rating_count': "SELECT COUNT(*) FROM reviews r WHERE r.product_id = products.id",
+    }
+    for star in range(1, 6):
+        review_counts[f'rating_{star}_count'] = (
+            f"SELECT COUNT(*) FROM reviews r WHERE r.product_id = products.id AND r.rating = {star}"
+        )
+
+    op.execute(
+        "UPDATE products SET " + ", ".join(f"{column} = ({query})" for column, query in review_counts.items())
+    )
+    op.execute(
+        "UPDATE products SET rating = (2 * rating_sum + rating_count) / (2 * rating_count) "
+        "WHERE rating_count > 0"
+    )
+
+def upgrade() -> None:
+    columns = existing_columns('products')
+    added = [column for column in RATING_COLUMNS if column not in columns]
+    for column in added:
+        op.add_column('products', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+    if added:
+        backfill_rating_aggregates()
+
+    tables = existing_tables()
+
+    if 'revoked_tokens' not in tables:
+        op.create_table('revoked_tokens',
+        sa.Column('jti', sa.String(length=64), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_revoked_tokens_expires_at'), 'revoked_tokens', ['expires_at'], unique=False)
+        op.create_index(op.f('ix_revoked_tokens_id'), 'revoked_tokens', ['id'], unique=False)
+        op.create_index(op.f('ix_revoked_tokens_jti'), 'revoked_tokens', ['jti'], unique=True)
+
+    if 'refresh_tokens' not in tables:
+        op.create_table('refresh_tokens',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('family_id', sa.String(length=32), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_refresh_tokens_family_id'), 'refresh_tokens', ['family_id'], unique=False)
+        op.create_index(op.f('ix_refresh_tokens_id'), 'refresh_tokens', ['id'], unique=False)
+        op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=True)
+        op.create_index(op.f('ix_refresh_tokens_user_id'), 'refresh_tokens', ['user_id'], unique=False)
+
+    if 'ix_reviews_product_id_created_at' not in existing_indexes('reviews'):
+        op.create_index('ix_reviews_product_id_created_at', 'reviews', ['product_id', 'created_at'], unique=False)
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_product_id_created_at', table_name='reviews')
+
+    op.drop_index(op.f('ix_refresh_tokens_user_id'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_id'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_family_id'), table_name='refresh_tokens')
+    op.drop_table('refresh_tokens')
+
+    op.drop_index(op.f('ix_revoked_tokens_jti'), table_name='revoked_tokens')
+    op.drop_index(op.f('ix_revoked_tokens_id'), table_name='revoked_tokens')
+    op.drop_index(op.f('ix_revoked_tokens_expires_at'), table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
+
+    for column in reversed(RATING_COLUMNS):
+        op.drop_column('products', column, mssql_drop_default=True)
@@ -1,22 +1,32 @@
 
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+import math
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_read_db, get_async_db
+from app.core.rate_limit import login_rate_limiter
 from app.core.security import jwt_handler
+from app.core.principal_cache import Principal
 from app.models.user import User, Admin
+from app.schemas.user import UserLogin
 from app.repositories.user_repository import UserRepository
+from app.repositories.token_repository import TokenRepository
 from app.repositories.product_repository import ProductRepository
+from app.repositories.async_product_repository import AsyncProductRepository
 from app.repositories.cart_repository import CartRepository
 from app.repositories.order_repository import OrderRepository
 from app.repositories.review_repository import ReviewRepository
 from app.repositories.activity_log_repository import ActivityLogRepository
 from app.repositories.chat_repository import ChatRepository
 from app.repositories.interaction_repository import InteractionRepository
+from app.repositories.cached_repository import CachedRepository
 from app.services.auth_service import AuthService
 from app.services.product_service import ProductService
+from app.services.async_product_service import AsyncProductService
 from app.services.cart_service import CartService
 from app.services.order_service import OrderService
 from app.services.review_service import ReviewService
@@ -26,6 +36,23 @@ from app.services.recommendation_service import RecommendationService
 
 security = HTTPBearer()
 
+PRODUCT_CACHE_TTLS = {
+    "get_by_id": 60.0,
+    "get_all": 30.0,
+    "get_by_category": 30.0,
+    "get_by_rating": 30.0,
+    "get_top_rated": 30.0,
+    "get_in_stock": 15.0,
+    "filter_products": 15.0,
+    "search": 15.0,
+    "get_rating_summaries": 30.0,
+}
+
+REVIEW_CACHE_TTLS = {
+    "get_by_product_id": 30.0,
+    "get_product_reviews_page": 30.0,
+}
+
 def get_database() -> Session:
 
     return Depends(get_db)
@@ -34,9 +61,17 @@ def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
 
     return UserRepository(db)
 
+def get_token_repository(db: Session = Depends(get_db)) -> TokenRepository:
+
+    return TokenRepository(db)
+
 def get_product_repository(db: Session = Depends(get_db)) -> ProductRepository:
 
-    return ProductRepository(db)
+    return CachedRepository(
+        ProductRepository(db),
+        PRODUCT_CACHE_TTLS,
+        writes=("apply_rating_delta", "replace_rating_aggregates", "reserve_stock")
+    )
 
 def get_cart_repository(db: Session = Depends(get_db)) -> CartRepository:
     return CartRepository(db)
@@ -45,7 +80,7 @@ def get_order_repository(db: Session = Depends(get_db)) -> OrderRepository:
     return OrderRepository(db)
 
 def get_review_repository(db: Session = Depends(get_db)) -> ReviewRepository:
-    return ReviewRepository(db)
+    return CachedRepository(ReviewRepository(db), REVIEW_CACHE_TTLS)
 
 def get_activity_log_repository(db: Session = Depends(get_db)) -> ActivityLogRepository:
     return ActivityLogRepository(db)
@@ -57,10 +92,11 @@ def get_interaction_repository(db: Session = Depends(get_db)) -> InteractionRepo
     return InteractionRepository(db)
 
 def get_auth_service(
-    user_repo: UserRepository = Depends(get_user_repository)
+    user_repo: UserRepository = Depends(get_user_repository),
+    token_repo: TokenRepository = Depends(get_token_repository)
 ) -> AuthService:
 
-    return AuthService(user_repo)
+    return AuthService(user_repo, token_repo)
 
 def get_product_service(
     product_repo: ProductRepository = Depends(get_product_repository)
@@ -68,6 +104,15 @@ def get_product_service(
 
     return ProductService(product_repo)
 
+def get_async_product_service(
+    db: Optional[AsyncSession] = Depends(get_async_db)
+) -> Optional[AsyncProductService]:
+
+    if db is None:
+        return None
+
+    return AsyncProductService(AsyncProductRepository(db))
+
 def get_cart_service(
     cart_repo: CartRepository = Depends(get_cart_repository),
     product_repo: ProductRepository = Depends(get_product_repository)
@@ -105,14 +150,38 @@ def get_recommendation_service(
 ) -> RecommendationService:
     return RecommendationService(interaction_repo, product_repo)
 
-async def get_current_user(
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: AuthService = Depends(get_auth_service)
-) -> User:
+) -> Principal:
 
-    token = credentials.credentials
+    principal = auth_service.get_principal_by_token(credentials.credentials)
 
-    user = auth_service.get_user_by_token(token)
+    if not principal:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return principal
+
+async def get_current_principal_optional(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    auth_service: AuthService = Depends(get_auth_service)
+) -> Optional[Principal]:
+
+    if not credentials:
+        return None
+
+    return auth_service.get_principal_by_token(credentials.credentials)
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    auth_service: AuthService = Depends(get_auth_service)
+) -> User:
+
+    user = auth_service.get_by_id(principal.id)
 
     if not user:
         raise HTTPException(
@@ -142,16 +211,16 @@ async def get_current_active_user(
     return current_user
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user)
-) -> Admin:
+    principal: Principal = Depends(get_current_principal)
+) -> Principal:
 
-    if not isinstance(current_user, Admin) and current_user.role != 'admin':
+    if principal.role != 'admin':
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required"
         )
 
-    return current_user
+    return principal
 
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -165,3 +234,29 @@ async def get_optional_user(
     user = auth_service.get_user_by_token(token)
 
     return user
+
+def get_client_ip(request: Request) -> str:
+
+    if settings.trust_forwarded_for:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+
+    return request.client.host if request.client else "unknown"
+
+async def throttle_login(request: Request, credentials: UserLogin) -> None:
+
+    limits = (
+        (f"login:ip:{get_client_ip(request)}", settings.login_ip_burst, settings.login_ip_per_minute),
+        (f"login:account:{credentials.username.strip().lower()}", settings.login_account_burst, settings.login_account_per_minute),
+    )
+
+    for key, burst, per_minute in limits:
+        allowed, retry_after = await login_rate_limiter.hit_async(key, burst, per_minute)
+
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts. Please try again later.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
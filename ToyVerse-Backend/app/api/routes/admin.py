@@ -4,17 +4,18 @@ from typing import List, Optional
 from app.schemas.order import OrderResponse
 from app.services.order_service import OrderService
 from app.services.activity_log_service import ActivityLogService
-from app.models.user import Admin
+from app.core.principal_cache import Principal
 from app.api.dependencies import get_order_service, get_activity_log_service, get_current_admin
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/admin", tags=["Admin"])
+router = APIRouter(prefix="/admin", tags=["Admin"], route_class=UnitOfWorkRoute)
 
 @router.get("/orders", response_model=List[OrderResponse])
 async def get_all_orders(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     order_status: Optional[str] = Query(None, description="Filter by status"),
-    current_admin: Admin = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_current_admin),
     order_service: OrderService = Depends(get_order_service)
 ):
     if order_status:
@@ -43,7 +44,7 @@ async def get_activity_logs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     actor: Optional[str] = Query(None, description="Filter by actor"),
-    current_admin: Admin = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_current_admin),
     log_service: ActivityLogService = Depends(get_activity_log_service)
 ):
     if actor:
@@ -65,7 +66,7 @@ async def get_activity_logs(
 async def create_activity_log(
     actor: str,
     action: str,
-    current_admin: Admin = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_current_admin),
     log_service: ActivityLogService = Depends(get_activity_log_service)
 ):
     log = log_service.log(actor, action)
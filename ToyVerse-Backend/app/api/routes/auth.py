@@ -1,13 +1,16 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Dict
+from fastapi.security import HTTPAuthorizationCredentials
+from typing import Dict, Optional
 
-from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
+from app.schemas.user import UserCreate, UserLogin, UserResponse, Token, RefreshRequest, LogoutRequest
 from app.services.auth_service import AuthService
 from app.models.user import User
-from app.api.dependencies import get_auth_service, get_current_user
+from app.core.principal_cache import Principal
+from app.api.dependencies import security, get_auth_service, get_current_user, get_current_principal, throttle_login
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=UnitOfWorkRoute)
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -15,7 +18,7 @@ async def register(
     auth_service: AuthService = Depends(get_auth_service)
 ) -> Token:
 
-    user = auth_service.register(user_data)
+    user = await auth_service.register_async(user_data)
 
     if not user:
         raise HTTPException(
@@ -24,8 +27,9 @@ async def register(
         )
 
     access_token = auth_service.create_token(user)
+    refresh_token = auth_service.create_refresh_token(user)
 
-    if not access_token:
+    if not access_token or not refresh_token:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create access token"
@@ -46,17 +50,18 @@ async def register(
 
     return Token(
         access_token=access_token,
+        refresh_token=refresh_token,
         token_type="bearer",
         user=user_response
     )
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=[Depends(throttle_login)])
 async def login(
     credentials: UserLogin,
     auth_service: AuthService = Depends(get_auth_service)
 ) -> Token:
 
-    user = auth_service.authenticate(credentials.username, credentials.password)
+    user = await auth_service.authenticate_async(credentials.username, credentials.password)
 
     if not user:
         raise HTTPException(
@@ -66,8 +71,9 @@ async def login(
         )
 
     access_token = auth_service.create_token(user)
+    refresh_token = auth_service.create_refresh_token(user)
 
-    if not access_token:
+    if not access_token or not refresh_token:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create access token"
@@ -88,12 +94,63 @@ async def login(
 
     return Token(
         access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer",
+        user=user_response
+    )
+
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    request: RefreshRequest,
+    auth_service: AuthService = Depends(get_auth_service)
+) -> Token:
+
+    result = auth_service.refresh_tokens(request.refresh_token)
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user, access_token, refresh_token = result
+
+    permissions = user.get_permissions()
+
+    user_response = UserResponse(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        full_name=user.full_name,
+        role=user.role,
+        profile_picture=user.profile_picture,
+        created_at=user.created_at,
+        permissions=permissions
+    )
+
+    return Token(
+        access_token=access_token,
+        refresh_token=refresh_token,
         token_type="bearer",
         user=user_response
     )
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)) -> Dict[str, str]:
+async def logout(
+    request: Optional[LogoutRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    principal: Principal = Depends(get_current_principal),
+    auth_service: AuthService = Depends(get_auth_service)
+) -> Dict[str, str]:
+
+    refresh_token = request.refresh_token if request else None
+
+    if not auth_service.logout(credentials.credentials, refresh_token):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to log out"
+        )
 
     return {"message": "Successfully logged out"}
 
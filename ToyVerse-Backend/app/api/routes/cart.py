@@ -4,14 +4,15 @@ from decimal import Decimal
 
 from app.schemas.cart import CartItemCreate, CartItemUpdate, CartItemResponse, CartResponse
 from app.services.cart_service import CartService
-from app.models.user import User
-from app.api.dependencies import get_cart_service, get_current_user
+from app.core.principal_cache import Principal
+from app.api.dependencies import get_cart_service, get_current_principal
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/cart", tags=["Cart"])
+router = APIRouter(prefix="/cart", tags=["Cart"], route_class=UnitOfWorkRoute)
 
 @router.get("", response_model=CartResponse)
 async def get_cart(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     cart_service: CartService = Depends(get_cart_service)
 ):
     cart_items = cart_service.get_user_cart(current_user.id)
@@ -48,7 +49,7 @@ async def get_cart(
 @router.post("/add", response_model=CartItemResponse, status_code=status.HTTP_201_CREATED)
 async def add_to_cart(
     item_data: CartItemCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     cart_service: CartService = Depends(get_cart_service)
 ):
     cart_item = cart_service.add_to_cart(
@@ -83,7 +84,7 @@ async def add_to_cart(
 async def update_cart_item(
     item_id: int,
     update_data: CartItemUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     cart_service: CartService = Depends(get_cart_service)
 ):
     cart_item = cart_service.get_by_id(item_id)
@@ -120,7 +121,7 @@ async def update_cart_item(
 
 @router.delete("/clear", status_code=status.HTTP_204_NO_CONTENT)
 async def clear_cart(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     cart_service: CartService = Depends(get_cart_service)
 ):
     if not cart_service.clear_cart(current_user.id):
@@ -132,7 +133,7 @@ async def clear_cart(
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_from_cart(
     item_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     cart_service: CartService = Depends(get_cart_service)
 ):
     cart_item = cart_service.get_by_id(item_id)
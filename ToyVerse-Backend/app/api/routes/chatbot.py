@@ -3,20 +3,21 @@ from typing import Optional
 
 from app.schemas.chat import ChatMessageRequest, ChatMessageResponse, ChatHistoryResponse
 from app.services.chatbot_service import ChatbotService
-from app.models.user import User
+from app.core.principal_cache import Principal
+from app.core.unit_of_work import UnitOfWorkRoute
 from app.api.dependencies import (
     get_chatbot_service,
-    get_current_user,
-    get_optional_user,
+    get_current_principal,
+    get_current_principal_optional,
 )
 
-router = APIRouter(prefix="/chatbot", tags=["Chatbot"])
+router = APIRouter(prefix="/chatbot", tags=["Chatbot"], route_class=UnitOfWorkRoute)
 
 @router.post("/message", response_model=dict)
 async def send_message(
     request: ChatMessageRequest,
     chatbot_service: ChatbotService = Depends(get_chatbot_service),
-    current_user: Optional[User] = Depends(get_optional_user)
+    current_user: Optional[Principal] = Depends(get_current_principal_optional)
 ):
     try:
         result = chatbot_service.process_message(
@@ -73,7 +74,7 @@ async def clear_conversation(
 @router.get("/user-history", response_model=list[ChatMessageResponse])
 async def get_user_chat_history(
     limit: int = Query(50, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     chatbot_service: ChatbotService = Depends(get_chatbot_service)
 ):
     messages = chatbot_service._repository.get_by_user(current_user.id, skip=0, limit=limit)
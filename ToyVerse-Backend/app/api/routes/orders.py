@@ -1,17 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, List
+import json
 
 from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse
 from app.services.order_service import OrderService
-from app.models.user import User, Admin
-from app.api.dependencies import get_order_service, get_current_user, get_current_admin
+from app.core.principal_cache import Principal
+from app.api.dependencies import get_db, get_order_service, get_current_principal, get_current_admin
+from app.core.config import settings
+from app.core.events import order_events, Subscription
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/orders", tags=["Orders"])
+router = APIRouter(prefix="/orders", tags=["Orders"], route_class=UnitOfWorkRoute)
+
+TERMINAL_STATUSES = {"delivered", "cancelled"}
+
+def _format_sse(event: dict) -> str:
+    return f"event: status\ndata: {json.dumps(event)}\n\n"
+
+async def _stream_order_events(
+    request: Request,
+    subscription: Subscription,
+    snapshot: dict
+) -> AsyncIterator[str]:
+    try:
+        yield "retry: 5000\n\n"
+        yield _format_sse(snapshot)
+
+        if snapshot['status'] in TERMINAL_STATUSES:
+            return
+
+        while not await request.is_disconnected():
+            event = await subscription.get(timeout=settings.order_events_heartbeat_seconds)
+
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            yield _format_sse(event)
+
+            if event['status'] in TERMINAL_STATUSES:
+                return
+    finally:
+        subscription.close()
 
 @router.post("", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order_data: OrderCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     order_service: OrderService = Depends(get_order_service)
 ):
     customer_details = order_data.customer_details.model_dump()
@@ -45,7 +82,7 @@ async def create_order(
 async def get_user_orders(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     order_service: OrderService = Depends(get_order_service)
 ):
     orders = order_service.get_user_orders(current_user.id, skip, limit)
@@ -69,7 +106,7 @@ async def get_user_orders(
 @router.get("/{order_id}", response_model=OrderResponse)
 async def get_order(
     order_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     order_service: OrderService = Depends(get_order_service)
 ):
     order = order_service.get_by_id(order_id)
@@ -99,11 +136,49 @@ async def get_order(
         updated_at=order.updated_at
     )
 
+@router.get("/{order_id}/events")
+async def stream_order_events(
+    order_id: int,
+    request: Request,
+    current_user: Principal = Depends(get_current_principal),
+    order_service: OrderService = Depends(get_order_service),
+    db: Session = Depends(get_db)
+):
+    subscription = order_events.subscribe(order_id)
+
+    order = order_service.get_by_id(order_id)
+    snapshot = OrderService.status_event(order) if order else None
+    owner_id = order.user_id if order else None
+    db.close()
+
+    if not order:
+        subscription.close()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order not found"
+        )
+
+    if owner_id != current_user.id and current_user.role != 'admin':
+        subscription.close()
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this order"
+        )
+
+    return StreamingResponse(
+        _stream_order_events(request, subscription, snapshot),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
 @router.put("/{order_id}/status", response_model=OrderResponse)
 async def update_order_status(
     order_id: int,
     update_data: OrderUpdate,
-    current_admin: Admin = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_current_admin),
     order_service: OrderService = Depends(get_order_service)
 ):
     if not update_data.status:
@@ -5,12 +5,14 @@ from decimal import Decimal
 
 from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
 from app.services.product_service import ProductService
-from app.models.user import User, Admin
-from app.api.dependencies import get_product_service, get_current_user, get_current_admin
+from app.services.async_product_service import AsyncProductService
+from app.core.principal_cache import Principal
+from app.api.dependencies import get_product_service, get_async_product_service, get_current_admin, get_read_db
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/products", tags=["Products"])
+router = APIRouter(prefix="/products", tags=["Products"], route_class=UnitOfWorkRoute)
 
-@router.get("", response_model=List[ProductResponse])
+@router.get("", response_model=List[ProductResponse], dependencies=[Depends(get_read_db)])
 async def get_products(
     category: Optional[str] = Query(None, description="Filter by category"),
     price_max: Optional[Decimal] = Query(None, description="Maximum price filter"),
@@ -19,10 +21,25 @@ async def get_products(
     in_stock: Optional[bool] = Query(None, description="Filter in-stock products only"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
-    product_service: ProductService = Depends(get_product_service)
+    product_service: ProductService = Depends(get_product_service),
+    async_product_service: Optional[AsyncProductService] = Depends(get_async_product_service)
 ) -> List[ProductResponse]:
 
-    if any([category, price_max, rating, search, in_stock is not None]):
+    filtered = any([category, price_max, rating, search, in_stock is not None])
+
+    if async_product_service and filtered:
+        products = await async_product_service.filter_products(
+            category=category,
+            price_max=price_max,
+            rating=rating,
+            in_stock=in_stock,
+            search=search,
+            skip=skip,
+            limit=limit
+        )
+    elif async_product_service:
+        products = await async_product_service.get_all(skip=skip, limit=limit)
+    elif filtered:
         products = product_service.filter_products(
             category=category,
             price_max=price_max,
@@ -51,18 +68,25 @@ async def get_products(
             created_at=p.created_at,
             updated_at=p.updated_at,
             is_in_stock=p.is_in_stock,
-            formatted_price=p.formatted_price
+            formatted_price=p.formatted_price,
+            average_rating=p.average_rating,
+            rating_count=p.rating_count or 0,
+            rating_histogram=p.rating_histogram
         )
         for p in products
     ]
 
-@router.get("/{product_id}", response_model=ProductResponse)
+@router.get("/{product_id}", response_model=ProductResponse, dependencies=[Depends(get_read_db)])
 async def get_product(
     product_id: int,
-    product_service: ProductService = Depends(get_product_service)
+    product_service: ProductService = Depends(get_product_service),
+    async_product_service: Optional[AsyncProductService] = Depends(get_async_product_service)
 ) -> ProductResponse:
 
-    product = product_service.get_by_id(product_id)
+    if async_product_service:
+        product = await async_product_service.get_by_id(product_id)
+    else:
+        product = product_service.get_by_id(product_id)
 
     if not product:
         raise HTTPException(
@@ -84,14 +108,17 @@ async def get_product(
         created_at=product.created_at,
         updated_at=product.updated_at,
         is_in_stock=product.is_in_stock,
-        formatted_price=product.formatted_price
+        formatted_price=product.formatted_price,
+        average_rating=product.average_rating,
+        rating_count=product.rating_count or 0,
+        rating_histogram=product.rating_histogram
     )
 
 @router.post("", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
 async def create_product(
     product_data: ProductCreate,
     product_service: ProductService = Depends(get_product_service),
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ) -> ProductResponse:
 
     product_dict = product_data.model_dump()
@@ -118,7 +145,10 @@ async def create_product(
         created_at=product.created_at,
         updated_at=product.updated_at,
         is_in_stock=product.is_in_stock,
-        formatted_price=product.formatted_price
+        formatted_price=product.formatted_price,
+        average_rating=product.average_rating,
+        rating_count=product.rating_count or 0,
+        rating_histogram=product.rating_histogram
     )
 
 @router.put("/{product_id}", response_model=ProductResponse)
@@ -126,7 +156,7 @@ async def update_product(
     product_id: int,
     product_data: ProductUpdate,
     product_service: ProductService = Depends(get_product_service),
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ) -> ProductResponse:
 
     update_dict = product_data.model_dump(exclude_unset=True)
@@ -159,14 +189,17 @@ async def update_product(
         created_at=product.created_at,
         updated_at=product.updated_at,
         is_in_stock=product.is_in_stock,
-        formatted_price=product.formatted_price
+        formatted_price=product.formatted_price,
+        average_rating=product.average_rating,
+        rating_count=product.rating_count or 0,
+        rating_histogram=product.rating_histogram
     )
 
 @router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_product(
     product_id: int,
     product_service: ProductService = Depends(get_product_service),
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ) -> None:
 
     success = product_service.delete(product_id)
@@ -8,10 +8,12 @@ from datetime import datetime
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
 from app.api.dependencies import get_current_user, get_db
-from app.core.security import verify_password, hash_password
+from app.core.security import verify_password_async, hash_password_async
+from app.core.principal_cache import principal_cache
+from app.core.unit_of_work import UnitOfWork, UnitOfWorkRoute
 from sqlalchemy.orm import Session
 
-router = APIRouter(prefix="/profile", tags=["Profile"])
+router = APIRouter(prefix="/profile", tags=["Profile"], route_class=UnitOfWorkRoute)
 
 UPLOAD_DIR = "uploads/profile_pictures"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -67,16 +69,16 @@ async def update_profile(
                 detail="Current password required to set new password"
             )
 
-        if not verify_password(current_password, current_user.password_hash):
+        if not await verify_password_async(current_password, current_user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Current password is incorrect"
             )
 
-        current_user.password_hash = hash_password(new_password)
+        current_user.password_hash = await hash_password_async(new_password)
 
-    db.commit()
-    db.refresh(current_user)
+    user_id = current_user.id
+    UnitOfWork.for_session(db).after_commit(lambda: principal_cache.invalidate_user(user_id))
 
     return UserResponse(
         id=current_user.id,
@@ -139,9 +141,6 @@ async def upload_profile_picture(
     profile_picture_url = f"/uploads/profile_pictures/{filename}"
     current_user.profile_picture = profile_picture_url
 
-    db.commit()
-    db.refresh(current_user)
-
     return {
         "message": "Profile picture uploaded successfully",
         "profile_picture": profile_picture_url
@@ -168,6 +167,5 @@ async def delete_profile_picture(
             pass
 
     current_user.profile_picture = None
-    db.commit()
 
     return {"message": "Profile picture deleted successfully"}
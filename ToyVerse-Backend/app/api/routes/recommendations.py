@@ -1,19 +1,20 @@
 
 from typing import Optional
-from fastapi import APIRouter, Depends, Request
-from app.models.user import User
+from fastapi import APIRouter, Depends, Request, status
+from app.core.principal_cache import Principal
 from app.services.recommendation_service import RecommendationService
-from app.api.dependencies import get_current_user_optional, get_recommendation_service
+from app.api.dependencies import get_current_principal_optional, get_recommendation_service, get_read_db
 from app.schemas.product import ProductResponse
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/recommendations", tags=["recommendations"])
+router = APIRouter(prefix="/recommendations", tags=["recommendations"], route_class=UnitOfWorkRoute)
 
-@router.get("")
+@router.get("", dependencies=[Depends(get_read_db)])
 async def get_recommendations(
     request: Request,
     type: str = 'all',
     limit: int = 20,
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user: Optional[Principal] = Depends(get_current_principal_optional),
     recommendation_service: RecommendationService = Depends(get_recommendation_service)
 ):
 
@@ -29,12 +30,12 @@ async def get_recommendations(
 
     return recommendations
 
-@router.post("/track")
+@router.post("/track", status_code=status.HTTP_202_ACCEPTED)
 async def track_interaction(
     request: Request,
     product_id: int,
     interaction_type: str = 'view',
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user: Optional[Principal] = Depends(get_current_principal_optional),
     recommendation_service: RecommendationService = Depends(get_recommendation_service)
 ):
 
@@ -43,7 +44,7 @@ async def track_interaction(
     user_agent = request.headers.get('User-Agent')
     ip_address = request.client.host
 
-    interaction = recommendation_service.track_interaction(
+    queued = recommendation_service.track_interaction(
         product_id=product_id,
         interaction_type=interaction_type,
         user_id=user_id,
@@ -53,11 +54,11 @@ async def track_interaction(
     )
 
     return {
-        "message": "Interaction tracked successfully",
-        "interaction": interaction.to_dict()
+        "message": "Interaction accepted",
+        "queued": queued
     }
 
-@router.get("/product/{product_id}")
+@router.get("/product/{product_id}", dependencies=[Depends(get_read_db)])
 async def get_product_recommendations(
     product_id: int,
     limit: int = 6,
@@ -1,21 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Optional
+import hashlib
+import json
 
-from app.schemas.review import ReviewCreate, ReviewUpdate, ReviewResponse
+from app.schemas.review import ReviewCreate, ReviewUpdate, ReviewResponse, ReviewSummary
 from app.services.review_service import ReviewService
-from app.models.user import User
-from app.api.dependencies import get_review_service, get_current_user
+from app.core.principal_cache import Principal
+from app.api.dependencies import get_review_service, get_current_principal, get_read_db
+from app.core.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/reviews", tags=["Reviews"], route_class=UnitOfWorkRoute)
+
+MAX_SUMMARY_PRODUCTS = 100
+
+def _parse_product_ids(values: List[str]) -> List[int]:
+    product_ids = []
+    for value in values:
+        for part in value.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                product_id = int(part)
+            except ValueError:
+                product_id = 0
+            if product_id < 1:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Invalid product id: {part}"
+                )
+            if product_id not in product_ids:
+                product_ids.append(product_id)
+
+    if not product_ids or len(product_ids) > MAX_SUMMARY_PRODUCTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {MAX_SUMMARY_PRODUCTS} product ids"
+        )
+
+    return product_ids
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+@router.get("/summary", response_model=List[ReviewSummary], dependencies=[Depends(get_read_db)])
+async def get_review_summaries(
+    request: Request,
+    product_ids: List[str] = Query(..., description="Comma-separated or repeated product ids"),
+    review_service: ReviewService = Depends(get_review_service)
+):
+    summaries = review_service.get_rating_summaries(_parse_product_ids(product_ids))
+
+    body = json.dumps(summaries, separators=(",", ":"))
+    etag = f'W/"{hashlib.sha1(body.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=30"}
+
+    if _etag_matches(request.headers.get("If-None-Match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-router = APIRouter(prefix="/reviews", tags=["Reviews"])
+    return Response(content=body, media_type="application/json", headers=headers)
 
-@router.get("/{product_id}", response_model=List[ReviewResponse])
+@router.get("/{product_id}", response_model=List[ReviewResponse], dependencies=[Depends(get_read_db)])
 async def get_product_reviews(
     product_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    sort: str = Query("newest", pattern="^(newest|rating)$", description="Order by newest or highest rating"),
+    cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=100),
     review_service: ReviewService = Depends(get_review_service)
 ):
-    reviews = review_service.get_product_reviews(product_id, skip, limit)
+    try:
+        reviews, next_cursor = review_service.get_product_reviews_page(product_id, sort, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return [
         ReviewResponse(
@@ -36,7 +106,7 @@ async def get_product_reviews(
 @router.post("", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
 async def create_review(
     review_data: ReviewCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     review_service: ReviewService = Depends(get_review_service)
 ):
     review = review_service.create({
@@ -69,7 +139,7 @@ async def create_review(
 async def update_review(
     review_id: int,
     update_data: ReviewUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     review_service: ReviewService = Depends(get_review_service)
 ):
     review = review_service.get_by_id(review_id)
@@ -118,7 +188,7 @@ async def update_review(
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_review(
     review_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     review_service: ReviewService = Depends(get_review_service)
 ):
     review = review_service.get_by_id(review_id)
@@ -4,10 +4,11 @@ import os
 import uuid
 from pathlib import Path
 
-from app.models.user import Admin
+from app.core.principal_cache import Principal
 from app.api.dependencies import get_current_admin
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/uploads", tags=["Uploads"])
+router = APIRouter(prefix="/uploads", tags=["Uploads"], route_class=UnitOfWorkRoute)
 
 UPLOAD_DIR = Path("uploads/products")
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
@@ -51,7 +52,7 @@ def save_file(file: UploadFile) -> str:
 @router.post("/product-image", status_code=status.HTTP_201_CREATED)
 async def upload_product_image(
     file: UploadFile = File(...),
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     validate_file(file)
 
@@ -71,7 +72,7 @@ async def upload_product_image(
 @router.post("/product-images", status_code=status.HTTP_201_CREATED)
 async def upload_multiple_product_images(
     files: List[UploadFile] = File(...),
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     if len(files) > 5:
         raise HTTPException(
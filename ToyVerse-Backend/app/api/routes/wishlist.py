@@ -3,16 +3,17 @@ from typing import List
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_db, get_current_user
-from app.models.user import User
+from app.api.dependencies import get_db, get_current_principal
+from app.core.principal_cache import Principal
 from app.services.wishlist_service import WishlistService
 from app.schemas.wishlist import WishlistResponse, WishlistCreate, WishlistProductIds
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/wishlist", tags=["Wishlist"])
+router = APIRouter(prefix="/wishlist", tags=["Wishlist"], route_class=UnitOfWorkRoute)
 
 @router.get("", response_model=List[WishlistResponse])
 async def get_wishlist(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
 
@@ -22,7 +23,7 @@ async def get_wishlist(
 
 @router.get("/product-ids", response_model=WishlistProductIds)
 async def get_wishlist_product_ids(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
 
@@ -33,7 +34,7 @@ async def get_wishlist_product_ids(
 @router.post("/add", response_model=WishlistResponse, status_code=status.HTTP_201_CREATED)
 async def add_to_wishlist(
     data: WishlistCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
 
@@ -44,7 +45,7 @@ async def add_to_wishlist(
 @router.delete("/remove/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_from_wishlist(
     product_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
 
@@ -55,7 +56,7 @@ async def remove_from_wishlist(
 @router.get("/check/{product_id}", response_model=dict)
 async def check_in_wishlist(
     product_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
 
@@ -65,7 +66,7 @@ async def check_in_wishlist(
 
 @router.delete("/clear", status_code=status.HTTP_200_OK)
 async def clear_wishlist(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
 
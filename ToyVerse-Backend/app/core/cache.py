@@ -0,0 +1,456 @@
+
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.state import InstanceState
+import hashlib
+import importlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import logging
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+class CachedEntity(NamedTuple):
+
+    model: str
+    columns: Dict[str, Any]
+    relationships: Dict[str, Any]
+
+def _encode(value: Any, seen: Optional[set] = None) -> Any:
+
+    if isinstance(value, list):
+        return [_encode(item, seen) for item in value]
+
+    if isinstance(value, tuple):
+        return tuple(_encode(item, seen) for item in value)
+
+    if isinstance(value, dict):
+        return {key: _encode(item, seen) for key, item in value.items()}
+
+    state = inspect(value, raiseerr=False)
+    if not isinstance(state, InstanceState):
+        return value
+
+    seen = (seen or set()) | {id(value)}
+    mapper = state.mapper
+    loaded = state.dict
+
+    return CachedEntity(
+        model=f"{mapper.class_.__module__}:{mapper.class_.__qualname__}",
+        columns={attr.key: loaded[attr.key] for attr in mapper.column_attrs if attr.key in loaded},
+        relationships={
+            rel.key: _encode(loaded[rel.key], seen)
+            for rel in mapper.relationships
+            if rel.key in loaded and not _refers_to(loaded[rel.key], seen)
+        },
+    )
+
+def _refers_to(value: Any, seen: set) -> bool:
+
+    items = value if isinstance(value, (list, set, tuple)) else [value]
+    return any(id(item) in seen for item in items)
+
+def _decode(value: Any) -> Any:
+
+    if isinstance(value, CachedEntity):
+        module, _, name = value.model.partition(":")
+        model = getattr(importlib.import_module(module), name)
+        entity = inspect(model).class_manager.new_instance()
+        for key, item in value.columns.items():
+            set_committed_value(entity, key, item)
+        for key, item in value.relationships.items():
+            set_committed_value(entity, key, _decode(item))
+        make_transient_to_detached(entity)
+        return entity
+
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+
+    if isinstance(value, tuple):
+        return tuple(_decode(item) for item in value)
+
+    if isinstance(value, dict):
+        return {key: _decode(item) for key, item in value.items()}
+
+    return value
+
+class CacheBackend(ABC):
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+
+        pass
+
+    @abstractmethod
+    def counter(self, key: str) -> int:
+
+        pass
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+
+        return {}
+
+class MemoryCacheBackend(CacheBackend):
+
+    def __init__(self, max_entries: int = 10000):
+
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def counter(self, key: str) -> int:
+
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "evictions": self._evictions,
+            }
+
+class SQLiteCacheBackend(CacheBackend):
+
+    def __init__(self, path: str, cleanup_every: int = 1000):
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._path = path
+        self._cleanup_every = cleanup_every
+        self._local = threading.local()
+        self._writes = 0
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_counters ("
+            "key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+
+        row = self._connection().execute(
+            "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, now + ttl_seconds)
+        )
+
+        self._writes += 1
+        if self._writes % self._cleanup_every == 0:
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+
+    def delete(self, key: str) -> None:
+
+        self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def counter(self, key: str) -> int:
+
+        row = self._connection().execute(
+            "SELECT value FROM cache_counters WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def incr(self, key: str) -> int:
+
+        return self._connection().execute(
+            "INSERT INTO cache_counters (key, value) VALUES (?, 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1 RETURNING value",
+            (key,)
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+
+        conn = self._connection()
+        conn.execute("DELETE FROM cache_entries")
+        conn.execute("DELETE FROM cache_counters")
+
+    def stats(self) -> Dict[str, Any]:
+
+        count = self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        return {
+            "backend": "sqlite",
+            "path": self._path,
+            "entries": count,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+
+        conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+class RedisCacheBackend(CacheBackend):
+
+    def __init__(self, url: str, prefix: str = "toyverse:"):
+
+        if redis is None:
+            raise RuntimeError("The redis package is required for REPOSITORY_CACHE_BACKEND=redis")
+
+        self._url = url
+        self._prefix = prefix
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key: str) -> Optional[bytes]:
+
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+
+        self._client.set(self._prefix + key, value, px=max(1, int(ttl_seconds * 1000)))
+
+    def delete(self, key: str) -> None:
+
+        self._client.delete(self._prefix + key)
+
+    def counter(self, key: str) -> int:
+
+        value = self._client.get(self._prefix + key)
+        return int(value) if value is not None else 0
+
+    def incr(self, key: str) -> int:
+
+        return self._client.incr(self._prefix + key)
+
+    def clear(self) -> None:
+
+        keys = list(self._client.scan_iter(match=f"{self._prefix}*", count=500))
+        if keys:
+            self._client.delete(*keys)
+
+    def stats(self) -> Dict[str, Any]:
+
+        return {
+            "backend": "redis",
+            "url": self._url.split("@")[-1],
+            "prefix": self._prefix,
+        }
+
+def create_cache_backend() -> CacheBackend:
+
+    backend = settings.repository_cache_backend
+
+    if backend == "redis":
+        return RedisCacheBackend(settings.repository_cache_redis_url)
+
+    if backend == "sqlite":
+        return SQLiteCacheBackend(settings.repository_cache_sqlite_path)
+
+    return MemoryCacheBackend(max_entries=settings.repository_cache_max_entries)
+
+class RepositoryCache:
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+
+        self._backend = backend
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+
+    @property
+    def enabled(self) -> bool:
+
+        return self._enabled
+
+    @property
+    def backend(self) -> CacheBackend:
+
+        return self._backend
+
+    def configure(self, backend: Optional[CacheBackend] = None, enabled: Optional[bool] = None) -> None:
+
+        if backend is not None:
+            self._backend = backend
+        if enabled is not None:
+            self._enabled = enabled
+
+    def key(self, namespace: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> Optional[str]:
+
+        try:
+            version = self._backend.counter(f"{namespace}:version")
+        except Exception as e:
+            self._error(namespace, e)
+            return None
+
+        digest = hashlib.sha1(repr((args, sorted(kwargs.items()))).encode()).hexdigest()
+        return f"{namespace}:{version}:{method}:{digest}"
+
+    def get(self, namespace: str, key: Optional[str]) -> Tuple[bool, Any]:
+
+        if key is None:
+            return False, None
+
+        try:
+            payload = self._backend.get(key)
+            value = _decode(pickle.loads(payload)) if payload is not None else None
+        except Exception as e:
+            self._error(namespace, e)
+            return False, None
+
+        self._count(namespace, "hits" if payload is not None else "misses")
+        return payload is not None, value
+
+    def set(self, namespace: str, key: Optional[str], value: Any, ttl_seconds: float) -> None:
+
+        if key is None:
+            return
+
+        try:
+            self._backend.set(key, pickle.dumps(_encode(value), protocol=pickle.HIGHEST_PROTOCOL), ttl_seconds)
+        except Exception as e:
+            self._error(namespace, e)
+
+    def invalidate(self, namespace: str) -> None:
+
+        try:
+            self._backend.incr(f"{namespace}:version")
+        except Exception as e:
+            self._error(namespace, e)
+            return
+
+        self._count(namespace, "invalidations")
+
+    def record_bypass(self, namespace: str) -> None:
+
+        self._count(namespace, "bypassed")
+
+    def clear(self) -> None:
+
+        self._backend.clear()
+        with self._lock:
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            namespaces = {name: dict(counter) for name, counter in self._counters.items()}
+
+        for counter in namespaces.values():
+            lookups = counter.get("hits", 0) + counter.get("misses", 0)
+            counter["hit_ratio"] = round(counter.get("hits", 0) / lookups, 4) if lookups else 0.0
+
+        stats = {"enabled": self._enabled, "namespaces": namespaces}
+        try:
+            stats.update(self._backend.stats())
+        except Exception as e:
+            logger.error(f"Repository cache stats failed: {e}")
+        return stats
+
+    def _count(self, namespace: str, name: str) -> None:
+
+        with self._lock:
+            self._counters.setdefault(namespace, Counter())[name] += 1
+
+    def _error(self, namespace: str, error: Exception) -> None:
+
+        logger.error(f"Repository cache error in {namespace}: {error}")
+        self._count(namespace, "errors")
+
+repository_cache = RepositoryCache(create_cache_backend(), enabled=settings.repository_cache_enabled)
+
+metrics_registry.register("repository_cache", repository_cache.stats)
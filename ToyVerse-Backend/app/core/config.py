@@ -1,5 +1,5 @@
 
-from typing import List
+from typing import Any, Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 import os
@@ -9,10 +9,64 @@ class Settings(BaseSettings):
     db_server: str = Field(default="ZOHAD\\SQLEXPRESS", alias="DB_SERVER")
     db_name: str = Field(default="ToyVerseDB", alias="DB_NAME")
     db_driver: str = Field(default="ODBC Driver 17 for SQL Server", alias="DB_DRIVER")
+    database_url_override: str = Field(default="", alias="DATABASE_URL")
+    db_echo: bool = Field(default=False, alias="DB_ECHO")
+    db_pool_size: Optional[int] = Field(default=None, ge=1, alias="DB_POOL_SIZE")
+    db_max_overflow: Optional[int] = Field(default=None, ge=0, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: Optional[float] = Field(default=None, gt=0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: Optional[int] = Field(default=None, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_query_cache_size: int = Field(default=1000, ge=0, alias="DB_QUERY_CACHE_SIZE")
+
+    async_db_enabled: bool = Field(default=False, alias="ASYNC_DB_ENABLED")
+    async_database_url_override: str = Field(default="", alias="ASYNC_DATABASE_URL")
+
+    query_timing_enabled: bool = Field(default=True, alias="QUERY_TIMING_ENABLED")
+    query_debug: bool = Field(default=False, alias="QUERY_DEBUG")
+    query_repeat_threshold: int = Field(default=5, ge=2, alias="QUERY_REPEAT_THRESHOLD")
+
+    read_replica_urls: List[str] = Field(default=[], alias="READ_REPLICA_URLS")
+    read_replica_max_lag_seconds: float = Field(default=5.0, ge=0, alias="READ_REPLICA_MAX_LAG_SECONDS")
+    read_replica_lag_query: str = Field(default="", alias="READ_REPLICA_LAG_QUERY")
+    read_replica_check_seconds: float = Field(default=10.0, gt=0, alias="READ_REPLICA_CHECK_SECONDS")
 
     secret_key: str = Field(default="your-secret-key-change-in-production", alias="SECRET_KEY")
     algorithm: str = Field(default="HS256", alias="ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
+    jwt_cache_max_entries: int = Field(default=10000, ge=0, alias="JWT_CACHE_MAX_ENTRIES")
+    refresh_token_expire_days: int = Field(default=14, alias="REFRESH_TOKEN_EXPIRE_DAYS")
+
+    token_revocation_bloom_capacity: int = Field(default=100000, ge=1, alias="TOKEN_REVOCATION_BLOOM_CAPACITY")
+    token_revocation_bloom_error_rate: float = Field(default=0.001, gt=0, lt=1, alias="TOKEN_REVOCATION_BLOOM_ERROR_RATE")
+    token_revocation_sync_seconds: float = Field(default=30.0, gt=0, alias="TOKEN_REVOCATION_SYNC_SECONDS")
+    token_revocation_sync_overlap_seconds: float = Field(default=120.0, ge=0, alias="TOKEN_REVOCATION_SYNC_OVERLAP_SECONDS")
+
+    principal_cache_ttl_seconds: float = Field(default=300.0, alias="PRINCIPAL_CACHE_TTL_SECONDS")
+    principal_cache_max_entries: int = Field(default=10000, alias="PRINCIPAL_CACHE_MAX_ENTRIES")
+
+    password_hash_scheme: str = Field(default="bcrypt", pattern="^(bcrypt|argon2id)$", alias="PASSWORD_HASH_SCHEME")
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31, alias="BCRYPT_ROUNDS")
+    argon2_time_cost: int = Field(default=3, ge=1, alias="ARGON2_TIME_COST")
+    argon2_memory_cost: int = Field(default=65536, ge=8, alias="ARGON2_MEMORY_COST")
+    argon2_parallelism: int = Field(default=4, ge=1, alias="ARGON2_PARALLELISM")
+    password_hash_workers: int = Field(default=4, ge=1, alias="PASSWORD_HASH_WORKERS")
+    password_hash_offload: bool = Field(default=True, alias="PASSWORD_HASH_OFFLOAD")
+
+    login_rate_limit_enabled: bool = Field(default=True, alias="LOGIN_RATE_LIMIT_ENABLED")
+    login_ip_burst: int = Field(default=20, ge=1, alias="LOGIN_IP_BURST")
+    login_ip_per_minute: float = Field(default=10.0, gt=0, alias="LOGIN_IP_PER_MINUTE")
+    login_account_burst: int = Field(default=5, ge=1, alias="LOGIN_ACCOUNT_BURST")
+    login_account_per_minute: float = Field(default=2.0, gt=0, alias="LOGIN_ACCOUNT_PER_MINUTE")
+    rate_limit_backend: str = Field(default="memory", pattern="^(memory|sqlite)$", alias="RATE_LIMIT_BACKEND")
+    rate_limit_sqlite_path: str = Field(default="data/rate_limits.db", alias="RATE_LIMIT_SQLITE_PATH")
+    rate_limit_max_entries: int = Field(default=100000, ge=1, alias="RATE_LIMIT_MAX_ENTRIES")
+    trust_forwarded_for: bool = Field(default=False, alias="TRUST_FORWARDED_FOR")
+
+    repository_cache_enabled: bool = Field(default=True, alias="REPOSITORY_CACHE_ENABLED")
+    repository_cache_backend_override: str = Field(default="", pattern="^(|memory|sqlite|redis)$", alias="REPOSITORY_CACHE_BACKEND")
+    repository_cache_max_entries: int = Field(default=10000, ge=1, alias="REPOSITORY_CACHE_MAX_ENTRIES")
+    repository_cache_sqlite_path: str = Field(default="data/repository_cache.db", alias="REPOSITORY_CACHE_SQLITE_PATH")
+    repository_cache_redis_url: str = Field(default="redis://localhost:6379/0", alias="REPOSITORY_CACHE_REDIS_URL")
 
     groq_api_key: str = Field(default="", alias="GROQ_API_KEY")
 
@@ -24,6 +78,35 @@ class Settings(BaseSettings):
     app_name: str = Field(default="ToyVerse API", alias="APP_NAME")
     debug: bool = Field(default=True, alias="DEBUG")
     api_v1_prefix: str = Field(default="/api", alias="API_V1_PREFIX")
+    web_concurrency: int = Field(default=1, ge=1, alias="WEB_CONCURRENCY")
+
+    order_events_heartbeat_seconds: float = Field(default=15.0, alias="ORDER_EVENTS_HEARTBEAT_SECONDS")
+    order_events_max_pending: int = Field(default=16, alias="ORDER_EVENTS_MAX_PENDING")
+
+    interaction_buffer_enabled: bool = Field(default=True, alias="INTERACTION_BUFFER_ENABLED")
+    interaction_buffer_capacity: int = Field(default=10000, ge=1, alias="INTERACTION_BUFFER_CAPACITY")
+    interaction_flush_batch_size: int = Field(default=500, ge=1, alias="INTERACTION_FLUSH_BATCH_SIZE")
+    interaction_flush_interval_ms: int = Field(default=500, ge=10, alias="INTERACTION_FLUSH_INTERVAL_MS")
+
+    cooccurrence_model_path: str = Field(default="data/cooccurrence.npz", alias="COOCCURRENCE_MODEL_PATH")
+    cooccurrence_catch_up_seconds: float = Field(default=60.0, gt=0, alias="COOCCURRENCE_CATCH_UP_SECONDS")
+    cooccurrence_compact_seconds: float = Field(default=300.0, gt=0, alias="COOCCURRENCE_COMPACT_SECONDS")
+    cooccurrence_max_actors: int = Field(default=200000, ge=1, alias="COOCCURRENCE_MAX_ACTORS")
+    cooccurrence_actor_ttl_seconds: float = Field(default=604800.0, gt=0, alias="COOCCURRENCE_ACTOR_TTL_SECONDS")
+
+    product_catalog_refresh_seconds: float = Field(default=60.0, gt=0, alias="PRODUCT_CATALOG_REFRESH_SECONDS")
+
+    content_similarity_refresh_seconds: float = Field(default=300.0, gt=0, alias="CONTENT_SIMILARITY_REFRESH_SECONDS")
+
+    popularity_half_life_hours: float = Field(default=72.0, gt=0, alias="POPULARITY_HALF_LIFE_HOURS")
+    popularity_top_k: int = Field(default=100, ge=1, alias="POPULARITY_TOP_K")
+    popularity_snapshot_seconds: float = Field(default=30.0, gt=0, alias="POPULARITY_SNAPSHOT_SECONDS")
+    popularity_seed_hours: float = Field(default=720.0, gt=0, alias="POPULARITY_SEED_HOURS")
+
+    session_profile_enabled: bool = Field(default=True, alias="SESSION_PROFILE_ENABLED")
+    session_profile_ttl_seconds: float = Field(default=1800.0, gt=0, alias="SESSION_PROFILE_TTL_SECONDS")
+    session_profile_max_sessions: int = Field(default=50000, ge=1, alias="SESSION_PROFILE_MAX_SESSIONS")
+    session_profile_recent_limit: int = Field(default=50, ge=1, alias="SESSION_PROFILE_RECENT_LIMIT")
 
     cors_origins: List[str] = Field(
         default=[
@@ -45,6 +128,9 @@ class Settings(BaseSettings):
     @property
     def database_url(self) -> str:
 
+        if self.database_url_override:
+            return self.database_url_override
+
         from urllib.parse import quote_plus
 
         connection_string = (
@@ -58,6 +144,54 @@ class Settings(BaseSettings):
         connection_url = f"mssql+pyodbc:///?odbc_connect={quote_plus(connection_string)}"
         return connection_url
 
+    @property
+    def engine_overrides(self) -> Dict[str, Any]:
+
+        return {
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
+            "query_cache_size": self.db_query_cache_size,
+        }
+
+    @property
+    def database_backend(self) -> str:
+
+        from sqlalchemy.engine import make_url
+
+        return make_url(self.database_url).get_backend_name()
+
+    @property
+    def async_database_url(self) -> str:
+
+        if self.async_database_url_override:
+            return self.async_database_url_override
+
+        url = self.database_url
+        drivers = (
+            ("mssql+pyodbc://", "mssql+aioodbc://"),
+            ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+            ("postgresql://", "postgresql+asyncpg://"),
+            ("sqlite+pysqlite://", "sqlite+aiosqlite://"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        )
+
+        for sync_prefix, async_prefix in drivers:
+            if url.startswith(sync_prefix):
+                return async_prefix + url[len(sync_prefix):]
+
+        return url
+
+    @property
+    def repository_cache_backend(self) -> str:
+
+        if self.repository_cache_backend_override:
+            return self.repository_cache_backend_override
+
+        return "sqlite" if self.web_concurrency > 1 else "memory"
+
     @property
     def is_development(self) -> bool:
 
@@ -0,0 +1,275 @@
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import re
+import threading
+import time
+import logging
+
+import numpy as np
+from scipy import sparse
+
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "in", "is", "it",
+    "its", "of", "on", "or", "that", "the", "this", "to", "with", "your", "you", "our", "all",
+})
+
+FIELD_WEIGHTS = {
+    "title": 2.0,
+    "description": 1.0,
+    "category": 3.0,
+}
+
+def product_terms(title: Optional[str], description: Optional[str], category: Optional[str]) -> Counter:
+
+    terms: Counter = Counter()
+    for name, text in (("title", title), ("description", description), ("category", category)):
+        for token in TOKEN_PATTERN.findall((text or "").lower()):
+            if len(token) > 1 and token not in STOP_WORDS:
+                terms[token] += FIELD_WEIGHTS[name]
+    return terms
+
+class ContentSimilarityIndex:
+
+    def __init__(self):
+
+        self._lock = threading.RLock()
+        self._term_index: Dict[str, int] = {}
+        self._document_frequency = np.zeros(0, dtype=np.int64)
+        self._documents: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._product_ids = np.zeros(0, dtype=np.int64)
+        self._row_index: Dict[int, int] = {}
+        self._matrix = sparse.csr_matrix((0, 0), dtype=np.float64)
+        self._idf = np.zeros(0, dtype=np.float64)
+        self._overlay: Dict[int, Optional[Tuple[np.ndarray, np.ndarray]]] = {}
+        self._changes: Dict[int, Optional[Counter]] = {}
+        self._building = False
+        self._ready = False
+        self._built_at: Optional[float] = None
+        self._updates = 0
+        self._refreshes = 0
+        self._queries = 0
+
+    @property
+    def ready(self) -> bool:
+
+        return self._ready
+
+    def begin_build(self) -> None:
+
+        with self._lock:
+            self._changes.clear()
+            self._building = True
+
+    def build(self, products: Iterable[Tuple[int, Optional[str], Optional[str], Optional[str]]]) -> int:
+
+        with self._lock:
+            self._term_index.clear()
+            self._document_frequency = np.zeros(0, dtype=np.int64)
+            self._documents.clear()
+
+            for product_id, title, description, category in products:
+                if product_id not in self._changes:
+                    self._put(product_id, product_terms(title, description, category))
+
+            for product_id, terms in self._changes.items():
+                if terms is not None:
+                    self._put(product_id, terms)
+
+            self._changes.clear()
+            self._building = False
+            self._refresh()
+            self._ready = True
+            self._built_at = time.time()
+            return len(self._documents)
+
+    def upsert(self, product_id: int, title: Optional[str], description: Optional[str], category: Optional[str]) -> None:
+
+        terms = product_terms(title, description, category)
+
+        with self._lock:
+            self._discard(product_id)
+            self._put(product_id, terms)
+            if self._building:
+                self._changes[product_id] = terms
+            self._overlay[product_id] = self._vector(product_id)
+            self._updates += 1
+
+    def remove(self, product_id: int) -> None:
+
+        with self._lock:
+            if self._building:
+                self._changes[product_id] = None
+            if self._discard(product_id):
+                self._overlay[product_id] = None
+                self._updates += 1
+
+    def refresh(self) -> bool:
+
+        with self._lock:
+            if not self._overlay:
+                return False
+            self._refresh()
+            return True
+
+    def similar(self, product_id: int, limit: int = 10) -> List[Tuple[int, float]]:
+
+        with self._lock:
+            self._queries += 1
+            query = self._query_vector(product_id)
+            if query is None:
+                return []
+
+            indices, data = query
+            columns = self._matrix.shape[1]
+            known = indices < columns
+            probe = sparse.csr_matrix(
+                (data[known], (indices[known], np.zeros(int(known.sum()), dtype=np.int64))),
+                shape=(columns, 1)
+            )
+            scores = (self._matrix @ probe).tocoo()
+            ids, values = self._product_ids[scores.row], scores.data
+
+            if self._overlay:
+                changed = np.fromiter(self._overlay, dtype=np.int64, count=len(self._overlay))
+                current = ~np.isin(ids, changed)
+                overlay = [
+                    (other_id, self._dot(query, vector))
+                    for other_id, vector in self._overlay.items()
+                    if vector is not None
+                ]
+                ids = np.concatenate([ids[current], np.asarray([item[0] for item in overlay], dtype=np.int64)])
+                values = np.concatenate([values[current], np.asarray([item[1] for item in overlay], dtype=np.float64)])
+
+        keep = (ids != product_id) & (values > 0)
+        ids, values = ids[keep], values[keep]
+
+        if len(ids) > limit:
+            top = np.argpartition(-values, limit - 1)[:limit]
+            ids, values = ids[top], values[top]
+
+        order = np.lexsort((ids, -values))
+        return [(int(ids[i]), float(values[i])) for i in order]
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._term_index.clear()
+            self._document_frequency = np.zeros(0, dtype=np.int64)
+            self._documents.clear()
+            self._changes.clear()
+            self._building = False
+            self._refresh()
+            self._ready = False
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "products": len(self._documents),
+                "terms": len(self._term_index),
+                "nnz": int(self._matrix.nnz),
+                "pending": len(self._overlay),
+                "updates": self._updates,
+                "refreshes": self._refreshes,
+                "queries": self._queries,
+                "built_at": self._built_at,
+            }
+
+    def _put(self, product_id: int, terms: Counter) -> None:
+
+        for term in terms:
+            if term not in self._term_index:
+                self._term_index[term] = len(self._term_index)
+
+        if len(self._term_index) > len(self._document_frequency):
+            grown = np.zeros(max(len(self._term_index), 2 * len(self._document_frequency)), dtype=np.int64)
+            grown[:len(self._document_frequency)] = self._document_frequency
+            self._document_frequency = grown
+
+        indices = np.fromiter((self._term_index[term] for term in terms), dtype=np.int32, count=len(terms))
+        counts = np.fromiter(terms.values(), dtype=np.float64, count=len(terms))
+
+        self._documents[product_id] = (indices, counts)
+        self._document_frequency[indices] += 1
+
+    def _discard(self, product_id: int) -> bool:
+
+        document = self._documents.pop(product_id, None)
+        if document is None:
+            return False
+
+        self._document_frequency[document[0]] -= 1
+        return True
+
+    def _vector(self, product_id: int) -> Tuple[np.ndarray, np.ndarray]:
+
+        indices, counts = self._documents[product_id]
+        idf = np.log((1 + len(self._documents)) / (1 + self._document_frequency[indices])) + 1
+
+        weighted = indices < len(self._idf)
+        idf[weighted] = self._idf[indices[weighted]]
+
+        data = (1 + np.log(counts)) * idf
+        norm = np.sqrt(data @ data)
+        return indices, data / norm if norm else data
+
+    def _query_vector(self, product_id: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+
+        if product_id in self._overlay:
+            return self._overlay[product_id]
+
+        index = self._row_index.get(product_id)
+        if index is None:
+            return None
+
+        start, end = self._matrix.indptr[index], self._matrix.indptr[index + 1]
+        return self._matrix.indices[start:end], self._matrix.data[start:end]
+
+    def _dot(self, left: Tuple[np.ndarray, np.ndarray], right: Tuple[np.ndarray, np.ndarray]) -> float:
+
+        _, left_at, right_at = np.intersect1d(left[0], right[0], assume_unique=True, return_indices=True)
+        return float(left[1][left_at] @ right[1][right_at])
+
+    def _refresh(self) -> None:
+
+        product_ids = list(self._documents)
+        documents = [self._documents[product_id] for product_id in product_ids]
+        lengths = np.fromiter((len(indices) for indices, _ in documents), dtype=np.int64, count=len(documents))
+
+        indptr = np.zeros(len(documents) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+
+        if documents:
+            indices = np.concatenate([indices for indices, _ in documents])
+            counts = np.concatenate([counts for _, counts in documents])
+        else:
+            indices = np.zeros(0, dtype=np.int32)
+            counts = np.zeros(0, dtype=np.float64)
+
+        terms = len(self._term_index)
+        frequency = self._document_frequency[:terms]
+        idf = np.log((1 + len(documents)) / (1 + frequency)) + 1
+
+        data = (1 + np.log(counts)) * idf[indices]
+        rows = np.repeat(np.arange(len(documents)), lengths)
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=len(documents)))
+        data = data / norms[rows]
+
+        self._matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(documents), terms))
+        self._idf = idf
+        self._product_ids = np.asarray(product_ids, dtype=np.int64)
+        self._row_index = {product_id: i for i, product_id in enumerate(product_ids)}
+        self._overlay.clear()
+        self._refreshes += 1
+
+content_similarity = ContentSimilarityIndex()
+
+metrics_registry.register("content_similarity", content_similarity.stats)
@@ -0,0 +1,361 @@
+
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import hashlib
+import os
+import threading
+import time
+import logging
+
+import numpy as np
+from scipy import sparse
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+def actor_key(user_id: Optional[int], session_id: Optional[str]) -> Optional[str]:
+
+    if user_id is not None:
+        return f"u:{user_id}"
+    if session_id:
+        return f"s:{hashlib.blake2b(session_id.encode('utf-8'), digest_size=8).hexdigest()}"
+    return None
+
+def actor_rows(counts: Iterable[Tuple[Optional[int], Optional[str], int, int]]) -> Iterable[Tuple[str, int, int]]:
+
+    for user_id, session_id, product_id, count in counts:
+        actor = actor_key(user_id, session_id)
+        if actor is not None:
+            yield actor, product_id, count
+
+class CooccurrenceModel:
+
+    def __init__(self, max_actors: int = 200000, actor_ttl_seconds: float = 604800.0):
+
+        self._max_actors = max_actors
+        self._actor_ttl = actor_ttl_seconds
+        self._lock = threading.RLock()
+        self._product_ids: List[int] = []
+        self._product_index: Dict[int, int] = {}
+        self._product_array = np.zeros(0, dtype=np.int64)
+        self._actor_keys: List[str] = []
+        self._actor_index: Dict[str, int] = {}
+        self._actor_seen: "OrderedDict[str, float]" = OrderedDict()
+        self._actions = sparse.csr_matrix((0, 0), dtype=np.int32)
+        self._cooccurrence = sparse.csr_matrix((0, 0), dtype=np.int32)
+        self._actor_increments: Dict[str, Counter] = defaultdict(Counter)
+        self._deltas: Dict[int, Counter] = defaultdict(Counter)
+        self._watermark = 0
+        self._ready = False
+        self._built_at: Optional[float] = None
+        self._compacted_at: Optional[float] = None
+        self._events = 0
+        self._queries = 0
+        self._evictions = 0
+
+    @property
+    def ready(self) -> bool:
+
+        return self._ready
+
+    @property
+    def watermark(self) -> int:
+
+        return self._watermark
+
+    def build(self, rows: Iterable[Tuple[str, int, int]], watermark: int = 0) -> None:
+
+        actor_index: Dict[str, int] = {}
+        product_index: Dict[int, int] = {}
+        actor_rows, product_cols, counts = [], [], []
+
+        for actor, product_id, count in rows:
+            actor_rows.append(actor_index.setdefault(actor, len(actor_index)))
+            product_cols.append(product_index.setdefault(product_id, len(product_index)))
+            counts.append(count)
+
+        actions = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.int32), (actor_rows, product_cols)),
+            shape=(len(actor_index), len(product_index))
+        )
+
+        with self._lock:
+            self._actor_keys = list(actor_index)
+            self._actor_index = actor_index
+            self._product_ids = list(product_index)
+            self._product_index = product_index
+            self._product_array = np.asarray(self._product_ids, dtype=np.int64)
+            self._actions = actions
+            self._cooccurrence = self._multiply(actions)
+            self._actor_increments.clear()
+            self._deltas.clear()
+            self._reset_actor_seen()
+            self._evict()
+            self._watermark = watermark
+            self._ready = True
+            self._built_at = time.time()
+
+    def catch_up(self, rows: Iterable[Tuple[str, int, int]], watermark: int) -> None:
+
+        with self._lock:
+            for actor, product_id, count in rows:
+                self.add(actor, product_id, count)
+            self._watermark = watermark
+
+    def add(self, actor: Optional[str], product_id: int, count: int = 1) -> None:
+
+        if actor is None:
+            return
+
+        with self._lock:
+            profile = self._actor_profile(actor)
+
+            if product_id not in profile:
+                for other_id, other_count in profile.items():
+                    self._deltas[product_id][other_id] += other_count
+
+            for other_id in profile:
+                if other_id != product_id:
+                    self._deltas[other_id][product_id] += count
+
+            self._actor_increments[actor][product_id] += count
+            self._actor_seen[actor] = time.time()
+            self._actor_seen.move_to_end(actor)
+            self._product_index.setdefault(product_id, len(self._product_ids))
+            if len(self._product_ids) < len(self._product_index):
+                self._product_ids.append(product_id)
+            self._events += 1
+
+    def related(self, product_id: int, limit: int = 10) -> List[int]:
+
+        with self._lock:
+            self._queries += 1
+            ids, values = self._row(product_id)
+
+        if not len(ids):
+            return []
+
+        if len(ids) > limit:
+            top = np.argpartition(-values, limit - 1)[:limit]
+            ids, values = ids[top], values[top]
+
+        order = np.lexsort((ids, -values))
+        return ids[order].tolist()
+
+    def compact(self) -> int:
+
+        with self._lock:
+            pending = sum(len(row) for row in self._deltas.values())
+            if pending or self._actor_increments:
+                self._merge_pending()
+                self._compacted_at = time.time()
+
+            self._evict()
+            return pending
+
+    def save(self, path: str) -> None:
+
+        with self._lock:
+            self.compact()
+            arrays = {
+                "product_ids": np.asarray(self._product_ids, dtype=np.int64),
+                "actor_keys": np.asarray(self._actor_keys, dtype=np.str_),
+                "watermark": np.asarray(self._watermark, dtype=np.int64),
+                "actions_data": self._actions.data,
+                "actions_indices": self._actions.indices,
+                "actions_indptr": self._actions.indptr,
+                "actions_shape": np.asarray(self._actions.shape),
+                "cooccurrence_data": self._cooccurrence.data,
+                "cooccurrence_indices": self._cooccurrence.indices,
+                "cooccurrence_indptr": self._cooccurrence.indptr,
+                "cooccurrence_shape": np.asarray(self._cooccurrence.shape),
+            }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+        np.savez_compressed(temporary, **arrays)
+        os.replace(temporary, path)
+
+    def load(self, path: str) -> bool:
+
+        if not os.path.exists(path):
+            return False
+
+        with np.load(path) as archive:
+            product_ids = archive["product_ids"].tolist()
+            actor_keys = archive["actor_keys"].tolist()
+            watermark = int(archive["watermark"]) if "watermark" in archive else 0
+            actions = sparse.csr_matrix(
+                (archive["actions_data"], archive["actions_indices"], archive["actions_indptr"]),
+                shape=tuple(archive["actions_shape"])
+            )
+            cooccurrence = sparse.csr_matrix(
+                (archive["cooccurrence_data"], archive["cooccurrence_indices"], archive["cooccurrence_indptr"]),
+                shape=tuple(archive["cooccurrence_shape"])
+            )
+
+        with self._lock:
+            self._product_ids = product_ids
+            self._product_index = {product_id: i for i, product_id in enumerate(product_ids)}
+            self._product_array = np.asarray(product_ids, dtype=np.int64)
+            self._actor_keys = actor_keys
+            self._actor_index = {actor: i for i, actor in enumerate(actor_keys)}
+            self._actions = actions
+            self._cooccurrence = cooccurrence
+            self._actor_increments.clear()
+            self._deltas.clear()
+            self._reset_actor_seen()
+            self._evict()
+            self._watermark = watermark
+            self._ready = True
+            self._built_at = os.path.getmtime(path)
+
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "products": len(self._product_ids),
+                "actors": len(self._actor_index) + sum(
+                    1 for actor in self._actor_increments if actor not in self._actor_index
+                ),
+                "pairs": int(self._cooccurrence.nnz),
+                "pending_pairs": sum(len(row) for row in self._deltas.values()),
+                "max_actors": self._max_actors,
+                "evictions": self._evictions,
+                "watermark": self._watermark,
+                "events": self._events,
+                "queries": self._queries,
+                "built_at": self._built_at,
+                "compacted_at": self._compacted_at,
+            }
+
+    def _merge_pending(self) -> None:
+
+        for actor in self._actor_increments:
+            if actor not in self._actor_index:
+                self._actor_index[actor] = len(self._actor_keys)
+                self._actor_keys.append(actor)
+
+        shape = (len(self._actor_keys), len(self._product_ids))
+        self._actions = self._merge(
+            self._actions,
+            (
+                (self._actor_index[actor], self._product_index[product_id], count)
+                for actor, counts in self._actor_increments.items()
+                for product_id, count in counts.items()
+            ),
+            shape
+        )
+
+        size = len(self._product_ids)
+        self._cooccurrence = self._merge(
+            self._cooccurrence,
+            (
+                (self._product_index[product_id], self._product_index[other_id], count)
+                for product_id, counts in self._deltas.items()
+                for other_id, count in counts.items()
+            ),
+            (size, size)
+        )
+
+        self._product_array = np.asarray(self._product_ids, dtype=np.int64)
+        self._actor_increments.clear()
+        self._deltas.clear()
+
+    def _evict(self) -> None:
+
+        cutoff = time.time() - self._actor_ttl
+        evicted = []
+
+        while self._actor_seen:
+            actor, seen = next(iter(self._actor_seen.items()))
+            if seen > cutoff and len(self._actor_seen) <= self._max_actors:
+                break
+            self._actor_seen.popitem(last=False)
+            if actor in self._actor_index:
+                evicted.append(self._actor_index[actor])
+
+        if not evicted:
+            return
+
+        keep = np.ones(len(self._actor_keys), dtype=bool)
+        keep[evicted] = False
+
+        self._cooccurrence = self._cooccurrence - self._multiply(self._actions[~keep])
+        self._cooccurrence.eliminate_zeros()
+        self._actions = self._actions[keep]
+        self._actor_keys = [actor for actor, kept in zip(self._actor_keys, keep) if kept]
+        self._actor_index = {actor: i for i, actor in enumerate(self._actor_keys)}
+        self._evictions += len(evicted)
+
+    def _reset_actor_seen(self) -> None:
+
+        now = time.time()
+        self._actor_seen = OrderedDict((actor, now) for actor in self._actor_keys)
+
+    def _multiply(self, actions: sparse.csr_matrix) -> sparse.csr_matrix:
+
+        seen = actions.copy()
+        seen.data = np.ones_like(seen.data)
+
+        cooccurrence = (seen.T @ actions).tocsr()
+        cooccurrence.setdiag(0)
+        cooccurrence.eliminate_zeros()
+        return cooccurrence
+
+    def _merge(self, matrix: sparse.csr_matrix, entries, shape: Tuple[int, int]) -> sparse.csr_matrix:
+
+        entries = list(entries)
+        base = matrix.tocoo()
+
+        rows = np.concatenate([base.row, np.fromiter((e[0] for e in entries), dtype=np.int32, count=len(entries))])
+        cols = np.concatenate([base.col, np.fromiter((e[1] for e in entries), dtype=np.int32, count=len(entries))])
+        data = np.concatenate([base.data, np.fromiter((e[2] for e in entries), dtype=np.int32, count=len(entries))])
+
+        return sparse.csr_matrix((data, (rows, cols)), shape=shape)
+
+    def _actor_profile(self, actor: str) -> Counter:
+
+        profile = Counter(self._actor_increments.get(actor, {}))
+
+        index = self._actor_index.get(actor)
+        if index is not None and index < self._actions.shape[0]:
+            start, end = self._actions.indptr[index], self._actions.indptr[index + 1]
+            for column, count in zip(self._actions.indices[start:end], self._actions.data[start:end]):
+                profile[self._product_ids[column]] += int(count)
+
+        return profile
+
+    def _row(self, product_id: int) -> Tuple[np.ndarray, np.ndarray]:
+
+        ids = np.zeros(0, dtype=np.int64)
+        values = np.zeros(0, dtype=np.int64)
+
+        index = self._product_index.get(product_id)
+        if index is not None and index < self._cooccurrence.shape[0]:
+            start, end = self._cooccurrence.indptr[index], self._cooccurrence.indptr[index + 1]
+            ids = self._product_array[self._cooccurrence.indices[start:end]]
+            values = self._cooccurrence.data[start:end].astype(np.int64)
+
+        delta = self._deltas.get(product_id)
+        if delta:
+            ids = np.concatenate([ids, np.fromiter(delta.keys(), dtype=np.int64, count=len(delta))])
+            values = np.concatenate([values, np.fromiter(delta.values(), dtype=np.int64, count=len(delta))])
+            ids, inverse = np.unique(ids, return_inverse=True)
+            values = np.bincount(inverse, weights=values).astype(np.int64)
+
+        return ids, values
+
+cooccurrence_model = CooccurrenceModel(
+    max_actors=settings.cooccurrence_max_actors,
+    actor_ttl_seconds=settings.cooccurrence_actor_ttl_seconds
+)
+
+metrics_registry.register("cooccurrence", cooccurrence_model.stats)
@@ -1,50 +1,118 @@
 
-from sqlalchemy import create_engine, event
+from fastapi import Depends, Request
+from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from typing import AsyncGenerator, Generator, Optional
 import logging
 
 from app.core.config import settings
+from app.core.db_profiles import configure_engine, engine_options
+from app.core.metrics import metrics_registry
+from app.core.pool_metrics import pool_monitor
+from app.core.read_replica import ReplicaRouter, RoutingSession, use_read_replica
+from app.core.unit_of_work import READ_ONLY_KEY, request_session
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-engine = create_engine(
+engine = configure_engine(create_engine(
     settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_recycle=3600,
+    echo=settings.db_echo,
+    **engine_options(settings.database_url, overrides=settings.engine_overrides)
+))
+
+pool_monitor.instrument(engine, "primary")
+
+replica_router = ReplicaRouter(
+    [
+        pool_monitor.instrument(
+            configure_engine(create_engine(
+                url,
+                echo=settings.db_echo,
+                **engine_options(url, overrides=settings.engine_overrides)
+            )),
+            f"replica_{index}"
+        )
+        for index, url in enumerate(settings.read_replica_urls)
+    ],
+    max_lag_seconds=settings.read_replica_max_lag_seconds,
+    lag_query=settings.read_replica_lag_query
 )
 
-@event.listens_for(engine, "connect")
-def set_connection_properties(dbapi_conn, connection_record):
-
-    cursor = dbapi_conn.cursor()
-
-    cursor.close()
+metrics_registry.register("read_replicas", replica_router.stats)
 
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
-    bind=engine
+    bind=engine,
+    router=replica_router
 )
 
 Base = declarative_base()
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(request: Request = None) -> Generator[Session, None, None]:
 
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        logger.error(f"Database session error: {e}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    yield from request_session(SessionLocal, request)
+
+def get_read_db(db: Session = Depends(get_db)) -> Session:
+
+    db.info[READ_ONLY_KEY] = True
+    return use_read_replica(db)
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+def get_async_engine() -> AsyncEngine:
+
+    global _async_engine, _async_session_factory
+
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.async_database_url,
+            echo=settings.db_echo,
+            **engine_options(settings.async_database_url, asynchronous=True, overrides=settings.engine_overrides)
+        )
+        configure_engine(_async_engine.sync_engine)
+        pool_monitor.instrument(_async_engine.sync_engine, "async")
+        _async_session_factory = async_sessionmaker(
+            _async_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    return _async_engine
+
+def AsyncSessionLocal() -> AsyncSession:
+
+    get_async_engine()
+    return _async_session_factory()
+
+async def get_async_db() -> AsyncGenerator[Optional[AsyncSession], None]:
+
+    if not settings.async_db_enabled:
+        yield None
+        return
+
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Async database session error: {e}")
+            await db.rollback()
+            raise
+
+async def dispose_async_engine() -> None:
+
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        pool_monitor.remove("async")
+        _async_engine = None
+        _async_session_factory = None
 
 def init_db() -> None:
 
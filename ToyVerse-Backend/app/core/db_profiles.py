@@ -0,0 +1,148 @@
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
+
+from app.core.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class DatabaseProfile:
+
+    name: str
+    pool_size: int
+    max_overflow: int
+    pool_recycle: int
+    pool_timeout: float = 30.0
+    pool_use_lifo: bool = False
+    connect_args: Dict[str, Any] = field(default_factory=dict)
+    sync_options: Dict[str, Any] = field(default_factory=dict)
+    pragmas: Dict[str, Any] = field(default_factory=dict)
+
+PROFILES: Dict[str, DatabaseProfile] = {
+    "mssql": DatabaseProfile(
+        name="mssql",
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=3600,
+        sync_options={"fast_executemany": True},
+    ),
+    "postgresql": DatabaseProfile(
+        name="postgresql",
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    ),
+    "sqlite": DatabaseProfile(
+        name="sqlite",
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=-1,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pragmas={
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "foreign_keys": "ON",
+            "busy_timeout": 30000,
+            "cache_size": -64000,
+            "temp_store": "MEMORY",
+            "mmap_size": 268435456,
+        },
+    ),
+}
+
+def backend_name(url: str) -> str:
+
+    return make_url(url).get_backend_name()
+
+def get_profile(url: str) -> DatabaseProfile:
+
+    backend = backend_name(url)
+    if backend not in PROFILES:
+        raise ValueError(f"Unsupported database backend '{backend}'. Supported: {', '.join(PROFILES)}")
+    return PROFILES[backend]
+
+def is_memory_database(url: str) -> bool:
+
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+def engine_options(
+    url: str,
+    asynchronous: bool = False,
+    overrides: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+
+    profile = get_profile(url)
+    overrides = {key: value for key, value in (overrides or {}).items() if value is not None}
+    options: Dict[str, Any] = {
+        "pool_pre_ping": overrides.pop("pool_pre_ping", True),
+        "connect_args": dict(profile.connect_args),
+    }
+
+    if "query_cache_size" in overrides:
+        options["query_cache_size"] = overrides.pop("query_cache_size")
+
+    if is_memory_database(url):
+        options["poolclass"] = StaticPool
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_recycle=profile.pool_recycle,
+        pool_timeout=profile.pool_timeout,
+        pool_use_lifo=profile.pool_use_lifo,
+    )
+    options.update(overrides)
+
+    if not asynchronous:
+        options.update(profile.sync_options)
+
+    return options
+
+def configure_engine(engine: Engine) -> Engine:
+
+    profile = get_profile(str(engine.url))
+    if profile.name == "sqlite":
+        _emit_sqlite_begin(engine)
+
+    if not profile.pragmas:
+        return engine
+
+    pragmas = dict(profile.pragmas)
+    if is_memory_database(str(engine.url)):
+        pragmas.pop("journal_mode", None)
+        pragmas.pop("mmap_size", None)
+    else:
+        directory = os.path.dirname(os.path.abspath(engine.url.database))
+        os.makedirs(directory, exist_ok=True)
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_conn, connection_record):
+
+        cursor = dbapi_conn.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return engine
+
+def _emit_sqlite_begin(engine: Engine) -> None:
+
+    @event.listens_for(engine, "connect")
+    def disable_driver_transactions(dbapi_conn, connection_record):
+
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(conn):
+
+        conn.exec_driver_sql("BEGIN")
@@ -0,0 +1,104 @@
+
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Optional, Set
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class Subscription:
+
+    def __init__(self, broker: "EventBroker", topic: Hashable, max_pending: int):
+
+        self._broker = broker
+        self._topic = topic
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._loop = asyncio.get_running_loop()
+        self.dropped = 0
+
+    @property
+    def topic(self) -> Hashable:
+
+        return self._topic
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+
+        if self._queue.full():
+
+            self._queue.get_nowait()
+            self.dropped += 1
+
+        self._queue.put_nowait(event)
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._deliver(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._deliver, event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+
+        self._broker.unsubscribe(self)
+
+class EventBroker:
+
+    def __init__(self, max_pending: int = 16):
+
+        self._max_pending = max_pending
+        self._subscribers: Dict[Hashable, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: Hashable) -> Subscription:
+
+        subscription = Subscription(self, topic, self._max_pending)
+        with self._lock:
+            self._subscribers[topic].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.topic)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.topic]
+
+    def publish(self, topic: Hashable, event: Dict[str, Any]) -> int:
+
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.deliver(event)
+            except Exception as e:
+                logger.error(f"Error delivering event for {topic}: {e}")
+
+        return len(subscribers)
+
+    def subscriber_count(self, topic: Optional[Hashable] = None) -> int:
+
+        with self._lock:
+            if topic is not None:
+                return len(self._subscribers.get(topic, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+order_events = EventBroker(max_pending=settings.order_events_max_pending)
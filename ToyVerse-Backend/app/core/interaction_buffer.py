@@ -0,0 +1,165 @@
+
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import threading
+import logging
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+BatchWriter = Callable[[List[Dict[str, Any]]], int]
+
+class InteractionBuffer:
+
+    def __init__(self, capacity: int = 10000, batch_size: int = 500, enabled: bool = True):
+
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._enabled = enabled
+        self._events: deque = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._accepted = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._batches = 0
+        self._lost = 0
+        self._flush_errors = 0
+        self._high_watermark = 0
+
+    @property
+    def enabled(self) -> bool:
+
+        return self._enabled
+
+    @property
+    def pending(self) -> int:
+
+        with self._lock:
+            return len(self._events)
+
+    def configure(
+        self,
+        capacity: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ) -> None:
+
+        if capacity is not None:
+            self._capacity = capacity
+        if batch_size is not None:
+            self._batch_size = batch_size
+        if enabled is not None:
+            self._enabled = enabled
+
+    def bind_loop(self) -> None:
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+
+    def offer(self, event: Dict[str, Any]) -> bool:
+
+        with self._lock:
+            if len(self._events) >= self._capacity:
+                self._dropped += 1
+                return False
+
+            self._events.append(event)
+            self._accepted += 1
+            self._high_watermark = max(self._high_watermark, len(self._events))
+            full_batch = len(self._events) >= self._batch_size
+
+        if full_batch:
+            self._wake()
+
+        return True
+
+    def drain(self, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+
+        with self._lock:
+            count = len(self._events) if max_items is None else min(max_items, len(self._events))
+            return [self._events.popleft() for _ in range(count)]
+
+    def flush(self, writer: BatchWriter) -> int:
+
+        written = 0
+
+        with self._flush_lock:
+            while True:
+                batch = self.drain(self._batch_size)
+                if not batch:
+                    break
+
+                try:
+                    stored = writer(batch)
+                except Exception as e:
+                    logger.error(f"Interaction batch write failed: {e}")
+                    stored = 0
+
+                with self._lock:
+                    self._batches += 1
+                    self._flushed += stored
+                    if stored < len(batch):
+                        self._flush_errors += 1
+                        self._lost += len(batch) - stored
+
+                written += stored
+
+        return written
+
+    async def wait_for_batch(self, timeout: float) -> None:
+
+        if self._wakeup is None:
+            await asyncio.sleep(timeout)
+            return
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "enabled": self._enabled,
+                "pending": len(self._events),
+                "capacity": self._capacity,
+                "batch_size": self._batch_size,
+                "high_watermark": self._high_watermark,
+                "accepted": self._accepted,
+                "dropped": self._dropped,
+                "flushed": self._flushed,
+                "batches": self._batches,
+                "flush_errors": self._flush_errors,
+                "lost": self._lost,
+            }
+
+    def _wake(self) -> None:
+
+        if self._loop is None or self._loop.is_closed():
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+interaction_buffer = InteractionBuffer(
+    capacity=settings.interaction_buffer_capacity,
+    batch_size=settings.interaction_flush_batch_size,
+    enabled=settings.interaction_buffer_enabled
+)
+
+metrics_registry.register("interaction_buffer", interaction_buffer.stats)
@@ -0,0 +1,40 @@
+
+from typing import Any, Callable, Dict
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MetricsRegistry:
+
+    def __init__(self):
+
+        self._providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+
+        with self._lock:
+            self._providers[name] = provider
+
+    def unregister(self, name: str) -> None:
+
+        with self._lock:
+            self._providers.pop(name, None)
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+
+        with self._lock:
+            providers = dict(self._providers)
+
+        snapshot = {}
+        for name, provider in providers.items():
+            try:
+                snapshot[name] = provider()
+            except Exception as e:
+                logger.error(f"Error collecting metrics for {name}: {e}")
+                snapshot[name] = {"error": str(e)}
+
+        return snapshot
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,199 @@
+
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+import math
+import threading
+import time
+import logging
+
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+WaitObserver = Callable[[float, bool], None]
+
+class _WaitTimingMixin:
+
+    wait_observer: Optional[WaitObserver] = None
+
+    def _do_get(self):
+
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.wait_observer is not None:
+                self.wait_observer(time.perf_counter() - start, timed_out)
+
+    def recreate(self):
+
+        pool = super().recreate()
+        pool.wait_observer = self.wait_observer
+        return pool
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+
+    pass
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+
+    pass
+
+class PoolStats:
+
+    def __init__(self, engine: Engine, samples: int = 1024):
+
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=samples)
+        self._checkouts = 0
+        self._checkins = 0
+        self._connects = 0
+        self._invalidations = 0
+        self._timeouts = 0
+        self._wait_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._peak_in_use = 0
+        self._pings = 0
+        self._ping_failures = 0
+        self._ping_total = 0.0
+        self._ping_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool) -> None:
+
+        with self._lock:
+            self._waits.append(seconds)
+            self._wait_count += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+            if timed_out:
+                self._timeouts += 1
+
+    def record_ping(self, seconds: float, ok: bool) -> None:
+
+        with self._lock:
+            self._pings += 1
+            self._ping_total += seconds
+            self._ping_max = max(self._ping_max, seconds)
+            if not ok:
+                self._ping_failures += 1
+
+    def on_checkout(self, *args) -> None:
+
+        with self._lock:
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, self._checkouts - self._checkins)
+
+    def on_checkin(self, *args) -> None:
+
+        with self._lock:
+            self._checkins += 1
+
+    def on_connect(self, *args) -> None:
+
+        with self._lock:
+            self._connects += 1
+
+    def on_invalidate(self, *args) -> None:
+
+        with self._lock:
+            self._invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+
+        pool = self._engine.pool
+
+        with self._lock:
+            waits = sorted(self._waits)
+            wait_count = len(waits)
+            stats = {
+                "pool_class": type(pool).__name__,
+                "checkouts": self._checkouts,
+                "in_use": self._checkouts - self._checkins,
+                "peak_in_use": self._peak_in_use,
+                "connects": self._connects,
+                "invalidations": self._invalidations,
+                "timeouts": self._timeouts,
+                "wait_ms_avg": round(self._wait_total / self._wait_count * 1000, 3) if self._wait_count else 0.0,
+                "wait_ms_p95": round(waits[int(0.95 * (wait_count - 1))] * 1000, 3) if wait_count else 0.0,
+                "wait_ms_max": round(self._wait_max * 1000, 3),
+                "pre_pings": self._pings,
+                "pre_ping_failures": self._ping_failures,
+                "pre_ping_ms_avg": round(self._ping_total / self._pings * 1000, 3) if self._pings else 0.0,
+                "pre_ping_ms_max": round(self._ping_max * 1000, 3),
+            }
+
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=max(0, pool.overflow()),
+                max_overflow=pool._max_overflow,
+                idle=pool.checkedin(),
+                suggested_pool_size=max(1, math.ceil(self._peak_in_use * 1.2)),
+            )
+
+        return stats
+
+class PoolMonitor:
+
+    def __init__(self):
+
+        self._pools: Dict[str, PoolStats] = {}
+        self._lock = threading.Lock()
+
+    def instrument(self, engine: Engine, name: str) -> Engine:
+
+        stats = PoolStats(engine)
+
+        event.listen(engine, "checkout", stats.on_checkout)
+        event.listen(engine, "checkin", stats.on_checkin)
+        event.listen(engine, "connect", stats.on_connect)
+        event.listen(engine, "invalidate", stats.on_invalidate)
+
+        if isinstance(engine.pool, _WaitTimingMixin):
+            engine.pool.wait_observer = stats.record_wait
+
+        do_ping = engine.dialect.do_ping
+
+        def timed_ping(dbapi_connection):
+
+            start = time.perf_counter()
+            ok = False
+            try:
+                ok = do_ping(dbapi_connection)
+                return ok
+            finally:
+                stats.record_ping(time.perf_counter() - start, ok)
+
+        engine.dialect.do_ping = timed_ping
+
+        with self._lock:
+            self._pools[name] = stats
+
+        return engine
+
+    def remove(self, name: str) -> None:
+
+        with self._lock:
+            self._pools.pop(name, None)
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            pools = dict(self._pools)
+
+        return {name: pool.stats() for name, pool in pools.items()}
+
+pool_monitor = PoolMonitor()
+
+metrics_registry.register("db_pool", pool_monitor.stats)
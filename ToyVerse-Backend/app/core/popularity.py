@@ -0,0 +1,136 @@
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import heapq
+import math
+import threading
+import time
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+RESCALE_EXPONENT = 50.0
+PRUNE_SCORE = 1e-3
+
+def epoch_seconds(timestamp: datetime) -> float:
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+class PopularityTracker:
+
+    def __init__(self, half_life_seconds: float = 259200.0, top_k: int = 100, snapshot_seconds: float = 30.0):
+
+        self._decay = math.log(2) / half_life_seconds
+        self._top_k = top_k
+        self._snapshot_seconds = snapshot_seconds
+        self._lock = threading.Lock()
+        self._origin = time.time()
+        self._scores: Dict[int, float] = {}
+        self._snapshot: List[Tuple[int, float]] = []
+        self._snapshot_at: Optional[float] = None
+        self._ready = False
+        self._events = 0
+        self._snapshots = 0
+        self._rescales = 0
+
+    @property
+    def ready(self) -> bool:
+
+        return self._ready
+
+    def seed(self, rows: Iterable[Tuple[int, datetime]]) -> int:
+
+        seeded = 0
+
+        with self._lock:
+            self._scores.clear()
+            self._origin = time.time()
+            for product_id, timestamp in rows:
+                self._add(product_id, epoch_seconds(timestamp), 1.0)
+                seeded += 1
+            self._ready = True
+
+        self.snapshot()
+        return seeded
+
+    def record(self, product_id: int, weight: float = 1.0, at: Optional[float] = None) -> None:
+
+        with self._lock:
+            self._add(product_id, time.time() if at is None else at, weight)
+            self._events += 1
+
+    def remove(self, product_id: int) -> None:
+
+        with self._lock:
+            self._scores.pop(product_id, None)
+            self._snapshot = [item for item in self._snapshot if item[0] != product_id]
+
+    def snapshot(self, now: Optional[float] = None) -> List[Tuple[int, float]]:
+
+        now = time.time() if now is None else now
+
+        with self._lock:
+            if self._decay * (now - self._origin) > RESCALE_EXPONENT:
+                self._rescale(now)
+
+            factor = math.exp(-self._decay * (now - self._origin))
+            top = heapq.nlargest(self._top_k, self._scores.items(), key=lambda item: (item[1], -item[0]))
+            self._snapshot = [(product_id, score * factor) for product_id, score in top]
+            self._snapshot_at = now
+            self._snapshots += 1
+            return self._snapshot
+
+    def top(self, limit: int = 10) -> List[Tuple[int, float]]:
+
+        snapshot_at = self._snapshot_at
+        if snapshot_at is None or time.time() - snapshot_at > self._snapshot_seconds:
+            return self.snapshot()[:limit]
+
+        return self._snapshot[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "products": len(self._scores),
+                "top_k": self._top_k,
+                "half_life_seconds": math.log(2) / self._decay,
+                "events": self._events,
+                "snapshots": self._snapshots,
+                "rescales": self._rescales,
+                "snapshot_at": self._snapshot_at,
+            }
+
+    def _add(self, product_id: int, at: float, weight: float) -> None:
+
+        if not self._scores:
+            self._origin = at
+
+        exponent = self._decay * (at - self._origin)
+        if exponent > RESCALE_EXPONENT:
+            self._rescale(at)
+            exponent = 0.0
+
+        self._scores[product_id] = self._scores.get(product_id, 0.0) + weight * math.exp(exponent)
+
+    def _rescale(self, now: float) -> None:
+
+        factor = math.exp(-self._decay * (now - self._origin))
+        self._scores = {
+            product_id: score * factor
+            for product_id, score in self._scores.items()
+            if score * factor >= PRUNE_SCORE
+        }
+        self._origin = now
+        self._rescales += 1
+
+popularity_tracker = PopularityTracker(
+    half_life_seconds=settings.popularity_half_life_hours * 3600,
+    top_k=settings.popularity_top_k,
+    snapshot_seconds=settings.popularity_snapshot_seconds
+)
+
+metrics_registry.register("popularity", popularity_tracker.stats)
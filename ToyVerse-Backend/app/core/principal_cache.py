@@ -0,0 +1,143 @@
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+import threading
+import time
+import logging
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class Principal:
+
+    id: int
+    username: str
+    role: str
+    permissions: Tuple[str, ...]
+    token_id: str
+
+    @classmethod
+    def from_user(cls, user: Any, token_id: str) -> "Principal":
+
+        return cls(
+            id=user.id,
+            username=user.username,
+            role=user.role,
+            permissions=tuple(user.get_permissions()),
+            token_id=token_id
+        )
+
+    def get_permissions(self) -> List[str]:
+
+        return list(self.permissions)
+
+    def can_perform(self, action: str) -> bool:
+
+        return action in self.permissions
+
+    def is_admin(self) -> bool:
+
+        return self.role == 'admin'
+
+class PrincipalCache:
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 10000):
+
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Principal, float]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, token_id: str) -> Optional[Principal]:
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(token_id)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            principal, expires_at = entry
+            if expires_at <= now:
+                self._remove(token_id)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(token_id)
+            self._hits += 1
+            return principal
+
+    def put(self, principal: Principal, token_expires_at: Optional[float] = None) -> None:
+
+        expires_at = time.time() + self._ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        with self._lock:
+            if principal.token_id in self._entries:
+                self._remove(principal.token_id)
+
+            self._entries[principal.token_id] = (principal, expires_at)
+            self._tokens_by_user.setdefault(principal.id, set()).add(principal.token_id)
+
+            while len(self._entries) > self._max_entries:
+                oldest_token_id = next(iter(self._entries))
+                self._remove(oldest_token_id)
+
+    def invalidate_token(self, token_id: str) -> None:
+
+        with self._lock:
+            if token_id in self._entries:
+                self._remove(token_id)
+                self._invalidations += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+
+        with self._lock:
+            for token_id in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token_id)
+                self._invalidations += 1
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self._invalidations,
+            }
+
+    def _remove(self, token_id: str) -> None:
+
+        principal, _ = self._entries.pop(token_id)
+        tokens = self._tokens_by_user.get(principal.id)
+        if tokens is not None:
+            tokens.discard(token_id)
+            if not tokens:
+                del self._tokens_by_user[principal.id]
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries
+)
+
+metrics_registry.register("principal_cache", principal_cache.stats)
@@ -0,0 +1,99 @@
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+import threading
+import time
+
+from app.core.metrics import metrics_registry
+
+_REMOVED = object()
+
+class ProductCatalog:
+
+    def __init__(self):
+
+        self._lock = threading.Lock()
+        self._categories: Dict[int, Optional[str]] = {}
+        self._changes: Dict[int, Any] = {}
+        self._loading = False
+        self._ready = False
+        self._loaded_at: Optional[float] = None
+        self._unknown = 0
+
+    @property
+    def ready(self) -> bool:
+
+        return self._ready
+
+    def knows(self, product_id: int) -> bool:
+
+        with self._lock:
+            if product_id in self._categories:
+                return True
+            if self._ready:
+                self._unknown += 1
+            return False
+
+    def category(self, product_id: int) -> Optional[str]:
+
+        with self._lock:
+            return self._categories.get(product_id)
+
+    def begin_load(self) -> None:
+
+        with self._lock:
+            self._changes.clear()
+            self._loading = True
+
+    def load(self, products: Iterable[Tuple[int, Optional[str]]]) -> int:
+
+        categories = dict(products)
+
+        with self._lock:
+            for product_id, category in self._changes.items():
+                if category is _REMOVED:
+                    categories.pop(product_id, None)
+                else:
+                    categories[product_id] = category
+
+            self._categories = categories
+            self._changes.clear()
+            self._loading = False
+            self._ready = True
+            self._loaded_at = time.time()
+            return len(categories)
+
+    def put(self, product_id: int, category: Optional[str]) -> None:
+
+        with self._lock:
+            self._categories[product_id] = category
+            if self._loading:
+                self._changes[product_id] = category
+
+    def remove(self, product_id: int) -> None:
+
+        with self._lock:
+            self._categories.pop(product_id, None)
+            if self._loading:
+                self._changes[product_id] = _REMOVED
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._categories.clear()
+            self._changes.clear()
+            self._loading = False
+            self._ready = False
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "products": len(self._categories),
+                "unknown": self._unknown,
+                "loaded_at": self._loaded_at,
+            }
+
+product_catalog = ProductCatalog()
+
+metrics_registry.register("product_catalog", product_catalog.stats)
@@ -0,0 +1,193 @@
+
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_MISS
+import threading
+import time
+import logging
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+QUERY_START_KEY = "query_start"
+
+class QueryStats:
+
+    def __init__(self, track_repeats: bool = False):
+
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.compiled = 0
+        self._track_repeats = track_repeats
+        self._statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed_ms: float, compiled: bool = False) -> None:
+
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.compiled += compiled
+
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+        if self._track_repeats:
+            self._statements[statement] += 1
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+
+        return [
+            (statement, count)
+            for statement, count in self._statements.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+
+        return (
+            f'db;dur={self.total_ms:.2f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_ms:.2f}"
+        )
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+def current_query_stats() -> Optional[QueryStats]:
+
+    return _current_stats.get()
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+
+    if _current_stats.get() is not None:
+        conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+
+    stats = _current_stats.get()
+    starts = conn.info.get(QUERY_START_KEY)
+    if stats is None or not starts:
+        return
+
+    compiled = getattr(context, "cache_hit", None) is CACHE_MISS
+    stats.record(statement, (time.perf_counter() - starts.pop()) * 1000, compiled)
+
+class QueryMetrics:
+
+    def __init__(self, repeat_threshold: int = 5):
+
+        self._repeat_threshold = repeat_threshold
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._statements = 0
+        self._compiled = 0
+        self._db_ms = 0.0
+        self._max_statements = 0
+        self._slowest_ms = 0.0
+        self._slowest_statement: Optional[str] = None
+        self._repeated: Counter = Counter()
+
+    @property
+    def repeat_threshold(self) -> int:
+
+        return self._repeat_threshold
+
+    def observe(self, route: str, stats: QueryStats) -> List[Tuple[str, int]]:
+
+        repeated = stats.repeated_statements(self._repeat_threshold)
+
+        with self._lock:
+            self._requests += 1
+            self._statements += stats.count
+            self._compiled += stats.compiled
+            self._db_ms += stats.total_ms
+            self._max_statements = max(self._max_statements, stats.count)
+
+            if stats.slowest_ms > self._slowest_ms:
+                self._slowest_ms = stats.slowest_ms
+                self._slowest_statement = stats.slowest_statement
+
+            if repeated:
+                self._repeated[route] += 1
+
+        for statement, count in repeated:
+            logger.warning(f"Possible N+1 in {route}: statement ran {count} times: {statement[:200]}")
+
+        return repeated
+
+    def reset(self) -> None:
+
+        with self._lock:
+            self._requests = 0
+            self._statements = 0
+            self._compiled = 0
+            self._db_ms = 0.0
+            self._max_statements = 0
+            self._slowest_ms = 0.0
+            self._slowest_statement = None
+            self._repeated.clear()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "statements": self._statements,
+                "statements_per_request": round(self._statements / self._requests, 2) if self._requests else 0.0,
+                "max_statements": self._max_statements,
+                "compiled_statements": self._compiled,
+                "statement_cache_hit_ratio": round(1 - self._compiled / self._statements, 4) if self._statements else 0.0,
+                "db_ms": round(self._db_ms, 2),
+                "slowest_ms": round(self._slowest_ms, 2),
+                "slowest_statement": self._slowest_statement[:200] if self._slowest_statement else None,
+                "repeat_threshold": self._repeat_threshold,
+                "n_plus_one_routes": dict(self._repeated),
+            }
+
+query_metrics = QueryMetrics(repeat_threshold=settings.query_repeat_threshold)
+
+metrics_registry.register("sql", query_metrics.stats)
+
+class QueryTimingMiddleware:
+
+    def __init__(self, app, detect_repeats: bool = False):
+
+        self.app = app
+        self.detect_repeats = detect_repeats
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(track_repeats=self.detect_repeats)
+        token = _current_stats.set(stats)
+
+        async def send_with_timing(message):
+
+            if message["type"] == "http.response.start":
+                route = scope.get("route")
+                repeated = query_metrics.observe(getattr(route, "path", scope["path"]), stats)
+
+                timing = stats.server_timing()
+                if repeated:
+                    timing += f', db-repeated;desc="{len(repeated)} repeated"'
+
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message["headers"] = headers
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
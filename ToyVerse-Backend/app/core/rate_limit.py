@@ -0,0 +1,241 @@
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+def refill(tokens: float, updated_at: float, now: float, capacity: float, rate: float) -> float:
+
+    return min(capacity, tokens + max(0.0, now - updated_at) * rate)
+
+class BucketStore(ABC):
+
+    blocking = False
+
+    @abstractmethod
+    def take(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> Tuple[bool, float]:
+
+        pass
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+
+        return {}
+
+class MemoryBucketStore(BucketStore):
+
+    def __init__(self, max_entries: int = 100000):
+
+        self._max_entries = max_entries
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def take(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> Tuple[bool, float]:
+
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (capacity, now))
+            tokens = refill(tokens, updated_at, now, capacity, rate)
+
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+
+            self._buckets[key] = (tokens, now)
+
+            while len(self._buckets) > self._max_entries:
+                self._buckets.popitem(last=False)
+                self._evictions += 1
+
+        retry_after = 0.0 if allowed else (cost - tokens) / rate
+        return allowed, retry_after
+
+    def reset(self, key: str) -> None:
+
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "backend": "memory",
+                "buckets": len(self._buckets),
+                "max_entries": self._max_entries,
+                "evictions": self._evictions,
+            }
+
+class SQLiteBucketStore(BucketStore):
+
+    blocking = True
+
+    def __init__(self, path: str, idle_seconds: float = 3600.0, cleanup_every: int = 1000):
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._path = path
+        self._idle_seconds = idle_seconds
+        self._cleanup_every = cleanup_every
+        self._local = threading.local()
+        self._operations = 0
+
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+    def take(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> Tuple[bool, float]:
+
+        conn = self._connection()
+        now = time.time()
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens = refill(row[0], row[1], now, capacity, rate) if row else capacity
+
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                (key, tokens, now)
+            )
+
+            self._operations += 1
+            if self._operations % self._cleanup_every == 0:
+                conn.execute("DELETE FROM buckets WHERE updated_at < ?", (now - self._idle_seconds,))
+
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        retry_after = 0.0 if allowed else (cost - tokens) / rate
+        return allowed, retry_after
+
+    def reset(self, key: str) -> None:
+
+        conn = self._connection()
+        conn.execute("DELETE FROM buckets WHERE key = ?", (key,))
+
+    def stats(self) -> Dict[str, Any]:
+
+        count = self._connection().execute("SELECT COUNT(*) FROM buckets").fetchone()[0]
+        return {
+            "backend": "sqlite",
+            "path": self._path,
+            "buckets": count,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+
+        conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+class RateLimiter:
+
+    def __init__(self, store: BucketStore, enabled: bool = True):
+
+        self._store = store
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._allowed = 0
+        self._rejected = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+
+        return self._enabled
+
+    def configure(self, store: Optional[BucketStore] = None, enabled: Optional[bool] = None) -> None:
+
+        if store is not None:
+            self._store = store
+        if enabled is not None:
+            self._enabled = enabled
+
+    def hit(self, key: str, burst: int, per_minute: float) -> Tuple[bool, float]:
+
+        if not self._enabled:
+            return True, 0.0
+
+        try:
+            allowed, retry_after = self._store.take(key, float(burst), per_minute / 60.0)
+        except Exception as e:
+            logger.error(f"Rate limit store error for {key}: {e}")
+            with self._lock:
+                self._errors += 1
+            return True, 0.0
+
+        with self._lock:
+            if allowed:
+                self._allowed += 1
+            else:
+                self._rejected += 1
+
+        return allowed, retry_after
+
+    async def hit_async(self, key: str, burst: int, per_minute: float) -> Tuple[bool, float]:
+
+        if self._enabled and self._store.blocking:
+            return await asyncio.to_thread(self.hit, key, burst, per_minute)
+
+        return self.hit(key, burst, per_minute)
+
+    def reset(self, key: str) -> None:
+
+        self._store.reset(key)
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            counters = {
+                "enabled": self._enabled,
+                "allowed": self._allowed,
+                "rejected": self._rejected,
+                "errors": self._errors,
+            }
+
+        counters.update(self._store.stats())
+        return counters
+
+def create_bucket_store() -> BucketStore:
+
+    if settings.rate_limit_backend == "sqlite":
+        return SQLiteBucketStore(settings.rate_limit_sqlite_path)
+
+    return MemoryBucketStore(max_entries=settings.rate_limit_max_entries)
+
+login_rate_limiter = RateLimiter(create_bucket_store(), enabled=settings.login_rate_limit_enabled)
+
+metrics_registry.register("login_rate_limit", login_rate_limiter.stats)
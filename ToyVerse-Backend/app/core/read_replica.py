@@ -0,0 +1,150 @@
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+import itertools
+import threading
+import time
+import logging
+
+from app.core.unit_of_work import PENDING_WRITES_KEY
+
+logger = logging.getLogger(__name__)
+
+READ_REPLICA_KEY = "read_replica"
+REPLICA_ENGINE_KEY = "replica_engine"
+PRIMARY_PINNED_KEY = "primary_pinned"
+
+class ReplicaRouter:
+
+    def __init__(self, engines: List[Engine], max_lag_seconds: float = 5.0, lag_query: str = ""):
+
+        self._engines = list(engines)
+        self._max_lag = max_lag_seconds
+        self._lag_query = lag_query
+        self._healthy = list(self._engines)
+        self._lag: Dict[int, Optional[float]] = {}
+        self._cycle = itertools.count()
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        self._replica_sessions = 0
+        self._primary_fallbacks = 0
+        self._unavailable = 0
+
+    @property
+    def enabled(self) -> bool:
+
+        return bool(self._engines)
+
+    @property
+    def engines(self) -> List[Engine]:
+
+        return list(self._engines)
+
+    def choose(self) -> Optional[Engine]:
+
+        with self._lock:
+            if not self._healthy:
+                if self._engines:
+                    self._unavailable += 1
+                return None
+
+            self._replica_sessions += 1
+            return self._healthy[next(self._cycle) % len(self._healthy)]
+
+    def record_primary_fallback(self) -> None:
+
+        with self._lock:
+            self._primary_fallbacks += 1
+
+    def check(self) -> int:
+
+        healthy = []
+        for index, engine in enumerate(self._engines):
+            lag = self._probe(engine)
+            self._lag[index] = lag
+            if lag is not None and lag <= self._max_lag:
+                healthy.append(engine)
+            else:
+                logger.warning(f"Read replica {engine.url.host or index} unavailable (lag={lag})")
+
+        with self._lock:
+            self._healthy = healthy
+            self._checked_at = time.time()
+
+        return len(healthy)
+
+    def dispose(self) -> None:
+
+        for engine in self._engines:
+            engine.dispose()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "replicas": len(self._engines),
+                "healthy": len(self._healthy),
+                "max_lag_seconds": self._max_lag,
+                "lag_seconds": [self._lag.get(i) for i in range(len(self._engines))],
+                "replica_sessions": self._replica_sessions,
+                "primary_fallbacks": self._primary_fallbacks,
+                "unavailable": self._unavailable,
+                "checked_at": self._checked_at,
+            }
+
+    def _probe(self, engine: Engine) -> Optional[float]:
+
+        try:
+            with engine.connect() as conn:
+                if not self._lag_query:
+                    conn.execute(text("SELECT 1"))
+                    return 0.0
+
+                lag = conn.execute(text(self._lag_query)).scalar()
+                return float(lag or 0.0)
+        except Exception as e:
+            logger.error(f"Read replica probe failed: {e}")
+            return None
+
+class RoutingSession(Session):
+
+    def __init__(self, *args, router: Optional[ReplicaRouter] = None, **kwargs):
+
+        super().__init__(*args, **kwargs)
+        self._router = router
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+
+        if self._router is not None and self.info.get(READ_REPLICA_KEY):
+            if self._is_write(clause):
+                if not self.info.get(PRIMARY_PINNED_KEY):
+                    self.info[PRIMARY_PINNED_KEY] = True
+                    self._router.record_primary_fallback()
+            else:
+                if REPLICA_ENGINE_KEY not in self.info:
+                    self.info[REPLICA_ENGINE_KEY] = self._router.choose()
+
+                engine = self.info[REPLICA_ENGINE_KEY]
+
+                if engine is not None:
+                    return engine
+
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+    def _is_write(self, clause) -> bool:
+
+        return (
+            self._flushing
+            or isinstance(clause, UpdateBase)
+            or bool(self.info.get(PENDING_WRITES_KEY))
+            or bool(self.info.get(PRIMARY_PINNED_KEY))
+        )
+
+def use_read_replica(session: Session) -> Session:
+
+    if isinstance(session, RoutingSession) and session._router is not None and session._router.enabled:
+        session.info[READ_REPLICA_KEY] = True
+    return session
@@ -0,0 +1,154 @@
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+import hashlib
+import math
+import threading
+import logging
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+
+        capacity = max(1, capacity)
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self._hash_count = max(1, int(round(self._size / capacity * math.log(2))))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+
+        return self._size
+
+    @property
+    def hash_count(self) -> int:
+
+        return self._hash_count
+
+    def __len__(self) -> int:
+
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7))
+            for index in self._indexes(key)
+        )
+
+    def add(self, key: str) -> None:
+
+        for index in self._indexes(key):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+
+    def _indexes(self, key: str):
+
+        digest = hashlib.sha256(key.encode("utf-8")).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+
+        for i in range(self._hash_count):
+            yield (first + i * second) % self._size
+
+class RevocationList:
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+
+        self._min_capacity = capacity
+        self._error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._lock = threading.Lock()
+        self._synced_at: Optional[datetime] = None
+        self._checks = 0
+        self._positives = 0
+        self._false_positives = 0
+
+    @property
+    def synced_at(self) -> Optional[datetime]:
+
+        return self._synced_at
+
+    @property
+    def needs_rebuild(self) -> bool:
+
+        return len(self._filter) > self._filter.capacity
+
+    def might_be_revoked(self, token_id: str) -> bool:
+
+        bloom = self._filter
+        hit = token_id in bloom
+
+        with self._lock:
+            self._checks += 1
+            if hit:
+                self._positives += 1
+
+        return hit
+
+    def record_false_positive(self) -> None:
+
+        with self._lock:
+            self._false_positives += 1
+
+    def add(self, token_id: str) -> None:
+
+        with self._lock:
+            self._filter.add(token_id)
+
+    def add_many(self, token_ids: Iterable[str], synced_at: Optional[datetime] = None) -> None:
+
+        with self._lock:
+            for token_id in token_ids:
+                self._filter.add(token_id)
+            if synced_at is not None:
+                self._synced_at = synced_at
+
+    def rebuild(self, token_ids: Iterable[str], synced_at: Optional[datetime] = None) -> int:
+
+        token_ids = list(token_ids)
+        bloom = BloomFilter(max(self._min_capacity, len(token_ids) * 2), self._error_rate)
+        for token_id in token_ids:
+            bloom.add(token_id)
+
+        with self._lock:
+            self._filter = bloom
+            self._synced_at = synced_at
+
+        logger.info(f"Revocation filter rebuilt with {len(token_ids)} tokens")
+        return len(token_ids)
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            bloom = self._filter
+            return {
+                "entries": len(bloom),
+                "capacity": bloom.capacity,
+                "bits": bloom.size,
+                "hash_count": bloom.hash_count,
+                "checks": self._checks,
+                "positives": self._positives,
+                "false_positives": self._false_positives,
+                "synced_at": self._synced_at.isoformat() if self._synced_at else None,
+            }
+
+revocation_list = RevocationList(
+    capacity=settings.token_revocation_bloom_capacity,
+    error_rate=settings.token_revocation_bloom_error_rate
+)
+
+metrics_registry.register("token_revocation", revocation_list.stats)
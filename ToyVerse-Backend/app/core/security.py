@@ -1,30 +1,114 @@
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple
 from jose import JWTError, jwt
+import asyncio
+import hashlib
+import secrets
+import threading
+import time
+import uuid
 import bcrypt
 import logging
 
+try:
+    from argon2 import PasswordHasher as Argon2Hasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:
+    Argon2Hasher = None
+
 from app.core.config import settings
+from app.core.metrics import metrics_registry
 
 logger = logging.getLogger(__name__)
 
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+ARGON2ID_PREFIX = "$argon2id$"
+
+def identify_hash(hashed_password: str) -> Optional[str]:
+
+    if hashed_password.startswith(ARGON2ID_PREFIX):
+        return "argon2id"
+    if hashed_password.startswith(BCRYPT_PREFIXES):
+        return "bcrypt"
+    return None
+
 class PasswordHandler:
 
+    def __init__(
+        self,
+        scheme: str = "bcrypt",
+        rounds: int = 12,
+        argon2_time_cost: int = 3,
+        argon2_memory_cost: int = 65536,
+        argon2_parallelism: int = 4,
+        max_workers: int = 4,
+        offload: bool = True
+    ):
+
+        self._scheme = scheme
+        self._rounds = rounds
+        self._argon2_time_cost = argon2_time_cost
+        self._argon2_memory_cost = argon2_memory_cost
+        self._argon2_parallelism = argon2_parallelism
+        self._argon2: Optional[Any] = None
+        self._max_workers = max_workers
+        self._offload = offload
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._max_pending = 0
+        self._completed = 0
+        self._started = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._build_argon2()
+
+    def configure(
+        self,
+        rounds: Optional[int] = None,
+        offload: Optional[bool] = None,
+        scheme: Optional[str] = None,
+        argon2_time_cost: Optional[int] = None,
+        argon2_memory_cost: Optional[int] = None,
+        argon2_parallelism: Optional[int] = None
+    ) -> None:
 
+        if rounds is not None:
+            self._rounds = rounds
+        if offload is not None:
+            self._offload = offload
+        if scheme is not None:
+            self._scheme = scheme
+        if argon2_time_cost is not None:
+            self._argon2_time_cost = argon2_time_cost
+        if argon2_memory_cost is not None:
+            self._argon2_memory_cost = argon2_memory_cost
+        if argon2_parallelism is not None:
+            self._argon2_parallelism = argon2_parallelism
+        self._build_argon2()
 
-    def __init__(self):
-        pass
+    @property
+    def scheme(self) -> str:
+
+        return self._scheme
 
     def hash_password(self, password: str) -> str:
-        with open("security_debug.txt", "a") as f:
-            f.write(f"Hashing: {password} with len {len(password)}\n")
+
+        if self._scheme == "argon2id":
+            return self._argon2.hash(password)
+
         pwd_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self._rounds)
         return bcrypt.hashpw(pwd_bytes, salt).decode('utf-8')
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         try:
+            if identify_hash(hashed_password) == "argon2id":
+                return self._verify_argon2(plain_password, hashed_password)
+
             pwd_bytes = plain_password.encode('utf-8')
             hashed_bytes = hashed_password.encode('utf-8')
             return bcrypt.checkpw(pwd_bytes, hashed_bytes)
@@ -32,13 +116,193 @@ class PasswordHandler:
             logger.error(f"Password verification error: {e}")
             return False
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+
+        if identify_hash(hashed_password) != self._scheme:
+            return True
+
+        if self._scheme == "argon2id":
+            return self._argon2.check_needs_rehash(hashed_password)
+
+        try:
+            return int(hashed_password.split("$")[2]) != self._rounds
+        except (IndexError, ValueError):
+            return True
+
+    def _verify_argon2(self, plain_password: str, hashed_password: str) -> bool:
+
+        verifier = self._argon2 or Argon2Hasher()
+        try:
+            return verifier.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def _build_argon2(self) -> None:
+
+        if Argon2Hasher is None:
+            if self._scheme == "argon2id":
+                raise RuntimeError("PASSWORD_HASH_SCHEME=argon2id requires the argon2-cffi package")
+            self._argon2 = None
+            return
+
+        self._argon2 = Argon2Hasher(
+            time_cost=self._argon2_time_cost,
+            memory_cost=self._argon2_memory_cost,
+            parallelism=self._argon2_parallelism
+        )
+
+    async def hash_password_async(self, password: str) -> str:
+
+        return await self._run(self.hash_password, password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+
+        return await self._run(self.verify_password, plain_password, hashed_password)
+
+    @property
+    def queue_depth(self) -> int:
+
+        return self._pending
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            return {
+                "workers": self._max_workers,
+                "scheme": self._scheme,
+                "bcrypt_rounds": self._rounds,
+                "argon2_time_cost": self._argon2_time_cost,
+                "argon2_memory_cost": self._argon2_memory_cost,
+                "argon2_parallelism": self._argon2_parallelism,
+                "offload": self._offload,
+                "queue_depth": self._pending,
+                "max_queue_depth": self._max_pending,
+                "completed": self._completed,
+                "avg_wait_ms": round(self._total_wait / self._started * 1000, 3) if self._started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+
+        if not self._offload:
+            return func(*args)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="password-hash"
+                )
+            executor = self._executor
+            self._pending += 1
+            self._max_pending = max(self._max_pending, self._pending)
+
+        submitted_at = time.perf_counter()
+
+        def timed() -> Any:
+            wait = time.perf_counter() - submitted_at
+            with self._lock:
+                self._started += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return func(*args)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, timed)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+class TokenClaimsCache:
+
+    def __init__(self, max_entries: int = 10000):
+
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+
+        if self._max_entries <= 0:
+            return None
+
+        key = self._key(token)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            claims, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dict(claims)
+
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+
+        expires_at = claims.get("exp")
+        if self._max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+
+        with self._lock:
+            self._entries[key] = (dict(claims), float(expires_at))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    @staticmethod
+    def _key(token: str) -> str:
+
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
 class JWTHandler:
 
-    def __init__(self):
+    def __init__(self, cache: Optional[TokenClaimsCache] = None):
 
         self._secret_key = settings.secret_key
         self._algorithm = settings.algorithm
         self._expire_minutes = settings.access_token_expire_minutes
+        self._cache = cache
 
     def create_access_token(
         self,
@@ -53,7 +317,7 @@ class JWTHandler:
         else:
             expire = datetime.utcnow() + timedelta(minutes=self._expire_minutes)
 
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
 
         encoded_jwt = jwt.encode(
             to_encode,
@@ -65,12 +329,19 @@ class JWTHandler:
 
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
 
+        if self._cache:
+            claims = self._cache.get(token)
+            if claims is not None:
+                return claims
+
         try:
             payload = jwt.decode(
                 token,
                 self._secret_key,
                 algorithms=[self._algorithm]
             )
+            if self._cache:
+                self._cache.put(token, payload)
             return payload
         except JWTError as e:
             logger.error(f"JWT verification error: {e}")
@@ -83,8 +354,32 @@ class JWTHandler:
             return payload.get("sub")
         return None
 
-password_handler = PasswordHandler()
-jwt_handler = JWTHandler()
+def get_token_id(token: str, payload: Dict[str, Any]) -> str:
+
+    return payload.get("jti") or hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+def generate_refresh_token() -> str:
+
+    return secrets.token_urlsafe(48)
+
+def hash_refresh_token(token: str) -> str:
+
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+password_handler = PasswordHandler(
+    scheme=settings.password_hash_scheme,
+    rounds=settings.bcrypt_rounds,
+    argon2_time_cost=settings.argon2_time_cost,
+    argon2_memory_cost=settings.argon2_memory_cost,
+    argon2_parallelism=settings.argon2_parallelism,
+    max_workers=settings.password_hash_workers,
+    offload=settings.password_hash_offload
+)
+token_claims_cache = TokenClaimsCache(max_entries=settings.jwt_cache_max_entries)
+jwt_handler = JWTHandler(cache=token_claims_cache)
+
+metrics_registry.register("password_hashing", password_handler.stats)
+metrics_registry.register("jwt_claims_cache", token_claims_cache.stats)
 
 def hash_password(password: str) -> str:
 
@@ -94,6 +389,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     return password_handler.verify_password(plain_password, hashed_password)
 
+def needs_rehash(hashed_password: str) -> bool:
+
+    return password_handler.needs_rehash(hashed_password)
+
+async def hash_password_async(password: str) -> str:
+
+    return await password_handler.hash_password_async(password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+
+    return await password_handler.verify_password_async(plain_password, hashed_password)
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
 
     return jwt_handler.create_access_token(data, expires_delta)
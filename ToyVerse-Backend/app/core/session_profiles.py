@@ -0,0 +1,127 @@
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+@dataclass(frozen=True)
+class SessionProfile:
+
+    recent: Tuple[int, ...]
+    categories: Dict[str, int] = field(default_factory=dict)
+
+    def category_counts(self) -> Counter:
+
+        return Counter(self.categories)
+
+@dataclass
+class _ProfileEntry:
+
+    recent: "OrderedDict[int, None]"
+    categories: Counter
+    expires_at: float
+
+class SessionProfileStore:
+
+    def __init__(
+        self,
+        ttl_seconds: float = 1800.0,
+        max_sessions: int = 50000,
+        recent_limit: int = 50,
+        enabled: bool = True
+    ):
+
+        self._ttl = ttl_seconds
+        self._max_sessions = max_sessions
+        self._recent_limit = recent_limit
+        self._enabled = enabled
+        self._entries: "OrderedDict[str, _ProfileEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+
+        return self._enabled
+
+    def record(self, session_id: str, product_id: int, category: Optional[str] = None) -> None:
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry.expires_at <= now:
+                entry = _ProfileEntry(recent=OrderedDict(), categories=Counter(), expires_at=now)
+                self._entries[session_id] = entry
+
+            entry.recent.pop(product_id, None)
+            entry.recent[product_id] = None
+            while len(entry.recent) > self._recent_limit:
+                entry.recent.popitem(last=False)
+
+            if category:
+                entry.categories[category] += 1
+
+            entry.expires_at = now + self._ttl
+            self._entries.move_to_end(session_id)
+
+            while len(self._entries) > self._max_sessions:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get(self, session_id: str) -> Optional[SessionProfile]:
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.expires_at <= now:
+                del self._entries[session_id]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            return SessionProfile(
+                recent=tuple(reversed(entry.recent)),
+                categories=dict(entry.categories)
+            )
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self._enabled,
+                "sessions": len(self._entries),
+                "max_sessions": self._max_sessions,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+session_profiles = SessionProfileStore(
+    ttl_seconds=settings.session_profile_ttl_seconds,
+    max_sessions=settings.session_profile_max_sessions,
+    recent_limit=settings.session_profile_recent_limit,
+    enabled=settings.session_profile_enabled
+)
+
+metrics_registry.register("session_profiles", session_profiles.stats)
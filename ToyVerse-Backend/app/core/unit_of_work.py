@@ -0,0 +1,126 @@
+
+from typing import Callable, Generator, List, Optional
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+import logging
+
+logger = logging.getLogger(__name__)
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+PENDING_WRITES_KEY = "pending_writes"
+READ_ONLY_KEY = "read_only"
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session, flush_context):
+
+    session.info[PENDING_WRITES_KEY] = True
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_write(orm_execute_state):
+
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[PENDING_WRITES_KEY] = True
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_pending_writes(session, previous_transaction):
+
+    if previous_transaction.parent is not None:
+        return
+
+    session.info.pop(PENDING_WRITES_KEY, None)
+
+class UnitOfWork:
+
+    def __init__(self, session: Session):
+
+        self._session = session
+        self._callbacks: List[Callable[[], None]] = []
+        session.info[UNIT_OF_WORK_KEY] = self
+
+    @classmethod
+    def for_session(cls, session: Session) -> "UnitOfWork":
+
+        unit_of_work = session.info.get(UNIT_OF_WORK_KEY)
+        if unit_of_work is None:
+            unit_of_work = cls(session)
+        return unit_of_work
+
+    @property
+    def session(self) -> Session:
+
+        return self._session
+
+    @property
+    def read_only(self) -> bool:
+
+        return bool(self._session.info.get(READ_ONLY_KEY))
+
+    @property
+    def has_pending_writes(self) -> bool:
+
+        return bool(self._session.info.get(PENDING_WRITES_KEY)) or bool(
+            self._session.new or self._session.dirty or self._session.deleted
+        )
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+
+        self._callbacks.append(callback)
+
+    def commit(self) -> None:
+
+        if self.has_pending_writes:
+            self._session.commit()
+            self._session.info.pop(PENDING_WRITES_KEY, None)
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"After-commit callback failed: {e}")
+
+    def rollback(self) -> None:
+
+        self._callbacks.clear()
+        self._session.rollback()
+
+def request_session(
+    session_factory: sessionmaker,
+    request: Optional[Request] = None
+) -> Generator[Session, None, None]:
+
+    db = session_factory()
+    unit_of_work = UnitOfWork(db)
+
+    if request is not None:
+        request.state.unit_of_work = unit_of_work
+
+    try:
+        yield db
+        unit_of_work.commit()
+    except Exception as e:
+        logger.error(f"Database session error: {e}")
+        unit_of_work.rollback()
+        raise
+    finally:
+        db.close()
+
+class UnitOfWorkRoute(APIRoute):
+
+    def get_route_handler(self) -> Callable:
+
+        route_handler = super().get_route_handler()
+
+        async def unit_of_work_handler(request: Request) -> Response:
+
+            response = await route_handler(request)
+
+            unit_of_work = getattr(request.state, "unit_of_work", None)
+            if unit_of_work is not None:
+                unit_of_work.commit()
+
+            return response
+
+        return unit_of_work_handler
@@ -1,11 +1,28 @@
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from datetime import datetime, timedelta
+import asyncio
+import time
 import logging
 
 from app.core.config import settings
-from app.core.database import check_db_connection
+from app.core.database import SessionLocal, check_db_connection, dispose_async_engine, replica_router
+from app.core.content_similarity import content_similarity
+from app.core.cooccurrence import actor_rows, cooccurrence_model
+from app.core.interaction_buffer import interaction_buffer
+from app.core.metrics import metrics_registry
+from app.core.popularity import popularity_tracker
+from app.core.product_catalog import product_catalog
+from app.core.query_stats import QueryTimingMiddleware
+from app.core.security import password_handler
+from app.repositories.user_repository import UserRepository
+from app.repositories.token_repository import TokenRepository
+from app.repositories.interaction_repository import InteractionRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.auth_service import AuthService
+from app.api.dependencies import get_current_admin
 from app.api.routes import auth, products, cart, orders, reviews, admin, uploads, chatbot, recommendations, support, wishlist, profile
 from fastapi.staticfiles import StaticFiles
 
@@ -27,12 +44,16 @@ def create_application() -> FastAPI:
         redoc_url="/redoc",
     )
 
+    if settings.query_timing_enabled:
+        app.add_middleware(QueryTimingMiddleware, detect_repeats=settings.query_debug)
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
     )
 
     app.include_router(auth.router, prefix=settings.api_v1_prefix)
@@ -54,6 +75,192 @@ def create_application() -> FastAPI:
 
 app = create_application()
 
+def sync_token_revocations() -> int:
+
+    db = SessionLocal()
+    try:
+        return AuthService(UserRepository(db), TokenRepository(db)).sync_revocation_list()
+    finally:
+        db.close()
+
+async def token_revocation_sync_loop():
+
+    while True:
+        await asyncio.sleep(settings.token_revocation_sync_seconds)
+        try:
+            await asyncio.to_thread(sync_token_revocations)
+        except Exception as e:
+            logger.error(f"Token revocation sync failed: {e}")
+
+async def replica_health_loop():
+
+    while True:
+        await asyncio.sleep(settings.read_replica_check_seconds)
+        try:
+            await asyncio.to_thread(replica_router.check)
+        except Exception as e:
+            logger.error(f"Read replica health check failed: {e}")
+
+def write_interactions(rows) -> int:
+
+    db = SessionLocal()
+    try:
+        known = ProductRepository(db).get_existing_ids(row['product_id'] for row in rows)
+        repository = InteractionRepository(db)
+        written = repository.create_many([row for row in rows if row['product_id'] in known])
+        return written if repository.commit() else 0
+    finally:
+        db.close()
+
+async def interaction_flush_loop():
+
+    while True:
+        await interaction_buffer.wait_for_batch(settings.interaction_flush_interval_ms / 1000)
+        try:
+            await asyncio.to_thread(interaction_buffer.flush, write_interactions)
+        except Exception as e:
+            logger.error(f"Interaction flush failed: {e}")
+
+def load_cooccurrence_model() -> None:
+
+    db = SessionLocal()
+    try:
+        repository = InteractionRepository(db)
+        watermark = repository.get_max_id()
+
+        if cooccurrence_model.load(settings.cooccurrence_model_path) and cooccurrence_model.watermark <= watermark:
+            counts = repository.get_actor_product_counts(after_id=cooccurrence_model.watermark, up_to_id=watermark)
+            cooccurrence_model.catch_up(actor_rows(counts), watermark)
+        else:
+            counts = repository.get_actor_product_counts(up_to_id=watermark)
+            cooccurrence_model.build(actor_rows(counts), watermark)
+    finally:
+        db.close()
+
+def catch_up_cooccurrence_model() -> int:
+
+    db = SessionLocal()
+    try:
+        repository = InteractionRepository(db)
+        watermark = repository.get_max_id()
+        if watermark <= cooccurrence_model.watermark:
+            return 0
+
+        counts = repository.get_actor_product_counts(after_id=cooccurrence_model.watermark, up_to_id=watermark)
+    finally:
+        db.close()
+
+    cooccurrence_model.catch_up(actor_rows(counts), watermark)
+    return len(counts)
+
+async def cooccurrence_refresh_loop():
+
+    try:
+        await asyncio.to_thread(load_cooccurrence_model)
+        logger.info(f"Co-occurrence model ready: {cooccurrence_model.stats()['pairs']} product pairs")
+    except Exception as e:
+        logger.error(f"Co-occurrence model load failed: {e}")
+
+    compacted_at = time.monotonic()
+
+    while True:
+        await asyncio.sleep(settings.cooccurrence_catch_up_seconds)
+        if not cooccurrence_model.ready:
+            continue
+        try:
+            await asyncio.to_thread(catch_up_cooccurrence_model)
+        except Exception as e:
+            logger.error(f"Co-occurrence model catch-up failed: {e}")
+
+        if time.monotonic() - compacted_at < settings.cooccurrence_compact_seconds:
+            continue
+        compacted_at = time.monotonic()
+        try:
+            await asyncio.to_thread(cooccurrence_model.compact)
+        except Exception as e:
+            logger.error(f"Co-occurrence model compaction failed: {e}")
+
+def seed_popularity() -> int:
+
+    since = datetime.utcnow() - timedelta(hours=settings.popularity_seed_hours)
+
+    db = SessionLocal()
+    try:
+        rows = InteractionRepository(db).get_interaction_times(since)
+    finally:
+        db.close()
+
+    return popularity_tracker.seed(rows)
+
+async def popularity_snapshot_loop():
+
+    try:
+        seeded = await asyncio.to_thread(seed_popularity)
+        logger.info(f"Popularity seeded from {seeded} interactions")
+    except Exception as e:
+        logger.error(f"Popularity seed failed: {e}")
+
+    while True:
+        await asyncio.sleep(settings.popularity_snapshot_seconds)
+        try:
+            popularity_tracker.snapshot()
+        except Exception as e:
+            logger.error(f"Popularity snapshot failed: {e}")
+
+def load_product_catalog() -> int:
+
+    product_catalog.begin_load()
+
+    db = SessionLocal()
+    try:
+        categories = ProductRepository(db).get_categories()
+    finally:
+        db.close()
+
+    if categories is None:
+        raise RuntimeError("product categories unavailable")
+
+    return product_catalog.load(categories)
+
+async def product_catalog_refresh_loop():
+
+    while True:
+        await asyncio.sleep(settings.product_catalog_refresh_seconds)
+        try:
+            await asyncio.to_thread(load_product_catalog)
+        except Exception as e:
+            logger.error(f"Product catalog refresh failed: {e}")
+
+def build_content_similarity() -> int:
+
+    content_similarity.begin_build()
+
+    db = SessionLocal()
+    try:
+        products = ProductRepository(db).get_content_fields()
+    finally:
+        db.close()
+
+    if products is None:
+        raise RuntimeError("product content fields unavailable")
+
+    return content_similarity.build(products)
+
+async def content_similarity_refresh_loop():
+
+    try:
+        indexed = await asyncio.to_thread(build_content_similarity)
+        logger.info(f"Content similarity index ready: {indexed} products")
+    except Exception as e:
+        logger.error(f"Content similarity build failed: {e}")
+
+    while True:
+        await asyncio.sleep(settings.content_similarity_refresh_seconds)
+        try:
+            await asyncio.to_thread(content_similarity.refresh)
+        except Exception as e:
+            logger.error(f"Content similarity refresh failed: {e}")
+
 @app.on_event("startup")
 async def startup_event():
 
@@ -61,9 +268,28 @@ async def startup_event():
 
     if check_db_connection():
         logger.info("Database connection successful")
+        logger.info(f"Loaded {sync_token_revocations()} revoked tokens")
     else:
         logger.error("Database connection failed!")
 
+    app.state.revocation_sync_task = asyncio.create_task(token_revocation_sync_loop())
+
+    try:
+        logger.info(f"Loaded {await asyncio.to_thread(load_product_catalog)} products into the catalog")
+    except Exception as e:
+        logger.error(f"Product catalog load failed: {e}")
+    app.state.product_catalog_task = asyncio.create_task(product_catalog_refresh_loop())
+
+    interaction_buffer.bind_loop()
+    app.state.interaction_flush_task = asyncio.create_task(interaction_flush_loop())
+    app.state.cooccurrence_task = asyncio.create_task(cooccurrence_refresh_loop())
+    app.state.popularity_task = asyncio.create_task(popularity_snapshot_loop())
+    app.state.content_similarity_task = asyncio.create_task(content_similarity_refresh_loop())
+
+    if replica_router.enabled:
+        logger.info(f"{replica_router.check()} of {len(replica_router.engines)} read replicas healthy")
+        app.state.replica_health_task = asyncio.create_task(replica_health_loop())
+
     logger.info(f"{settings.app_name} started successfully")
 
 @app.on_event("shutdown")
@@ -71,6 +297,21 @@ async def shutdown_event():
 
     logger.info(f"Shutting down {settings.app_name}...")
 
+    app.state.revocation_sync_task.cancel()
+    app.state.product_catalog_task.cancel()
+    app.state.interaction_flush_task.cancel()
+    flushed = await asyncio.to_thread(interaction_buffer.flush, write_interactions)
+    logger.info(f"Flushed {flushed} buffered interactions")
+
+    app.state.cooccurrence_task.cancel()
+    app.state.popularity_task.cancel()
+    app.state.content_similarity_task.cancel()
+    if replica_router.enabled:
+        app.state.replica_health_task.cancel()
+        replica_router.dispose()
+    password_handler.shutdown()
+    await dispose_async_engine()
+
 @app.get("/")
 async def root():
 
@@ -92,6 +333,11 @@ async def health_check():
         "version": "1.0.0"
     }
 
+@app.get("/metrics", dependencies=[Depends(get_current_admin)])
+async def get_metrics():
+
+    return metrics_registry.collect()
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
 
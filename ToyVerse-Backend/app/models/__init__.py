@@ -9,6 +9,7 @@ from app.models.activity_log import ActivityLog
 from app.models.chat_message import ChatMessage
 from app.models.product_interaction import ProductInteraction
 from app.models.wishlist import Wishlist
+from app.models.auth_token import RefreshToken, RevokedToken
 
 __all__ = [
     "Base",
@@ -23,4 +24,6 @@ __all__ = [
     "ChatMessage",
     "ProductInteraction",
     "Wishlist",
+    "RefreshToken",
+    "RevokedToken",
 ]
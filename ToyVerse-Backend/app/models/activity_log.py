@@ -1,8 +1,12 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, String, Text, Index
 from app.models.base import BaseModel
 
 class ActivityLog(BaseModel):
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        Index("ix_activity_logs_actor_created_at", "actor", "created_at"),
+        Index("ix_activity_logs_created_at", "created_at"),
+    )
 
     actor = Column(String(100), nullable=False)
     action = Column(Text, nullable=False)
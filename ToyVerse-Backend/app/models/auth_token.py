@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from app.models.base import BaseModel
+
+class RefreshToken(BaseModel):
+
+    __tablename__ = "refresh_tokens"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, nullable=False, index=True)
+    family_id = Column(String(32), nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)
+
+    @property
+    def is_revoked(self) -> bool:
+
+        return self.revoked_at is not None
+
+    def __repr__(self) -> str:
+
+        return f"<RefreshToken(id={self.id}, user_id={self.user_id}, family_id={self.family_id})>"
+
+class RevokedToken(BaseModel):
+
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), unique=True, nullable=False, index=True)
+    user_id = Column(Integer, nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+
+        return f"<RevokedToken(id={self.id}, jti={self.jti})>"
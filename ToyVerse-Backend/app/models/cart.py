@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -7,6 +7,9 @@ from app.models.base import BaseModel
 class CartItem(BaseModel):
 
     __tablename__ = "cart_items"
+    __table_args__ = (
+        Index("ix_cart_items_user_id_product_id", "user_id", "product_id"),
+    )
 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
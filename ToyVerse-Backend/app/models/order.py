@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Text, Index
 from sqlalchemy.orm import relationship
 import json
 from datetime import datetime
@@ -9,6 +9,11 @@ from app.models.base import BaseModel
 class Order(BaseModel):
 
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_user_id_created_at", "user_id", "created_at"),
+        Index("ix_orders_status_created_at", "status", "created_at"),
+        Index("ix_orders_created_at", "created_at"),
+    )
 
     order_number = Column(String(50), unique=True, nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,5 +1,5 @@
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy import Column, String, Integer, Numeric, Text
 from sqlalchemy.orm import relationship
 import json
@@ -15,6 +15,13 @@ class Product(BaseModel):
     category = Column(String(50), nullable=False, index=True)
     stock = Column(Integer, default=0, nullable=False)
     rating = Column(Integer, default=0)
+    rating_sum = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_1_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_2_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_3_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_4_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_5_count = Column(Integer, default=0, server_default="0", nullable=False)
     icon = Column(String(10))
     images_json = Column(Text)
     description = Column(Text)
@@ -50,6 +57,21 @@ class Product(BaseModel):
 
         return f"${float(self.price):.2f}"
 
+    @property
+    def average_rating(self) -> float:
+
+        if not self.rating_count:
+            return 0.0
+        return round(self.rating_sum / self.rating_count, 2)
+
+    @property
+    def rating_histogram(self) -> Dict[str, int]:
+
+        return {
+            str(star): getattr(self, f"rating_{star}_count") or 0
+            for star in range(1, 6)
+        }
+
     def decrease_stock(self, quantity: int) -> bool:
 
         if self.stock >= quantity:
@@ -72,6 +94,8 @@ class Product(BaseModel):
         data['images'] = self.images
         data['is_in_stock'] = self.is_in_stock
         data['formatted_price'] = self.formatted_price
+        data['average_rating'] = self.average_rating
+        data['rating_histogram'] = self.rating_histogram
         return data
 
     def __repr__(self) -> str:
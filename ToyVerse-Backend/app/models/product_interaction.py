@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.base import BaseModel
@@ -7,6 +7,12 @@ from app.models.base import BaseModel
 class ProductInteraction(BaseModel):
 
     __tablename__ = 'product_interactions'
+    __table_args__ = (
+        Index('ix_product_interactions_product_id_timestamp', 'product_id', 'timestamp'),
+        Index('ix_product_interactions_user_id_timestamp', 'user_id', 'timestamp'),
+        Index('ix_product_interactions_session_id_timestamp', 'session_id', 'timestamp'),
+        Index('ix_product_interactions_timestamp', 'timestamp'),
+    )
 
     user_id = Column(Integer, ForeignKey('users.id'), nullable=True)
     product_id = Column(Integer, ForeignKey('products.id'), nullable=False)
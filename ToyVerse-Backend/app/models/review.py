@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -7,6 +7,10 @@ from app.models.base import BaseModel
 class Review(BaseModel):
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("ix_reviews_product_id_created_at", "product_id", "created_at"),
+        Index("ix_reviews_user_id_product_id", "user_id", "product_id"),
+    )
 
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,10 +1,16 @@
 
 from app.repositories.base_repository import BaseRepository
+from app.repositories.cached_repository import CachedRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.product_repository import ProductRepository
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.repositories.async_product_repository import AsyncProductRepository
 
 __all__ = [
     "BaseRepository",
+    "CachedRepository",
     "UserRepository",
     "ProductRepository",
+    "AsyncBaseRepository",
+    "AsyncProductRepository",
 ]
@@ -34,42 +34,37 @@ class ActivityLogRepository(BaseRepository[ActivityLog]):
 
     def create(self, entity: ActivityLog) -> ActivityLog:
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except SQLAlchemyError as e:
             logger.error(f"Error creating activity log: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[ActivityLog]:
         try:
-            log = self.get_by_id(id)
-            if log:
-                for key, value in data.items():
-                    if hasattr(log, key) and key != 'id':
-                        setattr(log, key, value)
-                if self._commit():
-                    self._refresh(log)
+            with self._savepoint():
+                log = self.get_by_id(id)
+                if log:
+                    for key, value in data.items():
+                        if hasattr(log, key) and key != 'id':
+                            setattr(log, key, value)
                     return log
-            return None
+                return None
         except SQLAlchemyError as e:
             logger.error(f"Error updating activity log {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
         try:
-            log = self.get_by_id(id)
-            if log:
-                self._db.delete(log)
-                return self._commit()
-            return False
+            with self._savepoint():
+                log = self.get_by_id(id)
+                if log:
+                    self._db.delete(log)
+                    return True
+                return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting activity log {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_by_actor(self, actor: str, skip: int = 0, limit: int = 100) -> List[ActivityLog]:
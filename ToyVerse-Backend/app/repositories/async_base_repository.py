@@ -0,0 +1,46 @@
+
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar, List, Optional, Type
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+class AsyncBaseRepository(ABC, Generic[T]):
+
+    def __init__(self, model: Type[T], db: AsyncSession):
+
+        self._model = model
+        self._db = db
+
+    @abstractmethod
+    async def get_by_id(self, id: int) -> Optional[T]:
+
+        pass
+
+    @abstractmethod
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
+
+        pass
+
+    async def exists(self, id: int) -> bool:
+
+        try:
+            result = await self._db.execute(select(self._model.id).where(self._model.id == id))
+            return result.first() is not None
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking existence: {e}")
+            return False
+
+    async def count(self) -> int:
+
+        try:
+            result = await self._db.execute(select(func.count()).select_from(self._model))
+            return result.scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting entities: {e}")
+            return 0
@@ -0,0 +1,86 @@
+
+from typing import Optional, List
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+class AsyncProductRepository(AsyncBaseRepository[Product]):
+
+    def __init__(self, db: AsyncSession):
+
+        super().__init__(Product, db)
+
+    async def get_by_id(self, id: int) -> Optional[Product]:
+
+        try:
+            result = await self._db.execute(select(Product).where(Product.id == id))
+            return result.scalars().first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting product by ID {id}: {e}")
+            return None
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
+
+        try:
+            result = await self._db.execute(
+                select(Product)
+                .order_by(Product.id)
+                .offset(skip)
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting all products: {e}")
+            return []
+
+    async def get_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[Product]:
+
+        return await self.filter_products(category=category, skip=skip, limit=limit)
+
+    async def search(self, query: str, skip: int = 0, limit: int = 100) -> List[Product]:
+
+        return await self.filter_products(search=query, skip=skip, limit=limit)
+
+    async def filter_products(
+        self,
+        category: Optional[str] = None,
+        price_max: Optional[float] = None,
+        rating: Optional[int] = None,
+        in_stock: Optional[bool] = None,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Product]:
+
+        try:
+
+            query = select(Product).order_by(Product.id)
+
+            if category:
+                query = query.where(Product.category == category)
+            if price_max:
+                query = query.where(Product.price <= price_max)
+            if rating:
+                query = query.where(Product.rating >= rating)
+            if in_stock:
+                query = query.where(Product.stock > 0)
+            if search:
+                search_pattern = f"%{search}%"
+                query = query.where(
+                    or_(
+                        Product.title.ilike(search_pattern),
+                        Product.description.ilike(search_pattern)
+                    )
+                )
+
+            result = await self._db.execute(query.offset(skip).limit(limit))
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error(f"Error filtering products: {e}")
+            return []
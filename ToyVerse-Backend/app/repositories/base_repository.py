@@ -1,10 +1,14 @@
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional, Type, Dict, Any
-from sqlalchemy.orm import Session
+from typing import Generic, TypeVar, List, Optional, Type, Dict, Any, Callable
+from sqlalchemy import insert, update, delete
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.sql import Executable
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
+from app.core.unit_of_work import UnitOfWork
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -58,16 +62,100 @@ class BaseRepository(ABC, Generic[T]):
             logger.error(f"Error counting entities: {e}")
             return 0
 
-    def _commit(self) -> bool:
+    def create_many(self, rows: List[Dict[str, Any]]) -> int:
+
+        if not rows:
+            return 0
+
+        try:
+            with self._savepoint():
+                self._db.execute(insert(self._model), rows)
+                return len(rows)
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk creating {self._model.__name__}: {e}")
+            return 0
+
+    def update_many(self, values_by_id: Dict[int, Dict[str, Any]]) -> int:
+
+        if not values_by_id:
+            return 0
+
+        try:
+            with self._savepoint():
+                self._db.execute(
+                    update(self._model),
+                    [{"id": id, **values} for id, values in values_by_id.items()]
+                )
+                self._expire(values_by_id.keys())
+                return len(values_by_id)
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk updating {self._model.__name__}: {e}")
+            return 0
+
+    def delete_where(self, *criteria) -> int:
+
+        try:
+            with self._savepoint():
+                result = self._db.execute(
+                    delete(self._model)
+                    .where(*criteria)
+                    .execution_options(synchronize_session="fetch")
+                )
+                return result.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk deleting {self._model.__name__}: {e}")
+            return 0
+
+    def commit(self) -> bool:
 
         try:
-            self._db.commit()
+            UnitOfWork.for_session(self._db).commit()
             return True
         except SQLAlchemyError as e:
             logger.error(f"Database commit error: {e}")
             self._db.rollback()
             return False
 
+    def release(self) -> bool:
+
+        if UnitOfWork.for_session(self._db).has_pending_writes:
+            return False
+
+        self._db.close()
+        return True
+
+    def attach(self, entity: T) -> T:
+
+        self._db.add(entity)
+        return entity
+
+    def rollback(self) -> None:
+
+        UnitOfWork.for_session(self._db).rollback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+
+        UnitOfWork.for_session(self._db).after_commit(callback)
+
+    def _savepoint(self) -> SessionTransaction:
+
+        return self._db.begin_nested()
+
+    def _expire(self, ids) -> None:
+
+        ids = set(ids)
+        for entity in list(self._db.identity_map.values()):
+            if isinstance(entity, self._model) and entity.id in ids:
+                self._db.expire(entity)
+
+    def _first(self, statement: Executable, **params) -> Optional[T]:
+
+        return self._db.execute(statement, params).scalars().first()
+
+    def _all(self, statement: Executable, **params) -> List[T]:
+
+        return list(self._db.execute(statement, params).scalars().all())
+
     def _refresh(self, entity: T) -> T:
 
         self._db.refresh(entity)
@@ -0,0 +1,102 @@
+
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from app.core.cache import RepositoryCache, repository_cache
+from app.core.unit_of_work import UnitOfWork
+from app.repositories.base_repository import BaseRepository
+
+WRITE_METHODS = ("create", "update", "delete", "create_many", "update_many", "delete_where")
+
+class CachedRepository:
+
+    def __init__(
+        self,
+        repository: BaseRepository,
+        ttls: Dict[str, float],
+        writes: Iterable[str] = (),
+        namespace: Optional[str] = None,
+        cache: Optional[RepositoryCache] = None
+    ):
+
+        self._repository = repository
+        self._ttls = dict(ttls)
+        self._writes = set(WRITE_METHODS) | set(writes)
+        self._namespace = namespace or repository._model.__tablename__
+        self._cache = cache or repository_cache
+
+    @property
+    def repository(self) -> BaseRepository:
+
+        return self._repository
+
+    @property
+    def namespace(self) -> str:
+
+        return self._namespace
+
+    def invalidate(self) -> None:
+
+        self._cache.invalidate(self._namespace)
+
+    def __getattr__(self, name: str) -> Any:
+
+        attribute = getattr(self._repository, name)
+
+        if name in self._ttls:
+            attribute = self._cached_read(name, attribute)
+        elif name in self._writes:
+            attribute = self._invalidating_write(attribute)
+        else:
+            return attribute
+
+        setattr(self, name, attribute)
+        return attribute
+
+    def _cached_read(self, name: str, method: Callable) -> Callable:
+
+        ttl = self._ttls[name]
+
+        @wraps(method)
+        def read(*args, **kwargs):
+
+            if not self._cache.enabled:
+                return method(*args, **kwargs)
+
+            unit_of_work = UnitOfWork.for_session(self._repository._db)
+            if not unit_of_work.read_only or unit_of_work.has_pending_writes:
+                self._cache.record_bypass(self._namespace)
+                return method(*args, **kwargs)
+
+            key = self._cache.key(self._namespace, name, args, kwargs)
+            hit, value = self._cache.get(self._namespace, key)
+            if hit:
+                return self._attach(value)
+
+            value = method(*args, **kwargs)
+            self._cache.set(self._namespace, key, value, ttl)
+            return value
+
+        return read
+
+    def _invalidating_write(self, method: Callable) -> Callable:
+
+        @wraps(method)
+        def write(*args, **kwargs):
+
+            result = method(*args, **kwargs)
+            self.invalidate()
+            self._repository.after_commit(self.invalidate)
+            return result
+
+        return write
+
+    def _attach(self, value: Any) -> Any:
+
+        if isinstance(value, list):
+            return [self._attach(item) for item in value]
+
+        if isinstance(value, self._repository._model):
+            return self._repository._db.merge(value, load=False)
+
+        return value
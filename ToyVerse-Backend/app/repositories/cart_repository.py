@@ -1,4 +1,5 @@
 from typing import Optional, List, Dict, Any
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -8,13 +9,19 @@ from app.models.cart import CartItem
 
 logger = logging.getLogger(__name__)
 
+CART_ITEMS_BY_USER = select(CartItem).where(CartItem.user_id == bindparam("user_id"))
+CART_ITEM_BY_USER_AND_PRODUCT = select(CartItem).where(
+    CartItem.user_id == bindparam("user_id"),
+    CartItem.product_id == bindparam("product_id")
+).limit(1)
+
 class CartRepository(BaseRepository[CartItem]):
     def __init__(self, db: Session):
         super().__init__(CartItem, db)
 
     def get_by_id(self, id: int) -> Optional[CartItem]:
         try:
-            return self._db.query(CartItem).filter(CartItem.id == id).first()
+            return self._db.get(CartItem, id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting cart item by ID {id}: {e}")
             return None
@@ -28,66 +35,52 @@ class CartRepository(BaseRepository[CartItem]):
 
     def create(self, entity: CartItem) -> CartItem:
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except SQLAlchemyError as e:
             logger.error(f"Error creating cart item: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[CartItem]:
         try:
-            cart_item = self.get_by_id(id)
-            if cart_item:
-                for key, value in data.items():
-                    if hasattr(cart_item, key) and key != 'id':
-                        setattr(cart_item, key, value)
-                if self._commit():
-                    self._refresh(cart_item)
+            with self._savepoint():
+                cart_item = self.get_by_id(id)
+                if cart_item:
+                    for key, value in data.items():
+                        if hasattr(cart_item, key) and key != 'id':
+                            setattr(cart_item, key, value)
                     return cart_item
-            return None
+                return None
         except SQLAlchemyError as e:
             logger.error(f"Error updating cart item {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
         try:
-            cart_item = self.get_by_id(id)
-            if cart_item:
-                self._db.delete(cart_item)
-                return self._commit()
-            return False
+            with self._savepoint():
+                cart_item = self.get_by_id(id)
+                if cart_item:
+                    self._db.delete(cart_item)
+                    return True
+                return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting cart item {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_by_user_id(self, user_id: int) -> List[CartItem]:
         try:
-            return self._db.query(CartItem).filter(CartItem.user_id == user_id).all()
+            return self._all(CART_ITEMS_BY_USER, user_id=user_id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting cart items for user {user_id}: {e}")
             return []
 
     def get_by_user_and_product(self, user_id: int, product_id: int) -> Optional[CartItem]:
         try:
-            return self._db.query(CartItem).filter(
-                CartItem.user_id == user_id,
-                CartItem.product_id == product_id
-            ).first()
+            return self._first(CART_ITEM_BY_USER_AND_PRODUCT, user_id=user_id, product_id=product_id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting cart item: {e}")
             return None
 
     def clear_user_cart(self, user_id: int) -> bool:
-        try:
-            self._db.query(CartItem).filter(CartItem.user_id == user_id).delete()
-            return self._commit()
-        except SQLAlchemyError as e:
-            logger.error(f"Error clearing cart for user {user_id}: {e}")
-            self._db.rollback()
-            return False
+        return self.delete_where(CartItem.user_id == user_id) >= 0
@@ -34,42 +34,37 @@ class ChatRepository(BaseRepository[ChatMessage]):
 
     def create(self, entity: ChatMessage) -> ChatMessage:
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except SQLAlchemyError as e:
             logger.error(f"Error creating chat message: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[ChatMessage]:
         try:
-            message = self.get_by_id(id)
-            if message:
-                for key, value in data.items():
-                    if hasattr(message, key) and key != 'id':
-                        setattr(message, key, value)
-                if self._commit():
-                    self._refresh(message)
+            with self._savepoint():
+                message = self.get_by_id(id)
+                if message:
+                    for key, value in data.items():
+                        if hasattr(message, key) and key != 'id':
+                            setattr(message, key, value)
                     return message
-            return None
+                return None
         except SQLAlchemyError as e:
             logger.error(f"Error updating chat message {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
         try:
-            message = self.get_by_id(id)
-            if message:
-                self._db.delete(message)
-                return self._commit()
-            return False
+            with self._savepoint():
+                message = self.get_by_id(id)
+                if message:
+                    self._db.delete(message)
+                    return True
+                return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting chat message {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_by_session(self, session_id: str, skip: int = 0, limit: int = 50) -> List[ChatMessage]:
@@ -102,9 +97,9 @@ class ChatRepository(BaseRepository[ChatMessage]):
 
     def clear_session(self, session_id: str) -> bool:
         try:
-            self._db.query(ChatMessage).filter(ChatMessage.session_id == session_id).delete()
-            return self._commit()
+            with self._savepoint():
+                self._db.query(ChatMessage).filter(ChatMessage.session_id == session_id).delete()
+                return True
         except SQLAlchemyError as e:
             logger.error(f"Error clearing session {session_id}: {e}")
-            self._db.rollback()
             return False
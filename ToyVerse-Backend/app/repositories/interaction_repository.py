@@ -1,5 +1,6 @@
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.models.product_interaction import ProductInteraction
 from app.repositories.base_repository import BaseRepository
@@ -7,19 +8,42 @@ from app.repositories.base_repository import BaseRepository
 class InteractionRepository(BaseRepository[ProductInteraction]):
 
     def __init__(self, db: Session):
-        super().__init__(db, ProductInteraction)
+        super().__init__(ProductInteraction, db)
 
     def get_by_id(self, interaction_id: int) -> Optional[ProductInteraction]:
 
-        return self._db.query(self._model).filter(self._model.id == interaction_id).first()
+        return self._db.get(self._model, interaction_id)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[ProductInteraction]:
+
+        return (
+            self._db.query(self._model)
+            .order_by(self._model.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     def create(self, interaction: ProductInteraction) -> ProductInteraction:
 
         self._db.add(interaction)
-        self._db.commit()
-        self._db.refresh(interaction)
+        self._db.flush()
+        return interaction
+
+    def update(self, interaction_id: int, data: Dict[str, Any]) -> Optional[ProductInteraction]:
+
+        interaction = self.get_by_id(interaction_id)
+        if interaction:
+            for key, value in data.items():
+                if hasattr(interaction, key) and key != 'id':
+                    setattr(interaction, key, value)
+            self._db.flush()
         return interaction
 
+    def delete(self, interaction_id: int) -> bool:
+
+        return self.delete_where(self._model.id == interaction_id) > 0
+
     def get_user_interactions(
         self,
         user_id: int,
@@ -62,6 +86,44 @@ class InteractionRepository(BaseRepository[ProductInteraction]):
             .all()
         )
 
+    def get_max_id(self) -> int:
+
+        from sqlalchemy import func
+
+        return self._db.query(func.max(self._model.id)).scalar() or 0
+
+    def get_actor_product_counts(
+        self,
+        after_id: int = 0,
+        up_to_id: Optional[int] = None
+    ) -> List[Tuple[Optional[int], Optional[str], int, int]]:
+
+        from sqlalchemy import func
+
+        query = self._db.query(
+            self._model.user_id,
+            self._model.session_id,
+            self._model.product_id,
+            func.count(self._model.id)
+        ).filter(self._model.id > after_id)
+
+        if up_to_id is not None:
+            query = query.filter(self._model.id <= up_to_id)
+
+        return (
+            query
+            .group_by(self._model.user_id, self._model.session_id, self._model.product_id)
+            .all()
+        )
+
+    def get_interaction_times(self, since: datetime) -> List[Tuple[int, datetime]]:
+
+        return (
+            self._db.query(self._model.product_id, self._model.timestamp)
+            .filter(self._model.timestamp >= since)
+            .all()
+        )
+
     def get_popular_products(self, limit: int = 10) -> List[dict]:
 
         from sqlalchemy import func
@@ -1,4 +1,5 @@
 from typing import Optional, List, Dict, Any
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -8,13 +9,21 @@ from app.models.order import Order
 
 logger = logging.getLogger(__name__)
 
+ORDERS_BY_USER = (
+    select(Order)
+    .where(Order.user_id == bindparam("user_id"))
+    .order_by(Order.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
 class OrderRepository(BaseRepository[Order]):
     def __init__(self, db: Session):
         super().__init__(Order, db)
 
     def get_by_id(self, id: int) -> Optional[Order]:
         try:
-            return self._db.query(Order).filter(Order.id == id).first()
+            return self._db.get(Order, id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting order by ID {id}: {e}")
             return None
@@ -28,53 +37,42 @@ class OrderRepository(BaseRepository[Order]):
 
     def create(self, entity: Order) -> Order:
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except SQLAlchemyError as e:
             logger.error(f"Error creating order: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[Order]:
         try:
-            order = self.get_by_id(id)
-            if order:
-                for key, value in data.items():
-                    if hasattr(order, key) and key != 'id':
-                        setattr(order, key, value)
-                if self._commit():
-                    self._refresh(order)
+            with self._savepoint():
+                order = self.get_by_id(id)
+                if order:
+                    for key, value in data.items():
+                        if hasattr(order, key) and key != 'id':
+                            setattr(order, key, value)
                     return order
-            return None
+                return None
         except SQLAlchemyError as e:
             logger.error(f"Error updating order {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
         try:
-            order = self.get_by_id(id)
-            if order:
-                self._db.delete(order)
-                return self._commit()
-            return False
+            with self._savepoint():
+                order = self.get_by_id(id)
+                if order:
+                    self._db.delete(order)
+                    return True
+                return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting order {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Order]:
         try:
-            return (
-                self._db.query(Order)
-                .filter(Order.user_id == user_id)
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
+            return self._all(ORDERS_BY_USER, user_id=user_id, skip=skip, limit=limit)
         except SQLAlchemyError as e:
             logger.error(f"Error getting orders for user {user_id}: {e}")
             return []
@@ -1,8 +1,8 @@
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import or_
+from sqlalchemy import or_, case, select, update
 import logging
 
 from app.repositories.base_repository import BaseRepository
@@ -19,7 +19,7 @@ class ProductRepository(BaseRepository[Product]):
     def get_by_id(self, id: int) -> Optional[Product]:
 
         try:
-            return self._db.query(Product).filter(Product.id == id).first()
+            return self._db.get(Product, id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting product by ID {id}: {e}")
             return None
@@ -42,44 +42,39 @@ class ProductRepository(BaseRepository[Product]):
     def create(self, entity: Product) -> Product:
 
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except SQLAlchemyError as e:
             logger.error(f"Error creating product: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[Product]:
 
         try:
-            product = self.get_by_id(id)
-            if product:
-                for key, value in data.items():
-                    if hasattr(product, key) and key != 'id':
-                        setattr(product, key, value)
-                if self._commit():
-                    self._refresh(product)
+            with self._savepoint():
+                product = self.get_by_id(id)
+                if product:
+                    for key, value in data.items():
+                        if hasattr(product, key) and key != 'id':
+                            setattr(product, key, value)
                     return product
-            return None
+                return None
         except SQLAlchemyError as e:
             logger.error(f"Error updating product {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
 
         try:
-            product = self.get_by_id(id)
-            if product:
-                self._db.delete(product)
-                return self._commit()
-            return False
+            with self._savepoint():
+                product = self.get_by_id(id)
+                if product:
+                    self._db.delete(product)
+                    return True
+                return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting product {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[Product]:
@@ -148,6 +143,47 @@ class ProductRepository(BaseRepository[Product]):
             logger.error(f"Error getting products by rating: {e}")
             return []
 
+    def get_top_rated(self, limit: int = 10) -> List[Product]:
+
+        try:
+            return (
+                self._db.query(Product)
+                .order_by((Product.rating * (Product.rating_count + 1)).desc(), Product.id)
+                .limit(limit)
+                .all()
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting top rated products: {e}")
+            return []
+
+    def get_content_fields(self) -> Optional[List[Tuple[int, Optional[str], Optional[str], Optional[str]]]]:
+
+        try:
+            return (
+                self._db.query(Product.id, Product.title, Product.description, Product.category)
+                .order_by(Product.id)
+                .all()
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting product content fields: {e}")
+            return None
+
+    def get_categories(self) -> Optional[List[Tuple[int, Optional[str]]]]:
+
+        try:
+            return self._db.query(Product.id, Product.category).order_by(Product.id).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting product categories: {e}")
+            return None
+
+    def get_existing_ids(self, product_ids: Iterable[int]) -> Set[int]:
+
+        try:
+            return set(self._db.scalars(select(Product.id).where(Product.id.in_(set(product_ids)))))
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking product IDs: {e}")
+            return set()
+
     def filter_products(
         self,
         category: Optional[str] = None,
@@ -184,3 +220,122 @@ class ProductRepository(BaseRepository[Product]):
         except SQLAlchemyError as e:
             logger.error(f"Error filtering products: {e}")
             return []
+
+    def apply_rating_delta(
+        self,
+        product_id: int,
+        added: Optional[int] = None,
+        removed: Optional[int] = None
+    ) -> bool:
+
+        try:
+            sum_delta = (added or 0) - (removed or 0)
+            count_delta = (1 if added else 0) - (1 if removed else 0)
+
+            new_sum = Product.rating_sum + sum_delta
+            new_count = Product.rating_count + count_delta
+
+            values = {
+                'rating_sum': new_sum,
+                'rating_count': new_count,
+                'rating': case(
+                    (new_count > 0, (2 * new_sum + new_count) // (2 * new_count)),
+                    else_=0
+                ),
+            }
+
+            if added != removed:
+                if added:
+                    column = getattr(Product, f"rating_{added}_count")
+                    values[f"rating_{added}_count"] = column + 1
+                if removed:
+                    column = getattr(Product, f"rating_{removed}_count")
+                    values[f"rating_{removed}_count"] = column - 1
+
+            with self._savepoint():
+                result = self._db.execute(
+                    update(Product)
+                    .where(Product.id == product_id)
+                    .values(**values)
+                    .execution_options(synchronize_session="fetch")
+                )
+                return result.rowcount == 1
+        except SQLAlchemyError as e:
+            logger.error(f"Error applying rating delta to product {product_id}: {e}")
+            return False
+
+    def reserve_stock(self, product_id: int, quantity: int) -> bool:
+
+        try:
+            with self._savepoint():
+                result = self._db.execute(
+                    update(Product)
+                    .where(Product.id == product_id, Product.stock >= quantity)
+                    .values(stock=Product.stock - quantity)
+                    .execution_options(synchronize_session=False)
+                )
+                self._expire([product_id])
+                return result.rowcount == 1
+        except SQLAlchemyError as e:
+            logger.error(f"Error reserving stock for product {product_id}: {e}")
+            return False
+
+    def get_rating_summaries(self, product_ids: List[int]) -> List[Dict[str, int]]:
+
+        try:
+            rows = (
+                self._db.query(
+                    Product.id,
+                    Product.rating_sum,
+                    Product.rating_count,
+                    Product.rating_1_count,
+                    Product.rating_2_count,
+                    Product.rating_3_count,
+                    Product.rating_4_count,
+                    Product.rating_5_count
+                )
+                .filter(Product.id.in_(product_ids))
+                .order_by(Product.id)
+                .all()
+            )
+            return [dict(row._mapping) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting rating summaries: {e}")
+            return []
+
+    def replace_rating_aggregates(self, aggregates: List[Dict[str, int]]) -> int:
+
+        try:
+            with self._savepoint():
+                self._db.execute(
+                    update(Product)
+                    .values(
+                        rating=0,
+                        rating_sum=0,
+                        rating_count=0,
+                        rating_1_count=0,
+                        rating_2_count=0,
+                        rating_3_count=0,
+                        rating_4_count=0,
+                        rating_5_count=0
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+
+                if aggregates:
+                    self._db.execute(
+                        update(Product),
+                        [
+                            {
+                                'id': row['product_id'],
+                                'rating': (2 * row['rating_sum'] + row['rating_count']) // (2 * row['rating_count']),
+                                **{key: value for key, value in row.items() if key != 'product_id'}
+                            }
+                            for row in aggregates
+                        ]
+                    )
+
+                return len(aggregates)
+        except SQLAlchemyError as e:
+            logger.error(f"Error replacing rating aggregates: {e}")
+            return 0
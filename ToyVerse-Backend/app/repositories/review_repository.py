@@ -1,20 +1,34 @@
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, func, case, and_, or_, select
 import logging
 
 from app.repositories.base_repository import BaseRepository
 from app.models.review import Review
+from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
+REVIEWS_BY_USER = (
+    select(Review)
+    .where(Review.user_id == bindparam("user_id"))
+    .order_by(Review.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+REVIEW_BY_USER_AND_PRODUCT = select(Review).where(
+    Review.user_id == bindparam("user_id"),
+    Review.product_id == bindparam("product_id")
+).limit(1)
+
 class ReviewRepository(BaseRepository[Review]):
     def __init__(self, db: Session):
         super().__init__(Review, db)
 
     def get_by_id(self, id: int) -> Optional[Review]:
         try:
-            return self._db.query(Review).filter(Review.id == id).first()
+            return self._db.get(Review, id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting review by ID {id}: {e}")
             return None
@@ -28,42 +42,37 @@ class ReviewRepository(BaseRepository[Review]):
 
     def create(self, entity: Review) -> Review:
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except SQLAlchemyError as e:
             logger.error(f"Error creating review: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[Review]:
         try:
-            review = self.get_by_id(id)
-            if review:
-                for key, value in data.items():
-                    if hasattr(review, key) and key != 'id':
-                        setattr(review, key, value)
-                if self._commit():
-                    self._refresh(review)
+            with self._savepoint():
+                review = self.get_by_id(id)
+                if review:
+                    for key, value in data.items():
+                        if hasattr(review, key) and key != 'id':
+                            setattr(review, key, value)
                     return review
-            return None
+                return None
         except SQLAlchemyError as e:
             logger.error(f"Error updating review {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
         try:
-            review = self.get_by_id(id)
-            if review:
-                self._db.delete(review)
-                return self._commit()
-            return False
+            with self._savepoint():
+                review = self.get_by_id(id)
+                if review:
+                    self._db.delete(review)
+                    return True
+                return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting review {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_by_product_id(self, product_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
@@ -79,25 +88,77 @@ class ReviewRepository(BaseRepository[Review]):
             logger.error(f"Error getting reviews for product {product_id}: {e}")
             return []
 
-    def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
+    def get_product_reviews_page(
+        self,
+        product_id: int,
+        sort: str = "newest",
+        after: Optional[Dict[str, Any]] = None,
+        limit: int = 20
+    ) -> List[Review]:
         try:
-            return (
+            query = (
                 self._db.query(Review)
-                .filter(Review.user_id == user_id)
-                .offset(skip)
-                .limit(limit)
-                .all()
+                .options(joinedload(Review.user).load_only(User.id, User.username, User.role))
+                .filter(Review.product_id == product_id)
             )
+
+            if sort == "rating":
+                query = query.order_by(Review.rating.desc(), Review.created_at.desc(), Review.id.desc())
+            else:
+                query = query.order_by(Review.created_at.desc(), Review.id.desc())
+
+            if after:
+                older = or_(
+                    Review.created_at < after['created_at'],
+                    and_(Review.created_at == after['created_at'], Review.id < after['id'])
+                )
+                if sort == "rating":
+                    older = or_(
+                        Review.rating < after['rating'],
+                        and_(Review.rating == after['rating'], older)
+                    )
+                query = query.filter(older)
+
+            return query.limit(limit).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting review page for product {product_id}: {e}")
+            return []
+
+    def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
+        try:
+            return self._all(REVIEWS_BY_USER, user_id=user_id, skip=skip, limit=limit)
         except SQLAlchemyError as e:
             logger.error(f"Error getting reviews by user {user_id}: {e}")
             return []
 
     def get_user_review_for_product(self, user_id: int, product_id: int) -> Optional[Review]:
         try:
-            return self._db.query(Review).filter(
-                Review.user_id == user_id,
-                Review.product_id == product_id
-            ).first()
+            return self._first(REVIEW_BY_USER_AND_PRODUCT, user_id=user_id, product_id=product_id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting user review: {e}")
             return None
+
+    def get_rating_aggregates(self, product_ids: Optional[List[int]] = None) -> List[Dict[str, int]]:
+        try:
+            star_columns = [
+                func.sum(case((Review.rating == star, 1), else_=0)).label(f"rating_{star}_count")
+                for star in range(1, 6)
+            ]
+
+            query = self._db.query(
+                Review.product_id,
+                func.count(Review.id).label('rating_count'),
+                func.sum(Review.rating).label('rating_sum'),
+                *star_columns
+            )
+
+            if product_ids is not None:
+                query = query.filter(Review.product_id.in_(product_ids))
+
+            return [
+                {key: int(value or 0) for key, value in row._mapping.items()}
+                for row in query.group_by(Review.product_id).all()
+            ]
+        except SQLAlchemyError as e:
+            logger.error(f"Error aggregating review ratings: {e}")
+            return []
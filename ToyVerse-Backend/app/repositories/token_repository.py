@@ -0,0 +1,167 @@
+
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from sqlalchemy import update, delete
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+import logging
+
+from app.repositories.base_repository import BaseRepository
+from app.models.auth_token import RefreshToken, RevokedToken
+
+logger = logging.getLogger(__name__)
+
+class TokenRepository(BaseRepository[RefreshToken]):
+
+    def __init__(self, db: Session):
+
+        super().__init__(RefreshToken, db)
+
+    def get_by_id(self, id: int) -> Optional[RefreshToken]:
+
+        try:
+            return self._db.query(RefreshToken).filter(RefreshToken.id == id).first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting refresh token by ID {id}: {e}")
+            return None
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[RefreshToken]:
+
+        try:
+            return self._db.query(RefreshToken).offset(skip).limit(limit).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting all refresh tokens: {e}")
+            return []
+
+    def create(self, entity: RefreshToken) -> Optional[RefreshToken]:
+
+        try:
+            with self._savepoint():
+                self._db.add(entity)
+                return entity
+        except SQLAlchemyError as e:
+            logger.error(f"Error creating refresh token: {e}")
+            return None
+
+    def update(self, id: int, data: Dict[str, Any]) -> Optional[RefreshToken]:
+
+        try:
+            with self._savepoint():
+                token = self.get_by_id(id)
+                if token:
+                    for key, value in data.items():
+                        if hasattr(token, key) and key != 'id':
+                            setattr(token, key, value)
+                    return token
+                return None
+        except SQLAlchemyError as e:
+            logger.error(f"Error updating refresh token {id}: {e}")
+            return None
+
+    def delete(self, id: int) -> bool:
+
+        try:
+            with self._savepoint():
+                token = self.get_by_id(id)
+                if token:
+                    self._db.delete(token)
+                    return True
+                return False
+        except SQLAlchemyError as e:
+            logger.error(f"Error deleting refresh token {id}: {e}")
+            return False
+
+    def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+
+        try:
+            return self._db.query(RefreshToken).filter(RefreshToken.token_hash == token_hash).first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting refresh token by hash: {e}")
+            return None
+
+    def rotate(self, current: RefreshToken, replacement: RefreshToken) -> bool:
+
+        try:
+            with self._savepoint():
+                result = self._db.execute(
+                    update(RefreshToken)
+                    .where(RefreshToken.id == current.id, RefreshToken.revoked_at.is_(None))
+                    .values(revoked_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+
+                if result.rowcount != 1:
+                    return False
+
+                self._db.add(replacement)
+                return True
+        except SQLAlchemyError as e:
+            logger.error(f"Error rotating refresh token {current.id}: {e}")
+            return False
+
+    def revoke_family(self, family_id: str) -> int:
+
+        return self._revoke_where(RefreshToken.family_id == family_id)
+
+    def revoke_user_tokens(self, user_id: int) -> int:
+
+        return self._revoke_where(RefreshToken.user_id == user_id)
+
+    def revoke_access_token(self, jti: str, user_id: Optional[int], expires_at: datetime) -> bool:
+
+        try:
+            with self._savepoint():
+                if self.is_access_token_revoked(jti):
+                    return True
+
+                self._db.add(RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at))
+                return True
+        except SQLAlchemyError as e:
+            logger.error(f"Error revoking access token: {e}")
+            return False
+
+    def is_access_token_revoked(self, jti: str) -> bool:
+
+        try:
+            return self._db.query(RevokedToken.id).filter(RevokedToken.jti == jti).first() is not None
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking revoked token: {e}")
+            return False
+
+    def get_revoked_token_ids(self, since: Optional[datetime] = None) -> List[str]:
+
+        try:
+            query = self._db.query(RevokedToken.jti).filter(RevokedToken.expires_at > datetime.utcnow())
+            if since is not None:
+                query = query.filter(RevokedToken.created_at >= since)
+            return [jti for (jti,) in query.all()]
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting revoked token ids: {e}")
+            return []
+
+    def purge_expired(self) -> int:
+
+        try:
+            with self._savepoint():
+                now = datetime.utcnow()
+                revoked = self._db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+                refresh = self._db.execute(delete(RefreshToken).where(RefreshToken.expires_at <= now))
+                return revoked.rowcount + refresh.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"Error purging expired tokens: {e}")
+            return 0
+
+    def _revoke_where(self, condition) -> int:
+
+        try:
+            with self._savepoint():
+                result = self._db.execute(
+                    update(RefreshToken)
+                    .where(condition, RefreshToken.revoked_at.is_(None))
+                    .values(revoked_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                return result.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"Error revoking refresh tokens: {e}")
+            return 0
@@ -1,5 +1,6 @@
 
 from typing import Optional, List, Dict, Any
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -9,6 +10,11 @@ from app.models.user import User, Admin, Customer
 
 logger = logging.getLogger(__name__)
 
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username")).limit(1)
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+USER_ID_BY_USERNAME = select(User.id).where(User.username == bindparam("username")).limit(1)
+USER_ID_BY_EMAIL = select(User.id).where(User.email == bindparam("email")).limit(1)
+
 class UserRepository(BaseRepository[User]):
 
     def __init__(self, db: Session):
@@ -18,7 +24,7 @@ class UserRepository(BaseRepository[User]):
     def get_by_id(self, id: int) -> Optional[User]:
 
         try:
-            return self._db.query(User).filter(User.id == id).first()
+            return self._db.get(User, id)
         except SQLAlchemyError as e:
             logger.error(f"Error getting user by ID {id}: {e}")
             return None
@@ -34,50 +40,45 @@ class UserRepository(BaseRepository[User]):
     def create(self, entity: User) -> User:
 
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except SQLAlchemyError as e:
             logger.error(f"Error creating user: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[User]:
 
         try:
-            user = self.get_by_id(id)
-            if user:
-                for key, value in data.items():
-                    if hasattr(user, key) and key != 'id':
-                        setattr(user, key, value)
-                if self._commit():
-                    self._refresh(user)
+            with self._savepoint():
+                user = self.get_by_id(id)
+                if user:
+                    for key, value in data.items():
+                        if hasattr(user, key) and key != 'id':
+                            setattr(user, key, value)
                     return user
-            return None
+                return None
         except SQLAlchemyError as e:
             logger.error(f"Error updating user {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
 
         try:
-            user = self.get_by_id(id)
-            if user:
-                self._db.delete(user)
-                return self._commit()
-            return False
+            with self._savepoint():
+                user = self.get_by_id(id)
+                if user:
+                    self._db.delete(user)
+                    return True
+                return False
         except SQLAlchemyError as e:
             logger.error(f"Error deleting user {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_by_username(self, username: str) -> Optional[User]:
 
         try:
-            return self._db.query(User).filter(User.username == username).first()
+            return self._first(USER_BY_USERNAME, username=username)
         except SQLAlchemyError as e:
             logger.error(f"Error getting user by username {username}: {e}")
             return None
@@ -85,7 +86,7 @@ class UserRepository(BaseRepository[User]):
     def get_by_email(self, email: str) -> Optional[User]:
 
         try:
-            return self._db.query(User).filter(User.email == email).first()
+            return self._first(USER_BY_EMAIL, email=email)
         except SQLAlchemyError as e:
             logger.error(f"Error getting user by email {email}: {e}")
             return None
@@ -93,7 +94,7 @@ class UserRepository(BaseRepository[User]):
     def username_exists(self, username: str) -> bool:
 
         try:
-            return self._db.query(User).filter(User.username == username).first() is not None
+            return self._first(USER_ID_BY_USERNAME, username=username) is not None
         except SQLAlchemyError as e:
             logger.error(f"Error checking username existence: {e}")
             return False
@@ -101,7 +102,7 @@ class UserRepository(BaseRepository[User]):
     def email_exists(self, email: str) -> bool:
 
         try:
-            return self._db.query(User).filter(User.email == email).first() is not None
+            return self._first(USER_ID_BY_EMAIL, email=email) is not None
         except SQLAlchemyError as e:
             logger.error(f"Error checking email existence: {e}")
             return False
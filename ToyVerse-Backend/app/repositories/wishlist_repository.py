@@ -1,10 +1,20 @@
 
 from typing import List, Optional, Dict, Any
 import logging
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 from app.models.wishlist import Wishlist
 from app.repositories.base_repository import BaseRepository
 
+WISHLIST_ITEM_BY_USER_AND_PRODUCT = select(Wishlist).where(
+    Wishlist.user_id == bindparam("user_id"),
+    Wishlist.product_id == bindparam("product_id")
+).limit(1)
+WISHLIST_ID_BY_USER_AND_PRODUCT = select(Wishlist.id).where(
+    Wishlist.user_id == bindparam("user_id"),
+    Wishlist.product_id == bindparam("product_id")
+).limit(1)
+
 class WishlistRepository(BaseRepository[Wishlist]):
 
     def __init__(self, db: Session):
@@ -13,7 +23,7 @@ class WishlistRepository(BaseRepository[Wishlist]):
     def get_by_id(self, id: int) -> Optional[Wishlist]:
 
         try:
-            return self._db.query(Wishlist).filter(Wishlist.id == id).first()
+            return self._db.get(Wishlist, id)
         except Exception as e:
             logger = logging.getLogger(__name__)
             logger.error(f"Error getting wishlist item by id {id}: {e}")
@@ -37,47 +47,42 @@ class WishlistRepository(BaseRepository[Wishlist]):
     def create(self, entity: Wishlist) -> Optional[Wishlist]:
 
         try:
-            self._db.add(entity)
-            if self._commit():
-                self._refresh(entity)
+            with self._savepoint():
+                self._db.add(entity)
                 return entity
-            return None
         except Exception as e:
             logger = logging.getLogger(__name__)
             logger.error(f"Error creating wishlist item: {e}")
-            self._db.rollback()
             return None
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[Wishlist]:
 
         try:
-            item = self.get_by_id(id)
-            if item:
-                for key, value in data.items():
-                    if hasattr(item, key) and key != 'id':
-                        setattr(item, key, value)
-                if self._commit():
-                    self._refresh(item)
+            with self._savepoint():
+                item = self.get_by_id(id)
+                if item:
+                    for key, value in data.items():
+                        if hasattr(item, key) and key != 'id':
+                            setattr(item, key, value)
                     return item
-            return None
+                return None
         except Exception as e:
             logger = logging.getLogger(__name__)
             logger.error(f"Error updating wishlist item {id}: {e}")
-            self._db.rollback()
             return None
 
     def delete(self, id: int) -> bool:
 
         try:
-            item = self.get_by_id(id)
-            if item:
-                self._db.delete(item)
-                return self._commit()
-            return False
+            with self._savepoint():
+                item = self.get_by_id(id)
+                if item:
+                    self._db.delete(item)
+                    return True
+                return False
         except Exception as e:
             logger = logging.getLogger(__name__)
             logger.error(f"Error deleting wishlist item {id}: {e}")
-            self._db.rollback()
             return False
 
     def get_user_wishlist(self, user_id: int) -> List[Wishlist]:
@@ -90,23 +95,18 @@ class WishlistRepository(BaseRepository[Wishlist]):
 
     def find_by_user_and_product(self, user_id: int, product_id: int) -> Optional[Wishlist]:
 
-        return self._db.query(Wishlist).filter(
-            Wishlist.user_id == user_id,
-            Wishlist.product_id == product_id
-        ).first()
+        return self._first(WISHLIST_ITEM_BY_USER_AND_PRODUCT, user_id=user_id, product_id=product_id)
 
     def delete_by_user_and_product(self, user_id: int, product_id: int) -> bool:
 
-        item = self.find_by_user_and_product(user_id, product_id)
-        if item:
-            self._db.delete(item)
-            self._db.commit()
-            return True
-        return False
+        return self.delete_where(
+            Wishlist.user_id == user_id,
+            Wishlist.product_id == product_id
+        ) > 0
 
     def is_in_wishlist(self, user_id: int, product_id: int) -> bool:
 
-        return self.find_by_user_and_product(user_id, product_id) is not None
+        return self._first(WISHLIST_ID_BY_USER_AND_PRODUCT, user_id=user_id, product_id=product_id) is not None
 
     def get_wishlist_product_ids(self, user_id: int) -> List[int]:
 
@@ -1,5 +1,5 @@
 
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from decimal import Decimal
@@ -39,6 +39,9 @@ class ProductResponse(ProductBase):
     updated_at: datetime
     is_in_stock: bool = Field(..., description="Whether product is in stock")
     formatted_price: str = Field(..., description="Formatted price string")
+    average_rating: float = Field(default=0.0, description="Mean review rating (0-5)")
+    rating_count: int = Field(default=0, description="Number of reviews")
+    rating_histogram: Dict[str, int] = Field(default_factory=dict, description="Review count per star (1-5)")
 
     class Config:
 
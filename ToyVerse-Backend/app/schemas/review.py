@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Dict
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -22,3 +22,9 @@ class ReviewResponse(ReviewBase):
 
     class Config:
         from_attributes = True
+
+class ReviewSummary(BaseModel):
+    product_id: int
+    count: int = Field(..., description="Number of reviews")
+    average: float = Field(..., description="Mean rating (0 when unreviewed)")
+    histogram: Dict[str, int] = Field(..., description="Review count per star (1-5)")
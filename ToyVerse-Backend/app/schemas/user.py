@@ -54,9 +54,18 @@ class UserUpdate(BaseModel):
 class Token(BaseModel):
 
     access_token: str = Field(..., description="JWT access token")
+    refresh_token: Optional[str] = Field(None, description="Single-use refresh token")
     token_type: str = Field(default="bearer", description="Token type")
     user: UserResponse = Field(..., description="Authenticated user information")
 
+class RefreshRequest(BaseModel):
+
+    refresh_token: str = Field(..., description="Refresh token issued at login or by the last refresh")
+
+class LogoutRequest(BaseModel):
+
+    refresh_token: Optional[str] = Field(None, description="Refresh token to revoke along with the access token")
+
 class TokenData(BaseModel):
 
     username: Optional[str] = None
@@ -2,9 +2,13 @@
 from app.services.base_service import BaseService
 from app.services.auth_service import AuthService
 from app.services.product_service import ProductService
+from app.services.async_base_service import AsyncBaseService
+from app.services.async_product_service import AsyncProductService
 
 __all__ = [
     "BaseService",
     "AuthService",
     "ProductService",
+    "AsyncBaseService",
+    "AsyncProductService",
 ]
@@ -0,0 +1,50 @@
+
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar, Optional, List
+import logging
+
+from app.repositories.async_base_repository import AsyncBaseRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+class AsyncBaseService(ABC, Generic[T]):
+
+    def __init__(self, repository: AsyncBaseRepository[T]):
+
+        self._repository = repository
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @abstractmethod
+    async def get_by_id(self, id: int) -> Optional[T]:
+
+        pass
+
+    @abstractmethod
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
+
+        pass
+
+    def _log_operation(self, operation: str, entity_id: Optional[int] = None) -> None:
+
+        if entity_id:
+            self._logger.info(f"{operation} - Entity ID: {entity_id}")
+        else:
+            self._logger.info(f"{operation}")
+
+    async def exists(self, id: int) -> bool:
+
+        try:
+            return await self._repository.exists(id)
+        except Exception as e:
+            self._logger.error(f"Error checking existence: {e}")
+            return False
+
+    async def count(self) -> int:
+
+        try:
+            return await self._repository.count()
+        except Exception as e:
+            self._logger.error(f"Error counting entities: {e}")
+            return 0
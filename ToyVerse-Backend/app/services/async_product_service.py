@@ -0,0 +1,66 @@
+
+from typing import Optional, List
+from decimal import Decimal
+import logging
+
+from app.services.async_base_service import AsyncBaseService
+from app.repositories.async_product_repository import AsyncProductRepository
+from app.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+class AsyncProductService(AsyncBaseService[Product]):
+
+    def __init__(self, repository: AsyncProductRepository):
+
+        super().__init__(repository)
+
+    async def get_by_id(self, id: int) -> Optional[Product]:
+
+        try:
+            product = await self._repository.get_by_id(id)
+            if product:
+                self._log_operation("Product retrieved", id)
+            return product
+        except Exception as e:
+            self._logger.error(f"Error getting product: {e}")
+            return None
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
+
+        try:
+            products = await self._repository.get_all(skip, limit)
+            self._log_operation(f"Retrieved {len(products)} products")
+            return products
+        except Exception as e:
+            self._logger.error(f"Error getting all products: {e}")
+            return []
+
+    async def filter_products(
+        self,
+        category: Optional[str] = None,
+        price_max: Optional[Decimal] = None,
+        rating: Optional[int] = None,
+        in_stock: Optional[bool] = None,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Product]:
+
+        try:
+            products = await self._repository.filter_products(
+                category=category,
+                price_max=float(price_max) if price_max else None,
+                rating=rating,
+                in_stock=in_stock,
+                search=search,
+                skip=skip,
+                limit=limit
+            )
+
+            self._log_operation(f"Filter returned {len(products)} products")
+            return products
+
+        except Exception as e:
+            self._logger.error(f"Error filtering products: {e}")
+            return []
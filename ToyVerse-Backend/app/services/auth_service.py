@@ -1,21 +1,35 @@
 
-from typing import Optional, Dict, Any
-from datetime import timedelta
+from typing import Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
+import uuid
 import logging
 
 from app.services.base_service import BaseService
 from app.repositories.user_repository import UserRepository
+from app.repositories.token_repository import TokenRepository
 from app.models.user import User, create_user
-from app.core.security import password_handler, jwt_handler, create_access_token
+from app.models.auth_token import RefreshToken
+from app.core.config import settings
+from app.core.security import (
+    password_handler,
+    jwt_handler,
+    create_access_token,
+    get_token_id,
+    generate_refresh_token,
+    hash_refresh_token
+)
+from app.core.principal_cache import Principal, principal_cache
+from app.core.revocation import revocation_list
 from app.schemas.user import UserCreate, Token, UserResponse
 
 logger = logging.getLogger(__name__)
 
 class AuthService(BaseService[User]):
 
-    def __init__(self, repository: UserRepository):
+    def __init__(self, repository: UserRepository, token_repository: Optional[TokenRepository] = None):
 
         super().__init__(repository)
+        self._token_repository = token_repository
 
     def get_by_id(self, id: int) -> Optional[User]:
 
@@ -42,7 +56,10 @@ class AuthService(BaseService[User]):
         try:
             if not self._validate(data):
                 return None
-            return self._repository.update(id, data)
+            updated_user = self._repository.update(id, data)
+            if updated_user:
+                self._repository.after_commit(lambda: principal_cache.invalidate_user(id))
+            return updated_user
         except Exception as e:
             self._logger.error(f"Error updating user: {e}")
             return None
@@ -50,7 +67,10 @@ class AuthService(BaseService[User]):
     def delete(self, id: int) -> bool:
 
         try:
-            return self._repository.delete(id)
+            deleted = self._repository.delete(id)
+            if deleted:
+                self._repository.after_commit(lambda: principal_cache.invalidate_user(id))
+            return deleted
         except Exception as e:
             self._logger.error(f"Error deleting user: {e}")
             return False
@@ -59,33 +79,28 @@ class AuthService(BaseService[User]):
 
         try:
 
-            if self._repository.username_exists(user_data.username):
-                self._logger.warning(f"Username already exists: {user_data.username}")
-                return None
-
-            if self._repository.email_exists(user_data.email):
-                self._logger.warning(f"Email already exists: {user_data.email}")
+            if not self._can_register(user_data):
                 return None
 
             password_hash = password_handler.hash_password(user_data.password)
 
-            user = create_user(
-                username=user_data.username,
-                email=user_data.email,
-                password_hash=password_hash,
-                role=user_data.role
-            )
+            return self._create_registered_user(user_data, password_hash)
 
-            if user_data.full_name:
-                user.full_name = user_data.full_name
+        except Exception as e:
+            self._logger.error(f"Error registering user: {e}")
+            return None
 
-            created_user = self._repository.create(user)
+    async def register_async(self, user_data: UserCreate) -> Optional[User]:
 
-            if created_user:
-                self._log_operation("User registered", created_user.id)
-                return created_user
+        try:
 
-            return None
+            if not self._can_register(user_data):
+                return None
+
+            self._repository.release()
+            password_hash = await password_handler.hash_password_async(user_data.password)
+
+            return self._create_registered_user(user_data, password_hash)
 
         except Exception as e:
             self._logger.error(f"Error registering user: {e}")
@@ -95,18 +110,44 @@ class AuthService(BaseService[User]):
 
         try:
 
-            user = self._repository.get_by_username(username)
+            user = self._find_login_user(username)
             if not user:
-                user = self._repository.get_by_email(username)
+                return None
+
+            if not password_handler.verify_password(password, user.password_hash):
+                self._logger.warning(f"Invalid password for user: {username}")
+                return None
+
+            if password_handler.needs_rehash(user.password_hash):
+                self._upgrade_password_hash(user, password_handler.hash_password(password))
 
+            self._log_operation("User authenticated", user.id)
+            return user
+
+        except Exception as e:
+            self._logger.error(f"Error authenticating user: {e}")
+            return None
+
+    async def authenticate_async(self, username: str, password: str) -> Optional[User]:
+
+        try:
+
+            user = self._find_login_user(username)
             if not user:
-                self._logger.warning(f"User not found: {username}")
                 return None
 
-            if not password_handler.verify_password(password, user.password_hash):
+            password_hash = user.password_hash
+            self._repository.release()
+
+            if not await password_handler.verify_password_async(password, password_hash):
                 self._logger.warning(f"Invalid password for user: {username}")
                 return None
 
+            user = self._repository.attach(user)
+
+            if password_handler.needs_rehash(password_hash):
+                self._upgrade_password_hash(user, await password_handler.hash_password_async(password))
+
             self._log_operation("User authenticated", user.id)
             return user
 
@@ -114,6 +155,56 @@ class AuthService(BaseService[User]):
             self._logger.error(f"Error authenticating user: {e}")
             return None
 
+    def _can_register(self, user_data: UserCreate) -> bool:
+
+        if self._repository.username_exists(user_data.username):
+            self._logger.warning(f"Username already exists: {user_data.username}")
+            return False
+
+        if self._repository.email_exists(user_data.email):
+            self._logger.warning(f"Email already exists: {user_data.email}")
+            return False
+
+        return True
+
+    def _create_registered_user(self, user_data: UserCreate, password_hash: str) -> Optional[User]:
+
+        user = create_user(
+            username=user_data.username,
+            email=user_data.email,
+            password_hash=password_hash,
+            role=user_data.role
+        )
+
+        if user_data.full_name:
+            user.full_name = user_data.full_name
+
+        created_user = self._repository.create(user)
+
+        if created_user:
+            self._log_operation("User registered", created_user.id)
+            return created_user
+
+        return None
+
+    def _upgrade_password_hash(self, user: User, password_hash: str) -> None:
+
+        if self._repository.update(user.id, {"password_hash": password_hash}):
+            self._log_operation(f"Password hash upgraded to {password_handler.scheme}", user.id)
+        else:
+            self._logger.warning(f"Failed to upgrade password hash for user {user.id}")
+
+    def _find_login_user(self, username: str) -> Optional[User]:
+
+        user = self._repository.get_by_username(username)
+        if not user:
+            user = self._repository.get_by_email(username)
+
+        if not user:
+            self._logger.warning(f"User not found: {username}")
+
+        return user
+
     def create_token(self, user: User) -> str:
 
         try:
@@ -151,6 +242,40 @@ class AuthService(BaseService[User]):
             self._logger.error(f"Error getting user from token: {e}")
             return None
 
+    def get_principal_by_token(self, token: str) -> Optional[Principal]:
+
+        try:
+
+            payload = jwt_handler.verify_token(token)
+
+            if not payload:
+                return None
+
+            token_id = get_token_id(token, payload)
+
+            if self._is_revoked(token_id):
+                return None
+
+            principal = principal_cache.get(token_id)
+            if principal:
+                return principal
+
+            username = payload.get("sub")
+            if not username:
+                return None
+
+            user = self._repository.get_by_username(username)
+            if not user:
+                return None
+
+            principal = Principal.from_user(user, token_id)
+            principal_cache.put(principal, payload.get("exp"))
+            return principal
+
+        except Exception as e:
+            self._logger.error(f"Error getting principal from token: {e}")
+            return None
+
     def change_password(self, user_id: int, old_password: str, new_password: str) -> bool:
 
         try:
@@ -167,6 +292,9 @@ class AuthService(BaseService[User]):
             updated_user = self._repository.update(user_id, {"password_hash": new_password_hash})
 
             if updated_user:
+                self._repository.after_commit(lambda: principal_cache.invalidate_user(user_id))
+                if self._token_repository:
+                    self._token_repository.revoke_user_tokens(user_id)
                 self._log_operation("Password changed", user_id)
                 return True
 
@@ -175,3 +303,142 @@ class AuthService(BaseService[User]):
         except Exception as e:
             self._logger.error(f"Error changing password: {e}")
             return False
+
+    def create_refresh_token(self, user: User, family_id: Optional[str] = None) -> Optional[str]:
+
+        try:
+
+            if not self._token_repository:
+                return None
+
+            token = generate_refresh_token()
+            created = self._token_repository.create(self._new_refresh_token(user.id, token, family_id))
+
+            return token if created else None
+
+        except Exception as e:
+            self._logger.error(f"Error creating refresh token: {e}")
+            return None
+
+    def refresh_tokens(self, refresh_token: str) -> Optional[Tuple[User, str, str]]:
+
+        try:
+
+            if not self._token_repository:
+                return None
+
+            current = self._token_repository.get_by_hash(hash_refresh_token(refresh_token))
+            if not current:
+                return None
+
+            if current.is_revoked:
+                self._revoke_family(current, "Refresh token reuse detected")
+                return None
+
+            if current.expires_at <= datetime.utcnow():
+                return None
+
+            user = self._repository.get_by_id(current.user_id)
+            if not user:
+                return None
+
+            token = generate_refresh_token()
+            replacement = self._new_refresh_token(user.id, token, current.family_id)
+
+            if not self._token_repository.rotate(current, replacement):
+                return None
+
+            access_token = self.create_token(user)
+            if not access_token:
+                return None
+
+            self._log_operation("Tokens refreshed", user.id)
+            return user, access_token, token
+
+        except Exception as e:
+            self._logger.error(f"Error refreshing tokens: {e}")
+            return None
+
+    def logout(self, access_token: str, refresh_token: Optional[str] = None) -> bool:
+
+        try:
+
+            payload = jwt_handler.verify_token(access_token)
+            if not payload:
+                return False
+
+            token_id = get_token_id(access_token, payload)
+            user_id = payload.get("user_id")
+
+            if self._token_repository:
+                expires_at = datetime.utcfromtimestamp(payload["exp"])
+                if not self._token_repository.revoke_access_token(token_id, user_id, expires_at):
+                    return False
+
+                if refresh_token:
+                    current = self._token_repository.get_by_hash(hash_refresh_token(refresh_token))
+                    if current and current.user_id == user_id:
+                        self._token_repository.revoke_family(current.family_id)
+
+            self._repository.after_commit(lambda: revocation_list.add(token_id))
+            self._repository.after_commit(lambda: principal_cache.invalidate_token(token_id))
+
+            self._log_operation("User logged out", user_id)
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error logging out: {e}")
+            return False
+
+    def rebuild_revocation_list(self) -> int:
+
+        if not self._token_repository:
+            return 0
+
+        synced_at = datetime.utcnow()
+        self._token_repository.purge_expired()
+        self._token_repository.commit()
+        return revocation_list.rebuild(self._token_repository.get_revoked_token_ids(), synced_at)
+
+    def sync_revocation_list(self) -> int:
+
+        if not self._token_repository:
+            return 0
+
+        if revocation_list.synced_at is None or revocation_list.needs_rebuild:
+            return self.rebuild_revocation_list()
+
+        synced_at = datetime.utcnow()
+        since = revocation_list.synced_at - timedelta(seconds=settings.token_revocation_sync_overlap_seconds)
+        token_ids = self._token_repository.get_revoked_token_ids(since=since)
+        revocation_list.add_many(token_ids, synced_at)
+        return len(token_ids)
+
+    def _is_revoked(self, token_id: str) -> bool:
+
+        if not revocation_list.might_be_revoked(token_id):
+            return False
+
+        if not self._token_repository:
+            return True
+
+        if self._token_repository.is_access_token_revoked(token_id):
+            return True
+
+        revocation_list.record_false_positive()
+        return False
+
+    def _revoke_family(self, token: RefreshToken, reason: str) -> None:
+
+        revoked = self._token_repository.revoke_family(token.family_id)
+        self._token_repository.commit()
+        self._logger.warning(f"{reason} for user {token.user_id}; revoked {revoked} tokens in family")
+
+    def _new_refresh_token(self, user_id: int, token: str, family_id: Optional[str] = None) -> RefreshToken:
+
+        return RefreshToken(
+            user_id=user_id,
+            token_hash=hash_refresh_token(token),
+            family_id=family_id or uuid.uuid4().hex,
+            expires_at=datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+        )
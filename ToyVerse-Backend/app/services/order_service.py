@@ -8,6 +8,7 @@ from app.repositories.order_repository import OrderRepository
 from app.repositories.cart_repository import CartRepository
 from app.repositories.product_repository import ProductRepository
 from app.models.order import Order
+from app.core.events import order_events
 
 logger = logging.getLogger(__name__)
 
@@ -98,11 +99,26 @@ class OrderService(BaseService[Order]):
                 self._logger.warning(f"Invalid order status: {status}")
                 return None
 
-            return self._repository.update(order_id, {'status': status})
+            order = self._repository.update(order_id, {'status': status})
+
+            if order:
+                event = self.status_event(order)
+                self._repository.after_commit(lambda: order_events.publish(order.id, event))
+
+            return order
         except Exception as e:
             self._logger.error(f"Error updating order status: {e}")
             return None
 
+    @staticmethod
+    def status_event(order: Order) -> dict:
+        return {
+            'order_id': order.id,
+            'order_number': order.order_number,
+            'status': order.status,
+            'updated_at': order.updated_at.isoformat() if order.updated_at else None
+        }
+
     def create_from_cart(self, user_id: int, customer_details: dict, payment_method: str = 'COD') -> Optional[Order]:
         try:
             cart_items = self._cart_repository.get_by_user_id(user_id)
@@ -112,6 +128,7 @@ class OrderService(BaseService[Order]):
                 return None
 
             order_items = []
+            reserved = {}
             total = 0
 
             for cart_item in cart_items:
@@ -120,10 +137,6 @@ class OrderService(BaseService[Order]):
                 if not product:
                     continue
 
-                if product.stock < cart_item.quantity:
-                    self._logger.warning(f"Insufficient stock for product {product.id}")
-                    return None
-
                 item_data = {
                     'product_id': product.id,
                     'title': product.title,
@@ -135,8 +148,13 @@ class OrderService(BaseService[Order]):
                 order_items.append(item_data)
                 total += item_data['subtotal']
 
-                product.decrease_stock(cart_item.quantity)
-                self._product_repository.update(product.id, {'stock': product.stock})
+                reserved[product.id] = reserved.get(product.id, 0) + cart_item.quantity
+
+            for product_id, quantity in reserved.items():
+                if not self._product_repository.reserve_stock(product_id, quantity):
+                    self._logger.warning(f"Insufficient stock for product {product_id}")
+                    self._product_repository.rollback()
+                    return None
 
             order_data = {
                 'user_id': user_id,
@@ -147,7 +165,10 @@ class OrderService(BaseService[Order]):
                 'clear_cart': True
             }
 
-            return self.create(order_data)
+            order = self.create(order_data)
+            if order is None:
+                self._product_repository.rollback()
+            return order
 
         except Exception as e:
             self._logger.error(f"Error creating order from cart: {e}")
@@ -3,6 +3,9 @@ from typing import Optional, List, Dict, Any
 from decimal import Decimal
 import logging
 
+from app.core.content_similarity import ContentSimilarityIndex, content_similarity
+from app.core.popularity import PopularityTracker, popularity_tracker
+from app.core.product_catalog import ProductCatalog, product_catalog
 from app.services.base_service import BaseService
 from app.repositories.product_repository import ProductRepository
 from app.models.product import Product
@@ -10,11 +13,22 @@ from app.schemas.product import ProductCreate, ProductUpdate
 
 logger = logging.getLogger(__name__)
 
+CONTENT_FIELDS = ('title', 'description', 'category')
+
 class ProductService(BaseService[Product]):
 
-    def __init__(self, repository: ProductRepository):
+    def __init__(
+        self,
+        repository: ProductRepository,
+        similarity: Optional[ContentSimilarityIndex] = None,
+        catalog: Optional[ProductCatalog] = None,
+        popularity: Optional[PopularityTracker] = None
+    ):
 
         super().__init__(repository)
+        self._similarity = similarity or content_similarity
+        self._catalog = catalog or product_catalog
+        self._popularity = popularity or popularity_tracker
 
     def get_by_id(self, id: int) -> Optional[Product]:
 
@@ -62,6 +76,7 @@ class ProductService(BaseService[Product]):
 
             if created_product:
                 self._log_operation("Product created", created_product.id)
+                self._index_content(created_product)
                 return created_product
 
             return None
@@ -87,6 +102,8 @@ class ProductService(BaseService[Product]):
 
             if updated_product:
                 self._log_operation("Product updated", id)
+                if any(field in data for field in CONTENT_FIELDS):
+                    self._index_content(updated_product)
                 return updated_product
 
             return None
@@ -100,6 +117,7 @@ class ProductService(BaseService[Product]):
         try:
             if self._repository.delete(id):
                 self._log_operation("Product deleted", id)
+                self._repository.after_commit(lambda: self._forget_product(id))
                 return True
             return False
         except Exception as e:
@@ -174,6 +192,23 @@ class ProductService(BaseService[Product]):
             self._logger.error(f"Error updating stock: {e}")
             return None
 
+    def _index_content(self, product: Product) -> None:
+
+        product_id, title, description, category = product.id, product.title, product.description, product.category
+
+        def index() -> None:
+
+            self._catalog.put(product_id, category)
+            self._similarity.upsert(product_id, title, description, category)
+
+        self._repository.after_commit(index)
+
+    def _forget_product(self, product_id: int) -> None:
+
+        self._catalog.remove(product_id)
+        self._similarity.remove(product_id)
+        self._popularity.remove(product_id)
+
     def _validate(self, data: dict) -> bool:
 
         required_fields = ['title', 'price', 'category']
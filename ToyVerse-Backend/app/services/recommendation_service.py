@@ -1,7 +1,13 @@
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from collections import defaultdict, Counter
-from app.models.product import Product
+from datetime import datetime
+from app.core.content_similarity import ContentSimilarityIndex, content_similarity
+from app.core.cooccurrence import CooccurrenceModel, cooccurrence_model
+from app.core.interaction_buffer import InteractionBuffer, interaction_buffer
+from app.core.popularity import PopularityTracker, popularity_tracker
+from app.core.product_catalog import ProductCatalog, product_catalog
+from app.core.session_profiles import SessionProfileStore, session_profiles
 from app.models.product_interaction import ProductInteraction
 from app.repositories.interaction_repository import InteractionRepository
 from app.repositories.product_repository import ProductRepository
@@ -11,10 +17,22 @@ class RecommendationService:
     def __init__(
         self,
         interaction_repo: InteractionRepository,
-        product_repo: ProductRepository
+        product_repo: ProductRepository,
+        buffer: Optional[InteractionBuffer] = None,
+        cooccurrence: Optional[CooccurrenceModel] = None,
+        popularity: Optional[PopularityTracker] = None,
+        sessions: Optional[SessionProfileStore] = None,
+        similarity: Optional[ContentSimilarityIndex] = None,
+        catalog: Optional[ProductCatalog] = None
     ):
         self._interaction_repo = interaction_repo
         self._product_repo = product_repo
+        self._buffer = buffer or interaction_buffer
+        self._cooccurrence = cooccurrence or cooccurrence_model
+        self._popularity = popularity or popularity_tracker
+        self._sessions = sessions or session_profiles
+        self._similarity = similarity or content_similarity
+        self._catalog = catalog or product_catalog
 
     def get_recommendations_for_user(
         self,
@@ -26,29 +44,15 @@ class RecommendationService:
 
         recommendations = []
 
-        if user_id:
-            interactions = self._interaction_repo.get_user_interactions(user_id, limit=50)
-        elif session_id:
-            interactions = self._interaction_repo.get_session_interactions(session_id, limit=50)
-        else:
-
-            return self._get_popular_products(limit)
+        viewed_product_ids, category_counts = self._get_viewing_history(user_id, session_id)
 
-        if not interactions:
+        if not viewed_product_ids:
             return self._get_popular_products(limit)
 
-        viewed_product_ids = list(set([i.product_id for i in interactions]))
-
-        viewed_products = []
-        for pid in viewed_product_ids:
-            product = self._product_repo.get_by_id(pid)
-            if product:
-                viewed_products.append(product)
-
         if rec_type == 'all' or rec_type == 'category':
 
             category_recs = self._get_category_based_recommendations(
-                viewed_products,
+                category_counts,
                 viewed_product_ids,
                 limit=limit // 2
             )
@@ -78,17 +82,45 @@ class RecommendationService:
 
         return unique_recs[:limit]
 
+    def _get_viewing_history(
+        self,
+        user_id: Optional[int],
+        session_id: Optional[str]
+    ) -> Tuple[List[int], Counter]:
+
+        if not user_id and session_id and self._sessions.enabled:
+            profile = self._sessions.get(session_id)
+            if profile is None:
+                return [], Counter()
+            return list(profile.recent), profile.category_counts()
+
+        if user_id:
+            interactions = self._interaction_repo.get_user_interactions(user_id, limit=50)
+        elif session_id:
+            interactions = self._interaction_repo.get_session_interactions(session_id, limit=50)
+        else:
+            return [], Counter()
+
+        viewed_product_ids = list(set([i.product_id for i in interactions]))
+
+        viewed_products = []
+        for pid in viewed_product_ids:
+            product = self._product_repo.get_by_id(pid)
+            if product:
+                viewed_products.append(product)
+
+        return viewed_product_ids, Counter([p.category for p in viewed_products])
+
     def _get_category_based_recommendations(
         self,
-        viewed_products: List[Product],
+        category_counts: Counter,
         exclude_ids: List[int],
         limit: int = 10
     ) -> List[Dict]:
 
-        if not viewed_products:
+        if not category_counts:
             return []
 
-        category_counts = Counter([p.category for p in viewed_products])
         preferred_categories = [cat for cat, _ in category_counts.most_common(3)]
 
         recommendations = []
@@ -113,7 +145,7 @@ class RecommendationService:
         related_product_scores = defaultdict(int)
 
         for product_id in viewed_product_ids:
-            related_ids = self._interaction_repo.get_related_products(product_id, limit=10)
+            related_ids = self._get_related_product_ids(product_id, limit=10)
 
             for idx, related_id in enumerate(related_ids):
 
@@ -138,31 +170,38 @@ class RecommendationService:
 
         return recommendations
 
+    def _get_related_product_ids(self, product_id: int, limit: int = 10) -> List[int]:
+
+        if self._cooccurrence.ready:
+            return self._cooccurrence.related(product_id, limit)
+
+        return self._interaction_repo.get_related_products(product_id, limit=limit)
+
     def _get_popular_products(self, limit: int = 10) -> List[Dict]:
 
-        popular = self._interaction_repo.get_popular_products(limit=limit)
+        if self._popularity.ready:
+            popular = self._popularity.top(limit)
+        else:
+            popular = [
+                (item['product_id'], item['count'])
+                for item in self._interaction_repo.get_popular_products(limit=limit)
+            ]
 
         recommendations = []
-        for item in popular:
-            product = self._product_repo.get_by_id(item['product_id'])
+        for product_id, score in popular:
+            product = self._product_repo.get_by_id(product_id)
             if product:
                 recommendations.append({
                     **product.to_dict(),
                     'reason': 'Popular choice',
-                    'interaction_count': item['count']
+                    'popularity_score': round(score, 3)
                 })
 
         if len(recommendations) < limit:
-            all_products = self._product_repo.get_all()
-
-            sorted_products = sorted(
-                all_products,
-                key=lambda p: (p.rating or 0) * ((p.to_dict().get('reviews') or 0) + 1),
-                reverse=True
-            )
-
             existing_ids = {r['id'] for r in recommendations}
-            for product in sorted_products:
+            top_rated = self._product_repo.get_top_rated(limit=limit + len(existing_ids))
+
+            for product in top_rated:
                 if product.id not in existing_ids and len(recommendations) < limit:
                     recommendations.append({
                         **product.to_dict(),
@@ -179,18 +218,36 @@ class RecommendationService:
         session_id: Optional[str] = None,
         user_agent: Optional[str] = None,
         ip_address: Optional[str] = None
-    ) -> ProductInteraction:
+    ) -> bool:
+
+        event = {
+            'user_id': user_id,
+            'product_id': product_id,
+            'interaction_type': interaction_type,
+            'session_id': session_id,
+            'user_agent': user_agent,
+            'ip_address': ip_address,
+            'timestamp': datetime.utcnow()
+        }
+
+        if self._buffer.enabled:
+            accepted = self._buffer.offer(event)
+        else:
+            accepted = self._interaction_repo.create(ProductInteraction(**event)) is not None
+
+        if accepted:
+            if self._catalog.knows(product_id):
+                self._popularity.record(product_id)
+            self._record_session_view(user_id, session_id, product_id)
 
-        interaction = ProductInteraction(
-            user_id=user_id,
-            product_id=product_id,
-            interaction_type=interaction_type,
-            session_id=session_id,
-            user_agent=user_agent,
-            ip_address=ip_address
-        )
+        return accepted
 
-        return self._interaction_repo.create(interaction)
+    def _record_session_view(self, user_id: Optional[int], session_id: Optional[str], product_id: int) -> None:
+
+        if user_id or not session_id or not self._sessions.enabled:
+            return
+
+        self._sessions.record(session_id, product_id, self._catalog.category(product_id))
 
     def get_product_recommendations(self, product_id: int, limit: int = 6) -> List[Dict]:
 
@@ -200,15 +257,25 @@ class RecommendationService:
 
         recommendations = []
 
-        category_products = self._product_repo.get_by_category(product.category)
-        for p in category_products:
-            if p.id != product_id and len(recommendations) < limit:
-                recommendations.append({
-                    **p.to_dict(),
-                    'reason': f'More {product.category} items'
-                })
+        if self._similarity.ready:
+            for similar_id, similarity in self._similarity.similar(product_id, limit):
+                similar_product = self._product_repo.get_by_id(similar_id)
+                if similar_product:
+                    recommendations.append({
+                        **similar_product.to_dict(),
+                        'reason': f'Similar to {product.title}',
+                        'similarity': round(similarity, 4)
+                    })
+        else:
+            category_products = self._product_repo.get_by_category(product.category, limit=limit + 1)
+            for p in category_products:
+                if p.id != product_id and len(recommendations) < limit:
+                    recommendations.append({
+                        **p.to_dict(),
+                        'reason': f'More {product.category} items'
+                    })
 
-        related_ids = self._interaction_repo.get_related_products(product_id, limit=limit)
+        related_ids = self._get_related_product_ids(product_id, limit=limit)
         for related_id in related_ids:
             related_product = self._product_repo.get_by_id(related_id)
             if related_product and related_product.id not in [r['id'] for r in recommendations]:
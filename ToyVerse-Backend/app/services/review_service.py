@@ -1,4 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from datetime import datetime
+import base64
+import binascii
+import json
 import logging
 
 from app.services.base_service import BaseService
@@ -48,12 +52,10 @@ class ReviewService(BaseService[Review]):
                 text=data.get('text', '')
             )
 
-            created_review = self._repository.create(review)
-
-            if created_review:
-                self._update_product_rating(data['product_id'])
+            if not self._product_repository.apply_rating_delta(review.product_id, added=review.rating):
+                return None
 
-            return created_review
+            return self._repository.create(review)
 
         except Exception as e:
             self._logger.error(f"Error creating review: {e}")
@@ -61,12 +63,20 @@ class ReviewService(BaseService[Review]):
 
     def update(self, id: int, data: dict) -> Optional[Review]:
         try:
-            updated_review = self._repository.update(id, data)
+            review = self._repository.get_by_id(id)
+            if not review:
+                return None
 
-            if updated_review:
-                self._update_product_rating(updated_review.product_id)
+            new_rating = data.get('rating')
+            if new_rating is not None and new_rating != review.rating:
+                if not self._product_repository.apply_rating_delta(
+                    review.product_id,
+                    added=new_rating,
+                    removed=review.rating
+                ):
+                    return None
 
-            return updated_review
+            return self._repository.update(id, data)
         except Exception as e:
             self._logger.error(f"Error updating review: {e}")
             return None
@@ -74,12 +84,13 @@ class ReviewService(BaseService[Review]):
     def delete(self, id: int) -> bool:
         try:
             review = self._repository.get_by_id(id)
-            if review:
-                product_id = review.product_id
-                if self._repository.delete(id):
-                    self._update_product_rating(product_id)
-                    return True
-            return False
+            if not review:
+                return False
+
+            if not self._product_repository.apply_rating_delta(review.product_id, removed=review.rating):
+                return False
+
+            return self._repository.delete(id)
         except Exception as e:
             self._logger.error(f"Error deleting review: {e}")
             return False
@@ -91,6 +102,27 @@ class ReviewService(BaseService[Review]):
             self._logger.error(f"Error getting product reviews: {e}")
             return []
 
+    def get_product_reviews_page(
+        self,
+        product_id: int,
+        sort: str = "newest",
+        cursor: Optional[str] = None,
+        limit: int = 20
+    ) -> Tuple[List[Review], Optional[str]]:
+        after = self._decode_cursor(cursor, sort) if cursor else None
+
+        try:
+            reviews = self._repository.get_product_reviews_page(product_id, sort, after, limit + 1)
+        except Exception as e:
+            self._logger.error(f"Error getting product reviews: {e}")
+            return [], None
+
+        if len(reviews) <= limit:
+            return reviews, None
+
+        reviews = reviews[:limit]
+        return reviews, self._encode_cursor(reviews[-1], sort)
+
     def get_user_reviews(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
         try:
             return self._repository.get_by_user_id(user_id, skip, limit)
@@ -98,21 +130,54 @@ class ReviewService(BaseService[Review]):
             self._logger.error(f"Error getting user reviews: {e}")
             return []
 
-    def _update_product_rating(self, product_id: int) -> None:
+    def get_rating_summaries(self, product_ids: List[int]) -> List[dict]:
         try:
-            reviews = self._repository.get_by_product_id(product_id, skip=0, limit=1000)
-
-            if not reviews:
-                self._product_repository.update(product_id, {'rating': 0})
-                return
+            rows = self._product_repository.get_rating_summaries(product_ids)
+        except Exception as e:
+            self._logger.error(f"Error getting rating summaries: {e}")
+            return []
 
-            total_rating = sum(review.rating for review in reviews)
-            average_rating = round(total_rating / len(reviews))
+        return [
+            {
+                'product_id': row['id'],
+                'count': row['rating_count'] or 0,
+                'average': round(row['rating_sum'] / row['rating_count'], 2) if row['rating_count'] else 0.0,
+                'histogram': {str(star): row[f"rating_{star}_count"] or 0 for star in range(1, 6)}
+            }
+            for row in rows
+        ]
+
+    def rebuild_rating_aggregates(self) -> int:
+        try:
+            aggregates = self._repository.get_rating_aggregates()
+            return self._product_repository.replace_rating_aggregates(aggregates)
+        except Exception as e:
+            self._logger.error(f"Error rebuilding rating aggregates: {e}")
+            return 0
 
-            self._product_repository.update(product_id, {'rating': average_rating})
+    def _encode_cursor(self, review: Review, sort: str) -> str:
+        payload = {'s': sort, 'c': review.created_at.isoformat(), 'i': review.id}
+        if sort == "rating":
+            payload['r'] = review.rating
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
 
-        except Exception as e:
-            self._logger.error(f"Error updating product rating: {e}")
+    def _decode_cursor(self, cursor: str, sort: str) -> dict:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+            if payload['s'] != sort:
+                raise ValueError("Cursor was issued for a different sort order")
+
+            after = {
+                'created_at': datetime.fromisoformat(payload['c']),
+                'id': int(payload['i'])
+            }
+            if sort == "rating":
+                after['rating'] = int(payload['r'])
+            return after
+        except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid review cursor: {e}")
 
     def _validate(self, data: dict) -> bool:
         required_fields = ['product_id', 'user_id', 'rating']
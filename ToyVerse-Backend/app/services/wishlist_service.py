@@ -37,7 +37,6 @@ class WishlistService:
         wishlist_item = Wishlist(user_id=user_id, product_id=product_id)
         self.repository.create(wishlist_item)
 
-        self.db.refresh(wishlist_item)
         return wishlist_item
 
     def remove_from_wishlist(self, user_id: int, product_id: int) -> bool:
@@ -60,10 +59,4 @@ class WishlistService:
 
     def clear_wishlist(self, user_id: int) -> int:
 
-        items = self.repository.get_user_wishlist(user_id)
-        count = len(items)
-
-        for item in items:
-            self.repository.delete(item.id)
-
-        return count
+        return self.repository.delete_where(Wishlist.user_id == user_id)
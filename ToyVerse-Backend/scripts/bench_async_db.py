@@ -0,0 +1,147 @@
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.main import app
+from app.core.database import Base, get_db, get_async_db
+from app.models.product import Product
+import logging
+
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ["Sets", "Robots", "Plush", "Puzzles", "Vehicles"]
+
+def percentile(samples, fraction):
+
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+def setup_database(path, products, pool_size):
+
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    db.add_all([
+        Product(
+            title=f"Bench Toy {i}",
+            price=10 + i % 50,
+            category=CATEGORIES[i % len(CATEGORIES)],
+            stock=i % 7,
+            description=f"Benchmark product number {i}"
+        )
+        for i in range(products)
+    ])
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    return create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=pool_size, max_overflow=0)
+
+def use_async(async_engine, enabled):
+
+    session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        if not enabled:
+            yield None
+            return
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+async def run(requests, concurrency):
+
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    probe_latencies = []
+    done = asyncio.Event()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def browse(i):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(
+                    "/api/products",
+                    params={"category": CATEGORIES[i % len(CATEGORIES)], "search": "Toy", "limit": 50}
+                )
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        async def probe():
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/")
+                probe_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.005)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(browse(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return elapsed, latencies, probe_latencies
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Compare /products throughput on the sync and async data access paths")
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        async_engine = setup_database(os.path.join(tmp, "bench.db"), args.products, args.concurrency)
+
+        print(f"{'mode':<8}{'req/s':>10}{'p50':>12}{'p99':>12}{'probe p99':>12}")
+
+        for label, enabled in (("sync", False), ("async", True)):
+            use_async(async_engine, enabled)
+
+            elapsed, latencies, probes = asyncio.run(run(args.requests, args.concurrency))
+
+            print(
+                f"{label:<8}"
+                f"{args.requests / elapsed:>10.1f}"
+                f"{percentile(latencies, 0.50):>10.1f}ms"
+                f"{percentile(latencies, 0.99):>10.1f}ms"
+                f"{percentile(probes, 0.99) if probes else 0.0:>10.1f}ms"
+            )
+
+        asyncio.run(async_engine.dispose())
+
+if __name__ == "__main__":
+    main()
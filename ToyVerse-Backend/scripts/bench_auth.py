@@ -0,0 +1,82 @@
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.security import JWTHandler, TokenClaimsCache, token_claims_cache
+from app.core.principal_cache import principal_cache
+from app.models.user import Customer
+from app.repositories.user_repository import UserRepository
+from app.services.auth_service import AuthService
+import logging
+
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+def per_call_us(func, iterations):
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+def create_service():
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    user = Customer(username="benchuser", email="bench@toyverse.com", password_hash="unused", role="customer")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    return AuthService(UserRepository(db)), user
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Measure per-request JWT authentication overhead")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    service, user = create_service()
+    token = service.create_token(user)
+
+    uncached = JWTHandler()
+    cached = JWTHandler(cache=TokenClaimsCache())
+    cached.verify_token(token)
+
+    def principal_cold():
+        token_claims_cache.clear()
+        principal_cache.clear()
+        service.get_principal_by_token(token)
+
+    rows = [
+        ("verify_token (jose decode)", per_call_us(lambda: uncached.verify_token(token), args.iterations)),
+        ("verify_token (claims cache hit)", per_call_us(lambda: cached.verify_token(token), args.iterations)),
+        ("principal (no caches, DB lookup)", per_call_us(principal_cold, args.iterations // 10)),
+        ("principal (warm caches)", per_call_us(lambda: service.get_principal_by_token(token), args.iterations)),
+    ]
+
+    print(f"{'path':<36}{'us/request':>12}")
+    for label, elapsed in rows:
+        print(f"{label:<36}{elapsed:>12.2f}")
+
+    print()
+    print(f"claims cache: {token_claims_cache.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import Request
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.core.database import Base, get_db
+from app.core.db_profiles import configure_engine, engine_options
+from app.core.rate_limit import MemoryBucketStore, login_rate_limiter
+from app.core.security import password_handler
+from app.core.unit_of_work import UnitOfWork, request_session
+from app.models.user import Customer
+from app.repositories.token_repository import TokenRepository
+from app.repositories.user_repository import UserRepository
+from app.services.auth_service import AuthService
+import logging
+
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+USERNAME = "benchuser"
+PASSWORD = "benchpassword"
+
+def percentile(samples, fraction):
+
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+def setup_database(path):
+
+    url = f"sqlite:///{path}"
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    db.add(Customer(
+        username=USERNAME,
+        email="bench@toyverse.com",
+        password_hash=password_handler.hash_password(PASSWORD),
+        role="customer"
+    ))
+    db.commit()
+    db.close()
+
+    def override_get_db(request: Request):
+        yield from request_session(session_factory, request)
+
+    app.dependency_overrides[get_db] = override_get_db
+    return session_factory
+
+def sync_login(session_factory):
+
+    db = session_factory()
+    try:
+        service = AuthService(UserRepository(db), TokenRepository(db))
+        user = service.authenticate(USERNAME, PASSWORD)
+        if not user or not service.create_refresh_token(user):
+            raise RuntimeError("sync login failed")
+        UnitOfWork.for_session(db).commit()
+    finally:
+        db.close()
+
+async def run(requests, concurrency, session_factory=None):
+
+    transport = httpx.ASGITransport(app=app)
+    login_latencies = []
+    probe_latencies = []
+    done = asyncio.Event()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def login():
+            async with semaphore:
+                started = time.perf_counter()
+                if session_factory is not None:
+                    await asyncio.to_thread(sync_login, session_factory)
+                else:
+                    response = await client.post(
+                        "/api/auth/login",
+                        json={"username": USERNAME, "password": PASSWORD}
+                    )
+                    response.raise_for_status()
+                login_latencies.append(time.perf_counter() - started)
+
+        async def probe():
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/")
+                probe_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return elapsed, login_latencies, probe_latencies
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Measure /auth/login latency under concurrent load")
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=password_handler.stats()["bcrypt_rounds"])
+    parser.add_argument("--rate-limit", action="store_true", help="Keep login throttling on (most requests will get 429)")
+    args = parser.parse_args()
+
+    password_handler.configure(rounds=args.rounds)
+    login_rate_limiter.configure(store=MemoryBucketStore(), enabled=args.rate_limit)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session_factory = setup_database(os.path.join(tmp, "bench.db"))
+
+        print(f"{'mode':<10}{'req/s':>10}{'login p50':>12}{'login p99':>12}{'probe p99':>12}")
+
+        modes = (
+            ("blocking", False, None),
+            ("offload", True, None),
+            ("sync", False, session_factory),
+        )
+
+        for label, offload, sync_sessions in modes:
+            password_handler.configure(rounds=args.rounds, offload=offload)
+
+            elapsed, logins, probes = asyncio.run(run(args.requests, args.concurrency, sync_sessions))
+
+            print(
+                f"{label:<10}"
+                f"{args.requests / elapsed:>10.1f}"
+                f"{percentile(logins, 0.50):>10.1f}ms"
+                f"{percentile(logins, 0.99):>10.1f}ms"
+                f"{percentile(probes, 0.99) if probes else 0.0:>10.1f}ms"
+            )
+
+        password_handler.shutdown()
+
+if __name__ == "__main__":
+    main()
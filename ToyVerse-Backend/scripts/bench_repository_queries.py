@@ -0,0 +1,133 @@
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.cart import CartItem
+from app.models.order import Order
+from app.models.product import Product
+from app.models.user import Customer, User
+from app.models.wishlist import Wishlist
+from app.repositories.cart_repository import CartRepository
+from app.repositories.order_repository import OrderRepository
+from app.repositories.product_repository import ProductRepository
+from app.repositories.user_repository import UserRepository
+from app.repositories.wishlist_repository import WishlistRepository
+import logging
+
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+def per_call_us(db, func, iterations):
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        db.expunge_all()
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+def create_session(query_cache_size):
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        query_cache_size=query_cache_size
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    user = Customer(username="benchuser", email="bench@toyverse.com", password_hash="unused", role="customer")
+    db.add(user)
+    db.add_all([Product(title=f"Toy {i}", price=10 + i, category="Sets", stock=50) for i in range(20)])
+    db.commit()
+
+    db.add_all([CartItem(user_id=user.id, product_id=i, quantity=1) for i in range(1, 6)])
+    db.add_all([Wishlist(user_id=user.id, product_id=i) for i in range(6, 11)])
+    db.add_all([
+        Order(
+            order_number=f"ORD-{i}",
+            user_id=user.id,
+            customer_details_json="{}",
+            items_json="[]",
+            total=11,
+            payment_method="card"
+        )
+        for i in range(10)
+    ])
+    db.commit()
+
+    return db, user.id
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Compare legacy Query chains with prebuilt repository statements")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--query-cache-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    db, user_id = create_session(args.query_cache_size)
+
+    users = UserRepository(db)
+    products = ProductRepository(db)
+    carts = CartRepository(db)
+    orders = OrderRepository(db)
+    wishlists = WishlistRepository(db)
+
+    paths = [
+        (
+            "ProductRepository.get_by_id",
+            lambda: db.query(Product).filter(Product.id == 3).first(),
+            lambda: products.get_by_id(3),
+        ),
+        (
+            "UserRepository.get_by_username",
+            lambda: db.query(User).filter(User.username == "benchuser").first(),
+            lambda: users.get_by_username("benchuser"),
+        ),
+        (
+            "CartRepository.get_by_user_id",
+            lambda: db.query(CartItem).filter(CartItem.user_id == user_id).all(),
+            lambda: carts.get_by_user_id(user_id),
+        ),
+        (
+            "CartRepository.get_by_user_and_product",
+            lambda: db.query(CartItem).filter(CartItem.user_id == user_id, CartItem.product_id == 2).first(),
+            lambda: carts.get_by_user_and_product(user_id, 2),
+        ),
+        (
+            "OrderRepository.get_by_user_id",
+            lambda: db.query(Order).filter(Order.user_id == user_id).offset(0).limit(100).all(),
+            lambda: orders.get_by_user_id(user_id),
+        ),
+        (
+            "WishlistRepository.is_in_wishlist",
+            lambda: db.query(Wishlist).filter(Wishlist.user_id == user_id, Wishlist.product_id == 7).first() is not None,
+            lambda: wishlists.is_in_wishlist(user_id, 7),
+        ),
+    ]
+
+    print(f"{'path':<42}{'query() us':>12}{'prebuilt us':>13}{'saved':>9}")
+    print("-" * 76)
+
+    for label, legacy, prebuilt in paths:
+        legacy()
+        prebuilt()
+        before = per_call_us(db, legacy, args.iterations)
+        after = per_call_us(db, prebuilt, args.iterations)
+        print(f"{label:<42}{before:>12.1f}{after:>13.1f}{(1 - after / before) * 100:>8.1f}%")
+
+    print("-" * 76)
+    print(f"compiled cache entries: {len(db.get_bind()._compiled_cache)} / {args.query_cache_size}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import time
+
+from app.core.config import settings
+from app.core.cooccurrence import CooccurrenceModel, actor_rows
+from app.core.database import SessionLocal
+from app.repositories.interaction_repository import InteractionRepository
+import logging
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Rebuild the related-products co-occurrence model from product_interactions")
+    parser.add_argument("--output", default=settings.cooccurrence_model_path)
+    parser.add_argument("--sample", type=int, default=5, help="Print related products for the first N products")
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info("Building co-occurrence model")
+    logger.info("=" * 60)
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        repository = InteractionRepository(db)
+        watermark = repository.get_max_id()
+        counts = repository.get_actor_product_counts(up_to_id=watermark)
+    finally:
+        db.close()
+    loaded = time.perf_counter()
+
+    model = CooccurrenceModel(
+        max_actors=settings.cooccurrence_max_actors,
+        actor_ttl_seconds=settings.cooccurrence_actor_ttl_seconds
+    )
+    model.build(actor_rows(counts), watermark)
+    model.save(args.output)
+    built = time.perf_counter()
+
+    stats = model.stats()
+    logger.info(f"Actor/product rows: {len(counts)} up to interaction {watermark} (query {loaded - started:.2f}s)")
+    logger.info(f"Products: {stats['products']}, actors: {stats['actors']}, pairs: {stats['pairs']}")
+    logger.info(f"Built and saved to {args.output} in {built - loaded:.2f}s ({os.path.getsize(args.output)} bytes)")
+
+    for product_id in sorted({row[2] for row in counts})[:args.sample]:
+        logger.info(f"  {product_id}: {model.related(product_id, 5)}")
+
+if __name__ == "__main__":
+    main()
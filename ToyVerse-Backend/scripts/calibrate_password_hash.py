@@ -0,0 +1,121 @@
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import statistics
+import time
+
+from app.core.security import PasswordHandler, Argon2Hasher
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SAMPLE_PASSWORD = "calibration-password"
+
+def measure(handler, samples):
+
+    hashed = handler.hash_password(SAMPLE_PASSWORD)
+    timings = []
+
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.verify_password(SAMPLE_PASSWORD, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
+
+def calibrate_bcrypt(target_ms, samples):
+
+    best = None
+
+    for rounds in range(10, 17):
+        elapsed = measure(PasswordHandler(scheme="bcrypt", rounds=rounds, offload=False), samples)
+        logger.info(f"  bcrypt rounds={rounds:<3} verify={elapsed:8.1f}ms")
+
+        if elapsed > target_ms * 2:
+            break
+        if best is None or abs(elapsed - target_ms) < abs(best[1] - target_ms):
+            best = (rounds, elapsed)
+
+    if best is None:
+        logger.warning(
+            f"  the cheapest bcrypt setting (rounds={rounds}) already takes {elapsed:.1f}ms, "
+            f"over twice the {target_ms:.0f}ms target; using it anyway"
+        )
+        best = (rounds, elapsed)
+
+    return best
+
+def calibrate_argon2(target_ms, samples, memory_cost, parallelism):
+
+    best = None
+
+    for time_cost in range(1, 11):
+        handler = PasswordHandler(
+            scheme="argon2id",
+            argon2_time_cost=time_cost,
+            argon2_memory_cost=memory_cost,
+            argon2_parallelism=parallelism,
+            offload=False
+        )
+        elapsed = measure(handler, samples)
+        logger.info(f"  argon2id t={time_cost:<3} m={memory_cost} p={parallelism} verify={elapsed:8.1f}ms")
+
+        if elapsed > target_ms * 2:
+            break
+        if best is None or abs(elapsed - target_ms) < abs(best[1] - target_ms):
+            best = (time_cost, elapsed)
+
+    if best is None:
+        logger.warning(
+            f"  the cheapest argon2id setting (time_cost={time_cost}) already takes {elapsed:.1f}ms, "
+            f"over twice the {target_ms:.0f}ms target; using it anyway"
+        )
+        best = (time_cost, elapsed)
+
+    return best
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Pick password hash parameters for a target verification latency")
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--argon2-memory-cost", type=int, default=65536)
+    parser.add_argument("--argon2-parallelism", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info(f"Password Hash Calibration (target {args.target_ms:.0f}ms per verify)")
+    logger.info("=" * 60)
+
+    rounds, bcrypt_ms = calibrate_bcrypt(args.target_ms, args.samples)
+
+    logger.info("")
+    logger.info(f"✓ bcrypt: BCRYPT_ROUNDS={rounds} ({bcrypt_ms:.1f}ms)")
+
+    if Argon2Hasher is None:
+        logger.info("  argon2-cffi is not installed; skipping argon2id")
+        return
+
+    time_cost, argon2_ms = calibrate_argon2(
+        args.target_ms,
+        args.samples,
+        args.argon2_memory_cost,
+        args.argon2_parallelism
+    )
+
+    logger.info(
+        f"✓ argon2id: ARGON2_TIME_COST={time_cost} "
+        f"ARGON2_MEMORY_COST={args.argon2_memory_cost} "
+        f"ARGON2_PARALLELISM={args.argon2_parallelism} ({argon2_ms:.1f}ms)"
+    )
+    logger.info("")
+    logger.info("Set PASSWORD_HASH_SCHEME and the matching parameters in .env;")
+    logger.info("existing hashes are upgraded on each user's next successful login.")
+
+if __name__ == "__main__":
+    main()
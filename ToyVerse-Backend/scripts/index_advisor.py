@@ -0,0 +1,190 @@
+
+import sys
+import os
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BACKEND_DIR)
+
+import argparse
+import json
+import re
+import xml.etree.ElementTree as ElementTree
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.db_profiles import backend_name, configure_engine, engine_options
+from app.models.product_interaction import ProductInteraction
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.cart_repository import CartRepository
+from app.repositories.order_repository import OrderRepository
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.wishlist_repository import WishlistRepository
+import logging
+
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+SHOWPLAN_NS = "{http://schemas.microsoft.com/sqlserver/2004/07/showplan}"
+MSSQL_SCANS = ("Table Scan", "Clustered Index Scan", "Index Scan")
+
+def interactions(db):
+
+    return db.query(ProductInteraction)
+
+PROBES = [
+    ("CartRepository.get_by_user_id", lambda db: CartRepository(db).get_by_user_id(1)),
+    ("CartRepository.get_by_user_and_product", lambda db: CartRepository(db).get_by_user_and_product(1, 1)),
+    ("OrderRepository.get_by_user_id", lambda db: OrderRepository(db).get_by_user_id(1)),
+    ("OrderRepository.get_by_status", lambda db: OrderRepository(db).get_by_status("pending")),
+    ("OrderRepository.get_by_order_number", lambda db: OrderRepository(db).get_by_order_number("ORD-1")),
+    ("ReviewRepository.get_by_product_id", lambda db: ReviewRepository(db).get_by_product_id(1)),
+    ("ReviewRepository.get_product_reviews_page", lambda db: ReviewRepository(db).get_product_reviews_page(1)),
+    ("ReviewRepository.get_by_user_id", lambda db: ReviewRepository(db).get_by_user_id(1)),
+    ("ReviewRepository.get_user_review_for_product", lambda db: ReviewRepository(db).get_user_review_for_product(1, 1)),
+    ("WishlistRepository.get_user_wishlist", lambda db: WishlistRepository(db).get_user_wishlist(1)),
+    ("ActivityLogRepository.get_all", lambda db: ActivityLogRepository(db).get_all()),
+    ("ActivityLogRepository.get_by_actor", lambda db: ActivityLogRepository(db).get_by_actor("admin")),
+    ("interactions by user", lambda db: interactions(db).filter(
+        ProductInteraction.user_id == 1).order_by(ProductInteraction.timestamp.desc()).limit(100).all()),
+    ("interactions by product", lambda db: interactions(db).filter(
+        ProductInteraction.product_id == 1).order_by(ProductInteraction.timestamp.desc()).limit(100).all()),
+    ("interactions by session", lambda db: interactions(db).filter(
+        ProductInteraction.session_id == "s").order_by(ProductInteraction.timestamp.desc()).limit(50).all()),
+]
+
+def capture_statements(engine):
+
+    captured = []
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    for name, probe in PROBES:
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", record)
+        db = session_factory()
+        try:
+            probe(db)
+        finally:
+            db.close()
+            event.remove(engine, "before_cursor_execute", record)
+
+        captured.extend((name, statement, parameters) for statement, parameters in statements)
+
+    return captured
+
+def explain_sqlite(conn, statement, parameters):
+
+    findings = []
+    for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall():
+        detail = row[-1]
+        match = re.match(r"SCAN (\w+)(.*)", detail)
+        if match and "INDEX" not in match.group(2):
+            findings.append(("SCAN", match.group(1), detail))
+        elif detail.startswith("USE TEMP B-TREE"):
+            findings.append(("SORT", "-", detail))
+    return findings
+
+def explain_postgresql(conn, statement, parameters):
+
+    conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    findings = []
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node.get("Node Type") == "Seq Scan":
+            findings.append(("SCAN", node.get("Relation Name", "-"), "Seq Scan"))
+        elif node.get("Node Type") == "Sort":
+            findings.append(("SORT", "-", ", ".join(node.get("Sort Key", []))))
+        nodes.extend(node.get("Plans", []))
+    return findings
+
+def explain_mssql(conn, statement, parameters):
+
+    conn.exec_driver_sql("SET SHOWPLAN_XML ON")
+    try:
+        plan = conn.exec_driver_sql(statement, parameters).scalar()
+    finally:
+        conn.exec_driver_sql("SET SHOWPLAN_XML OFF")
+
+    findings = []
+    for relop in ElementTree.fromstring(plan).iter(f"{SHOWPLAN_NS}RelOp"):
+        operation = relop.get("PhysicalOp")
+        if operation not in MSSQL_SCANS:
+            continue
+        target = relop.find(f".//{SHOWPLAN_NS}Object")
+        table = target.get("Table", "-").strip("[]") if target is not None else "-"
+        findings.append(("SCAN", table, operation))
+    return findings
+
+EXPLAINERS = {
+    "sqlite": explain_sqlite,
+    "postgresql": explain_postgresql,
+    "mssql": explain_mssql,
+}
+
+def migrate(url):
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    command.upgrade(config, "head")
+
+def advise(url):
+
+    backend = backend_name(url)
+    explain = EXPLAINERS[backend]
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+
+    report = []
+    with engine.connect() as conn:
+        for name, statement, parameters in capture_statements(engine):
+            with conn.begin():
+                report.append((name, explain(conn, statement, parameters)))
+
+    engine.dispose()
+    return backend, report
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Report table scans in the repository hot-path queries")
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--migrate", action="store_true", help="Run alembic upgrade head first")
+    parser.add_argument("--fail-on-scan", action="store_true", help="Exit with status 1 when scans are found")
+    args = parser.parse_args()
+
+    if args.migrate:
+        migrate(args.database_url)
+
+    backend, report = advise(args.database_url)
+
+    print(f"Index advisor ({backend}), {len(report)} statements")
+    print("-" * 100)
+
+    scans = 0
+    for name, findings in report:
+        if not findings:
+            print(f"{'ok':<6} {name}")
+            continue
+        for kind, table, detail in findings:
+            scans += kind == "SCAN"
+            print(f"{kind:<6} {name:<45} {table:<22} {detail}")
+
+    print("-" * 100)
+    print(f"{scans} scan(s) found")
+
+    if args.fail_on_scan and scans:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@
 import sys
 import os
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BACKEND_DIR)
 
-from sqlalchemy import create_engine, text
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect, text
 from app.core.config import settings
 from app.core.database import Base, engine
 from app.models import User, Admin, Customer, Product, CartItem, Order, Review
@@ -52,19 +55,27 @@ def create_database_if_not_exists():
         logger.error(f"Error creating database: {e}")
         raise
 
-def create_tables():
+def run_migrations():
 
     try:
-        logger.info("Creating database tables...")
+        logger.info("Applying database migrations...")
 
-        Base.metadata.create_all(bind=engine)
+        config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+        config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
 
-        logger.info("Database tables created successfully:")
+        tables = inspect(engine).get_table_names()
+        if "alembic_version" not in tables and "users" in tables:
+            logger.info("Existing schema has no migration history, stamping baseline revision 0001")
+            command.stamp(config, "0001")
+
+        command.upgrade(config, "head")
+
+        logger.info("Database schema is at the latest revision:")
         for table in Base.metadata.sorted_tables:
             logger.info(f"  - {table.name}")
 
     except Exception as e:
-        logger.error(f"Error creating tables: {e}")
+        logger.error(f"Error applying migrations: {e}")
         raise
 
 def verify_tables():
@@ -72,13 +83,7 @@ def verify_tables():
     try:
         logger.info("Verifying tables...")
 
-        with engine.connect() as conn:
-            result = conn.execute(text(
-                "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES "
-                "WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_CATALOG = :db_name"
-            ), {"db_name": settings.db_name})
-
-            tables = [row[0] for row in result]
+        tables = inspect(engine).get_table_names()
 
         logger.info(f"Found {len(tables)} tables in database:")
         for table in tables:
@@ -103,10 +108,13 @@ def main():
         logger.info("=" * 60)
 
         logger.info("\nStep 1: Creating database...")
-        create_database_if_not_exists()
+        if settings.database_backend == "mssql":
+            create_database_if_not_exists()
+        else:
+            logger.info(f"Skipping database creation for {settings.database_backend} backend")
 
-        logger.info("\nStep 2: Creating tables...")
-        create_tables()
+        logger.info("\nStep 2: Applying migrations...")
+        run_migrations()
 
         logger.info("\nStep 3: Verifying tables...")
         verify_tables()
@@ -0,0 +1,44 @@
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.review_service import ReviewService
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+
+    try:
+        logger.info("=" * 60)
+        logger.info("ToyVerse Rating Aggregate Repair")
+        logger.info("=" * 60)
+
+        db = SessionLocal()
+
+        try:
+            service = ReviewService(ReviewRepository(db), ProductRepository(db))
+            updated = service.rebuild_rating_aggregates()
+            db.commit()
+
+            logger.info(f"✓ Rating aggregates rebuilt for {updated} reviewed products")
+            logger.info("  Products without reviews were reset to zero")
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"\n{'=' * 60}")
+        logger.error("Rating aggregate repair FAILED!")
+        logger.error(f"{'=' * 60}")
+        logger.error(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
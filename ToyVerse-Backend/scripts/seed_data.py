@@ -9,6 +9,8 @@ from app.core.database import SessionLocal
 from app.core.security import hash_password
 from app.models.user import Admin, Customer
 from app.models.product import Product
+from app.repositories.product_repository import ProductRepository
+import json
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -223,21 +225,20 @@ def create_products(db: Session) -> None:
 
         logger.info(f"Creating {len(INITIAL_PRODUCTS)} products...")
 
-        for product_data in INITIAL_PRODUCTS:
-            product = Product(
-                title=product_data["title"],
-                price=product_data["price"],
-                category=product_data["category"],
-                stock=product_data["stock"],
-                rating=product_data["rating"],
-                icon=product_data["icon"],
-                description=product_data["description"],
-                detailed_description=product_data["detailed_description"]
-            )
-
-            product.images = product_data["images"]
-
-            db.add(product)
+        ProductRepository(db).create_many([
+            {
+                "title": product_data["title"],
+                "price": product_data["price"],
+                "category": product_data["category"],
+                "stock": product_data["stock"],
+                "rating": product_data["rating"],
+                "icon": product_data["icon"],
+                "description": product_data["description"],
+                "detailed_description": product_data["detailed_description"],
+                "images_json": json.dumps(product_data["images"]),
+            }
+            for product_data in INITIAL_PRODUCTS
+        ])
 
         db.commit()
 
@@ -1,13 +1,19 @@
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.core.config import settings
 from app.core.database import Base, get_db
+from app.core.unit_of_work import request_session
 from app.models.user import Admin, Customer
 from app.core.security import hash_password
+from app.core.rate_limit import login_rate_limiter, MemoryBucketStore
+from app.core.cache import repository_cache, MemoryCacheBackend
+from app.core.session_profiles import session_profiles
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
@@ -16,14 +22,19 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+@event.listens_for(engine, "connect")
+def disable_driver_transactions(dbapi_conn, connection_record):
+    dbapi_conn.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def begin(conn):
+    if not conn.connection.dbapi_connection.in_transaction:
+        conn.exec_driver_sql("BEGIN")
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+def override_get_db(request: Request):
+    yield from request_session(TestingSessionLocal, request)
 
 app.dependency_overrides[get_db] = override_get_db
 
@@ -36,7 +47,11 @@ def db_session():
     Base.metadata.drop_all(bind=engine)
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cooccurrence_model_path", str(tmp_path / "cooccurrence.npz"))
+    login_rate_limiter.configure(store=MemoryBucketStore())
+    repository_cache.configure(backend=MemoryCacheBackend())
+    session_profiles.clear()
     with TestClient(app) as test_client:
         yield test_client
 
@@ -57,3 +57,71 @@ class TestAuthAPI:
     def test_get_current_user_unauthorized(self, client):
         response = client.get("/api/auth/me")
         assert response.status_code == 401
+
+    def test_refresh_rotates_token(self, client, customer_user):
+        login = client.post(
+            "/api/auth/login",
+            json={"username": "testcustomer", "password": "customer123"}
+        ).json()
+
+        response = client.post("/api/auth/refresh", json={"refresh_token": login["refresh_token"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["refresh_token"] != login["refresh_token"]
+        assert data["user"]["username"] == "testcustomer"
+
+        reused = client.post("/api/auth/refresh", json={"refresh_token": login["refresh_token"]})
+        assert reused.status_code == 401
+
+        rotated = client.post("/api/auth/refresh", json={"refresh_token": data["refresh_token"]})
+        assert rotated.status_code == 401
+
+    def test_logout_revokes_tokens(self, client, customer_user):
+        login = client.post(
+            "/api/auth/login",
+            json={"username": "testcustomer", "password": "customer123"}
+        ).json()
+        headers = {"Authorization": f"Bearer {login['access_token']}"}
+
+        assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+        response = client.post(
+            "/api/auth/logout",
+            json={"refresh_token": login["refresh_token"]},
+            headers=headers
+        )
+
+        assert response.status_code == 200
+        assert client.get("/api/auth/me", headers=headers).status_code == 401
+        assert client.post(
+            "/api/auth/refresh",
+            json={"refresh_token": login["refresh_token"]}
+        ).status_code == 401
+
+    def test_login_throttled_per_account(self, client, customer_user):
+        from app.core.config import settings
+
+        for _ in range(settings.login_account_burst):
+            client.post(
+                "/api/auth/login",
+                json={"username": "testcustomer", "password": "wrongpassword"}
+            )
+
+        response = client.post(
+            "/api/auth/login",
+            json={"username": "TestCustomer", "password": "customer123"}
+        )
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+
+    def test_metrics_require_admin(self, client, admin_token, customer_token):
+        assert client.get("/metrics").status_code in (401, 403)
+
+        response = client.get("/metrics", headers={"Authorization": f"Bearer {customer_token}"})
+        assert response.status_code == 403
+
+        response = client.get("/metrics", headers={"Authorization": f"Bearer {admin_token}"})
+        assert response.status_code == 200
+        assert "interaction_buffer" in response.json()
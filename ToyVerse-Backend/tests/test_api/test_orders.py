@@ -129,3 +129,43 @@ class TestOrdersAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "processing"
+
+    def test_order_events_stream_closes_on_terminal_status(self, client, admin_token, customer_token, sample_product):
+        client.post(
+            "/api/cart/add",
+            json={"product_id": sample_product.id, "quantity": 1},
+            headers={"Authorization": f"Bearer {customer_token}"}
+        )
+
+        create_response = client.post(
+            "/api/orders",
+            json={
+                "customer_details": {
+                    "name": "Test",
+                    "email": "test@test.com",
+                    "phone": "123",
+                    "address": "123",
+                    "city": "City",
+                    "postal_code": "123"
+                },
+                "payment_method": "COD"
+            },
+            headers={"Authorization": f"Bearer {customer_token}"}
+        )
+        order_id = create_response.json()["id"]
+
+        client.put(
+            f"/api/orders/{order_id}/status",
+            json={"status": "cancelled"},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+
+        response = client.get(
+            f"/api/orders/{order_id}/events",
+            headers={"Authorization": f"Bearer {customer_token}"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: status" in response.text
+        assert '"status": "cancelled"' in response.text
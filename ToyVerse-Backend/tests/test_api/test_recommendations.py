@@ -0,0 +1,19 @@
+from app.core.interaction_buffer import interaction_buffer
+
+class TestRecommendationsAPI:
+    def test_track_is_accepted_without_touching_the_database(self, client, sample_product):
+        accepted = interaction_buffer.stats()["accepted"]
+
+        response = client.post(
+            f"/api/recommendations/track?product_id={sample_product.id}",
+            headers={"X-Session-ID": "anon-1"}
+        )
+
+        assert response.status_code == 202
+        assert response.json()["queued"] is True
+        assert interaction_buffer.stats()["accepted"] == accepted + 1
+
+    def test_recommendations_endpoint_serves(self, client, sample_product):
+        response = client.get("/api/recommendations", headers={"X-Session-ID": "anon-1"})
+
+        assert response.status_code == 200
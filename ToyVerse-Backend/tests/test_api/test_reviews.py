@@ -0,0 +1,52 @@
+import pytest
+
+class TestReviewsAPI:
+    def test_review_summary_for_many_products(self, client, customer_token, sample_product):
+        client.post(
+            "/api/reviews",
+            json={"product_id": sample_product.id, "rating": 4, "text": "Nice"},
+            headers={"Authorization": f"Bearer {customer_token}"}
+        )
+
+        response = client.get(f"/api/reviews/summary?product_ids={sample_product.id},9999")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data == [{
+            "product_id": sample_product.id,
+            "count": 1,
+            "average": 4.0,
+            "histogram": {"1": 0, "2": 0, "3": 0, "4": 1, "5": 0}
+        }]
+        assert "ETag" in response.headers
+
+    def test_review_summary_not_modified(self, client, sample_product):
+        response = client.get(f"/api/reviews/summary?product_ids={sample_product.id}")
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            f"/api/reviews/summary?product_ids={sample_product.id}",
+            headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+
+        for header, expected in (
+            (f'"other", {etag.removeprefix("W/")}', 304),
+            ("*", 304),
+            (etag[:-2] + '"', 200),
+            (f'"{etag}x"', 200),
+        ):
+            response = client.get(
+                f"/api/reviews/summary?product_ids={sample_product.id}",
+                headers={"If-None-Match": header}
+            )
+            assert response.status_code == expected, header
+
+    def test_review_summary_rejects_invalid_ids(self, client):
+        for value in ("abc", "²", "0", "-3"):
+            response = client.get(f"/api/reviews/summary?product_ids={value}")
+            assert response.status_code == 422, value
+
+        response = client.get("/api/reviews/summary?product_ids=,")
+        assert response.status_code == 400
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.product import Product
+from app.repositories.async_product_repository import AsyncProductRepository
+from app.services.async_product_service import AsyncProductService
+
+def run_with_service(callback, products=()):
+    async def runner():
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        try:
+            async with session_factory() as session:
+                session.add_all([product_from(data) for data in products])
+                await session.commit()
+                return await callback(AsyncProductService(AsyncProductRepository(session)))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(runner())
+
+def product_from(data):
+    product = Product(**{key: value for key, value in data.items() if key != "images"})
+    product.images = data.get("images", [])
+    return product
+
+PRODUCT_DATA = {
+    "title": "Async Robot",
+    "price": 49.99,
+    "category": "Robots",
+    "stock": 3,
+    "description": "Runs on the event loop",
+    "images": ["http://example.com/robot.jpg"]
+}
+
+class TestAsyncProductService:
+    def test_get_and_count(self):
+        async def scenario(service):
+            fetched = await service.get_by_id(1)
+            return fetched, await service.get_by_id(99), await service.count()
+
+        fetched, missing, count = run_with_service(scenario, [PRODUCT_DATA])
+
+        assert fetched.title == "Async Robot"
+        assert fetched.images == ["http://example.com/robot.jpg"]
+        assert missing is None
+        assert count == 1
+
+    def test_filter_products(self):
+        async def scenario(service):
+            robots = await service.filter_products(category="Robots")
+            in_stock = await service.filter_products(in_stock=True)
+            searched = await service.filter_products(search="bear")
+            return robots, in_stock, searched
+
+        robots, in_stock, searched = run_with_service(
+            scenario,
+            [PRODUCT_DATA, dict(PRODUCT_DATA, title="Plush Bear", category="Plush", stock=0)]
+        )
+
+        assert [p.title for p in robots] == ["Async Robot"]
+        assert [p.title for p in in_stock] == ["Async Robot"]
+        assert [p.title for p in searched] == ["Plush Bear"]
+
+    def test_products_route_disabled_by_default(self, client, sample_product):
+        response = client.get(f"/api/products/{sample_product.id}")
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Test Toy"
@@ -1,8 +1,11 @@
+import asyncio
+import time
 import pytest
 from app.services.auth_service import AuthService
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserCreate
-from app.core.security import verify_password
+from app.core.security import verify_password, password_handler, JWTHandler, TokenClaimsCache
+from app.core.principal_cache import principal_cache
 
 class TestAuthService:
     def test_register_user(self, db_session):
@@ -74,3 +77,140 @@ class TestAuthService:
         assert retrieved_user is not None
         assert retrieved_user.id == customer_user.id
         assert retrieved_user.username == customer_user.username
+
+    def test_authenticate_async_uses_hash_pool(self, db_session, customer_user):
+        repo = UserRepository(db_session)
+        service = AuthService(repo)
+
+        user = asyncio.run(service.authenticate_async("testcustomer", "customer123"))
+        rejected = asyncio.run(service.authenticate_async("testcustomer", "wrong-password"))
+
+        assert user is not None
+        assert user.id == customer_user.id
+        assert rejected is None
+        assert password_handler.queue_depth == 0
+        assert password_handler.stats()["completed"] >= 2
+
+    def test_concurrent_async_logins_exceed_pool_size(self, tmp_path):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import QueuePool
+        from app.core.database import Base
+        from app.core.security import hash_password
+        from app.models.user import Customer
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'logins.db'}",
+            poolclass=QueuePool,
+            pool_size=2,
+            max_overflow=0,
+            pool_timeout=1
+        )
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as session:
+            session.add(Customer(
+                username="pooled",
+                email="pooled@test.com",
+                password_hash=hash_password("customer123"),
+                role="customer"
+            ))
+            session.commit()
+
+        async def login():
+            db = Session()
+            try:
+                user = await AuthService(UserRepository(db)).authenticate_async("pooled", "customer123")
+                return user.username if user else None
+            finally:
+                db.close()
+
+        async def scenario():
+            return await asyncio.gather(*(login() for _ in range(8)))
+
+        assert asyncio.run(scenario()) == ["pooled"] * 8
+        assert engine.pool.checkedout() == 0
+        engine.dispose()
+
+    def test_principal_cached_until_invalidated(self, db_session, customer_user):
+        repo = UserRepository(db_session)
+        service = AuthService(repo)
+
+        token = service.create_token(customer_user)
+        principal = service.get_principal_by_token(token)
+
+        assert principal.id == customer_user.id
+        assert principal.role == "customer"
+        assert "manage_cart" in principal.get_permissions()
+
+        db_session.delete(customer_user)
+        db_session.commit()
+
+        assert service.get_principal_by_token(token) == principal
+
+        principal_cache.invalidate_user(principal.id)
+
+        assert service.get_principal_by_token(token) is None
+
+    def test_authenticate_upgrades_hash_scheme(self, db_session, customer_user):
+        repo = UserRepository(db_session)
+        service = AuthService(repo)
+
+        assert customer_user.password_hash.startswith("$2")
+
+        password_handler.configure(scheme="argon2id", argon2_time_cost=1, argon2_memory_cost=1024, argon2_parallelism=1)
+        try:
+            user = asyncio.run(service.authenticate_async("testcustomer", "customer123"))
+
+            assert user is not None
+            assert user.password_hash.startswith("$argon2id$")
+            assert not password_handler.needs_rehash(user.password_hash)
+            assert service.authenticate("testcustomer", "customer123") is not None
+        finally:
+            password_handler.configure(scheme="bcrypt")
+
+        assert password_handler.needs_rehash(user.password_hash)
+        assert service.authenticate("testcustomer", "customer123") is not None
+        assert user.password_hash.startswith("$2")
+
+    def test_bcrypt_cost_change_needs_rehash(self, customer_user):
+        rounds = password_handler.stats()["bcrypt_rounds"]
+
+        assert not password_handler.needs_rehash(customer_user.password_hash)
+
+        password_handler.configure(rounds=rounds + 1)
+        try:
+            assert password_handler.needs_rehash(customer_user.password_hash)
+        finally:
+            password_handler.configure(rounds=rounds)
+
+class TestTokenClaimsCache:
+    def test_cache_hit_returns_verified_claims(self):
+        cache = TokenClaimsCache(max_entries=10)
+        handler = JWTHandler(cache=cache)
+        token = handler.create_access_token({"sub": "cached"})
+
+        first = handler.verify_token(token)
+        second = handler.verify_token(token)
+
+        assert first == second
+        assert second["sub"] == "cached"
+        assert cache.stats()["hits"] == 1
+        assert handler.verify_token(token + "x") is None
+
+    def test_cache_honors_expiry(self):
+        cache = TokenClaimsCache(max_entries=10)
+        cache.put("expired", {"sub": "old", "exp": time.time() - 1})
+
+        assert cache.get("expired") is None
+        assert cache.stats()["expired"] == 1
+
+    def test_cache_is_bounded(self):
+        cache = TokenClaimsCache(max_entries=2)
+        for token in ("a", "b", "c"):
+            cache.put(token, {"exp": time.time() + 60})
+
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+        assert cache.stats()["entries"] == 2
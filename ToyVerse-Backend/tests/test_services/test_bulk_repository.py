@@ -0,0 +1,53 @@
+from sqlalchemy import event
+
+from app.models.product import Product
+from app.models.wishlist import Wishlist
+from app.repositories.product_repository import ProductRepository
+from app.services.wishlist_service import WishlistService
+
+def count_statements(engine, calls):
+    def record(conn, cursor, statement, parameters, context, executemany):
+        calls.append(statement)
+    event.listen(engine, "before_cursor_execute", record)
+    return record
+
+class TestBulkRepository:
+    def test_create_many_inserts_with_defaults(self, db_session):
+        repository = ProductRepository(db_session)
+        rows = [
+            {"title": f"Block Set {i}", "price": 5 + i, "category": "Sets", "stock": i}
+            for i in range(25)
+        ]
+
+        assert repository.create_many(rows) == 25
+        db_session.commit()
+
+        products = db_session.query(Product).filter(Product.title.like("Block Set %")).all()
+        assert len(products) == 25
+        assert all(p.created_at is not None and p.rating_count == 0 for p in products)
+
+    def test_update_many_refreshes_loaded_entities(self, db_session):
+        repository = ProductRepository(db_session)
+        repository.create_many([
+            {"title": "Kite", "price": 5, "category": "Outdoor", "stock": 3},
+            {"title": "Yo-yo", "price": 2, "category": "Classic", "stock": 9},
+        ])
+        kite, yoyo = db_session.query(Product).order_by(Product.title).all()
+
+        assert repository.update_many({kite.id: {"stock": 1}, yoyo.id: {"stock": 4}}) == 2
+
+        assert (kite.stock, yoyo.stock) == (1, 4)
+
+    def test_delete_where_is_set_based(self, db_session, sample_product, customer_user):
+        engine = db_session.get_bind()
+        db_session.add_all([Wishlist(user_id=customer_user.id, product_id=sample_product.id) for _ in range(5)])
+        db_session.commit()
+
+        calls = []
+        listener = count_statements(engine, calls)
+        removed = WishlistService(db_session).clear_wishlist(customer_user.id)
+        event.remove(engine, "before_cursor_execute", listener)
+
+        assert removed == 5
+        assert len([sql for sql in calls if sql.startswith("DELETE")]) == 1
+        assert db_session.query(Wishlist).count() == 0
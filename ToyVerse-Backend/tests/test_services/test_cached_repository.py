@@ -0,0 +1,138 @@
+import pickle
+from sqlalchemy import event
+
+from app.core.cache import CachedEntity, MemoryCacheBackend, RepositoryCache, SQLiteCacheBackend
+from app.core.config import Settings
+from app.models.review import Review
+from app.core.unit_of_work import READ_ONLY_KEY, UnitOfWork
+from app.repositories.cached_repository import CachedRepository
+from app.repositories.product_repository import ProductRepository
+from app.repositories.review_repository import ReviewRepository
+from tests.conftest import TestingSessionLocal
+
+TTLS = {"get_by_id": 60, "get_by_category": 60}
+
+def open_session(read_only=True):
+    session = TestingSessionLocal()
+    if read_only:
+        session.info[READ_ONLY_KEY] = True
+    return session
+
+def count_statements(engine, calls):
+    def record(conn, cursor, statement, parameters, context, executemany):
+        calls.append(statement)
+    event.listen(engine, "before_cursor_execute", record)
+    return record
+
+class TestCachedRepository:
+    def test_read_only_session_is_served_from_cache(self, db_session, sample_product):
+        cache = RepositoryCache(MemoryCacheBackend())
+        engine = db_session.get_bind()
+
+        first = open_session()
+        product = CachedRepository(ProductRepository(first), TTLS, cache=cache).get_by_id(sample_product.id)
+        first.close()
+
+        second = open_session()
+        calls = []
+        listener = count_statements(engine, calls)
+        cached = CachedRepository(ProductRepository(second), TTLS, cache=cache).get_by_id(sample_product.id)
+        event.remove(engine, "before_cursor_execute", listener)
+
+        assert calls == []
+        assert cached.title == product.title
+        assert cached in second
+        assert cache.stats()["namespaces"]["products"]["hits"] == 1
+        second.close()
+
+    def test_write_invalidates_after_commit(self, db_session, sample_product):
+        cache = RepositoryCache(MemoryCacheBackend())
+
+        reader = open_session()
+        CachedRepository(ProductRepository(reader), TTLS, cache=cache).get_by_category(sample_product.category)
+        reader.close()
+
+        writer = open_session(read_only=False)
+        repository = CachedRepository(ProductRepository(writer), TTLS, cache=cache)
+        repository.update(sample_product.id, {"category": "Puzzles"})
+        UnitOfWork.for_session(writer).commit()
+        writer.close()
+
+        reader = open_session()
+        products = CachedRepository(ProductRepository(reader), TTLS, cache=cache).get_by_category("Puzzles")
+        assert [p.id for p in products] == [sample_product.id]
+        assert cache.stats()["namespaces"]["products"]["invalidations"] == 2
+        reader.close()
+
+    def test_entities_are_cached_as_column_values(self, db_session, customer_user, sample_product):
+        db_session.add(Review(product_id=sample_product.id, user_id=customer_user.id, rating=4, text="Fun"))
+        db_session.commit()
+        backend = MemoryCacheBackend()
+        cache = RepositoryCache(backend)
+        ttls = {"get_product_reviews_page": 60}
+
+        first = open_session()
+        CachedRepository(ReviewRepository(first), ttls, cache=cache).get_product_reviews_page(sample_product.id)
+        first.close()
+
+        (payload, _), = backend._entries.values()
+        review, = pickle.loads(payload)
+        assert isinstance(review, CachedEntity)
+        assert review.columns["text"] == "Fun"
+        assert isinstance(review.relationships["user"], CachedEntity)
+        assert "password_hash" not in review.relationships["user"].columns
+
+        second = open_session()
+        calls = []
+        listener = count_statements(db_session.get_bind(), calls)
+        cached, = CachedRepository(ReviewRepository(second), ttls, cache=cache).get_product_reviews_page(sample_product.id)
+        username = cached.user.username
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+
+        assert calls == []
+        assert username == customer_user.username
+        assert cached in second
+        second.close()
+
+    def test_backend_defaults_to_shared_store_with_several_workers(self):
+        assert Settings().repository_cache_backend == "memory"
+        assert Settings(WEB_CONCURRENCY=4).repository_cache_backend == "sqlite"
+        assert Settings(WEB_CONCURRENCY=4, REPOSITORY_CACHE_BACKEND="redis").repository_cache_backend == "redis"
+
+    def test_write_sessions_bypass_cache(self, db_session, sample_product):
+        cache = RepositoryCache(MemoryCacheBackend())
+        session = open_session(read_only=False)
+        repository = CachedRepository(ProductRepository(session), TTLS, cache=cache)
+
+        repository.get_by_id(sample_product.id)
+        repository.get_by_id(sample_product.id)
+
+        counters = cache.stats()["namespaces"]["products"]
+        assert counters["bypassed"] == 2
+        assert "hits" not in counters
+        session.close()
+
+    def test_sqlite_backend_is_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        writer = SQLiteCacheBackend(path)
+        reader = SQLiteCacheBackend(path)
+
+        writer.set("products:0:get_by_id:1", b"toy", 60)
+        assert reader.get("products:0:get_by_id:1") == b"toy"
+
+        assert writer.incr("products:version") == 1
+        assert reader.counter("products:version") == 1
+
+        writer.set("expired", b"old", -1)
+        assert reader.get("expired") is None
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+        backend.get("a")
+        backend.set("c", b"3", 60)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == b"1"
+        assert backend.stats()["evictions"] == 1
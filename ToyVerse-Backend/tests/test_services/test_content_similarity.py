@@ -0,0 +1,128 @@
+import numpy as np
+
+from app.core.content_similarity import ContentSimilarityIndex, product_terms
+from app.repositories.interaction_repository import InteractionRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.product_service import ProductService
+from app.services.recommendation_service import RecommendationService
+
+CATALOG = [
+    (1, "Wooden Train Set", "Classic wooden railway with tracks", "Trains"),
+    (2, "Electric Train Set", "Battery powered railway engine and tracks", "Trains"),
+    (3, "Space Puzzle", "1000 piece puzzle of the solar system", "Puzzles"),
+    (4, "Ocean Puzzle", "500 piece puzzle of coral reef fish", "Puzzles"),
+    (5, "Plush Bear", "Soft teddy bear", "Plush"),
+]
+
+def index_of(catalog):
+    index = ContentSimilarityIndex()
+    index.build(catalog)
+    return index
+
+class TestContentSimilarityIndex:
+    def test_terms_are_weighted_by_field(self):
+        terms = product_terms("Train Set", "A train for the set", "Trains")
+
+        assert terms == {"train": 3.0, "set": 3.0, "trains": 3.0}
+
+    def test_neighbours_share_content(self):
+        index = index_of(CATALOG)
+
+        assert [pid for pid, _ in index.similar(1, 1)] == [2]
+        assert [pid for pid, _ in index.similar(3, 1)] == [4]
+        assert index.similar(5, 3) == []
+        assert index.similar(99, 3) == []
+
+    def test_scores_match_dense_cosine(self):
+        index = index_of(CATALOG)
+        matrix = index._matrix.toarray()
+        dense = matrix @ matrix[0]
+
+        for product_id, score in index.similar(1, 4):
+            assert np.isclose(score, dense[product_id - 1])
+
+    def test_incremental_updates_match_rebuild(self):
+        index = index_of(CATALOG)
+
+        index.upsert(6, "Wooden Puzzle Train", "Wooden train shaped puzzle", "Puzzles")
+        index.upsert(5, "Plush Train", "Soft train for toddlers", "Plush")
+        index.remove(3)
+
+        rebuilt = index_of([
+            CATALOG[0], CATALOG[1], CATALOG[3],
+            (5, "Plush Train", "Soft train for toddlers", "Plush"),
+            (6, "Wooden Puzzle Train", "Wooden train shaped puzzle", "Puzzles"),
+        ])
+
+        for product_id in (1, 2, 4, 5, 6):
+            assert {pid for pid, _ in index.similar(product_id, 5)} == {pid for pid, _ in rebuilt.similar(product_id, 5)}
+        assert index.similar(3, 5) == []
+        assert index.stats()["refreshes"] == 1
+        assert index.stats()["pending"] == 3
+
+        assert index.refresh()
+        assert not index.refresh()
+
+        for product_id in (1, 2, 4, 5, 6):
+            assert [pid for pid, _ in index.similar(product_id, 5)] == [pid for pid, _ in rebuilt.similar(product_id, 5)]
+            assert np.allclose(
+                [score for _, score in index.similar(product_id, 5)],
+                [score for _, score in rebuilt.similar(product_id, 5)]
+            )
+        assert index.similar(3, 5) == []
+
+    def test_writes_during_build_survive_the_snapshot(self):
+        index = ContentSimilarityIndex()
+        index.begin_build()
+        snapshot = list(CATALOG)
+
+        index.upsert(6, "Wooden Puzzle Train", "Wooden train shaped puzzle", "Puzzles")
+        index.upsert(5, "Plush Train", "Soft train for toddlers", "Plush")
+        index.remove(3)
+        index.build(snapshot)
+
+        rebuilt = index_of([
+            CATALOG[0], CATALOG[1], CATALOG[3],
+            (5, "Plush Train", "Soft train for toddlers", "Plush"),
+            (6, "Wooden Puzzle Train", "Wooden train shaped puzzle", "Puzzles"),
+        ])
+
+        assert index.stats()["products"] == 5
+        for product_id in (1, 2, 4, 5, 6):
+            assert index.similar(product_id, 5) == rebuilt.similar(product_id, 5)
+        assert index.similar(3, 5) == []
+
+class TestContentRecommendations:
+    def test_product_service_writes_update_index(self, db_session):
+        index = ContentSimilarityIndex()
+        index.build([])
+        repo = ProductRepository(db_session)
+        service = ProductService(repo, similarity=index)
+
+        train = service.create({'title': 'Wooden Train', 'price': 10, 'category': 'Trains', 'description': 'Railway'})
+        other = service.create({'title': 'Electric Train', 'price': 20, 'category': 'Trains', 'description': 'Railway'})
+        assert index.stats()["products"] == 0
+
+        repo.commit()
+        assert [pid for pid, _ in index.similar(train.id, 5)] == [other.id]
+
+        service.delete(other.id)
+        repo.commit()
+        assert index.similar(train.id, 5) == []
+
+    def test_product_recommendations_use_ready_index(self, db_session, sample_product):
+        repo = ProductRepository(db_session)
+        index = ContentSimilarityIndex()
+        index.build(repo.get_content_fields())
+        service = ProductService(repo, similarity=index)
+
+        twin = service.create({'title': 'Test Toy Deluxe', 'price': 10, 'category': 'Sets', 'description': 'A test toy'})
+        service.create({'title': 'Plush Bear', 'price': 10, 'category': 'Plush', 'description': 'Soft'})
+        repo.commit()
+
+        recommendations = RecommendationService(
+            InteractionRepository(db_session), repo, similarity=index
+        ).get_product_recommendations(sample_product.id)
+
+        assert [r['id'] for r in recommendations] == [twin.id]
+        assert recommendations[0]['reason'] == 'Similar to Test Toy'
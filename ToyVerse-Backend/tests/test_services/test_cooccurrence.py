@@ -0,0 +1,199 @@
+import time
+
+from app.core.cooccurrence import CooccurrenceModel, actor_key
+from app.repositories.interaction_repository import InteractionRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.recommendation_service import RecommendationService
+
+ROWS = [
+    ("u:1", 10, 3), ("u:1", 20, 1), ("u:1", 30, 1),
+    ("u:2", 10, 1), ("u:2", 20, 2),
+    ("s:a", 20, 1), ("s:a", 30, 4),
+]
+
+def model_from(rows):
+    model = CooccurrenceModel()
+    model.build(rows)
+    return model
+
+class TestCooccurrenceModel:
+    def test_related_ranks_by_cooccurring_interactions(self):
+        model = model_from(ROWS)
+
+        assert model.related(10, 5) == [20, 30]
+        assert model.related(20, 5) == [30, 10]
+        assert model.related(30, 1) == [10]
+        assert model.related(99, 5) == []
+
+    def test_incremental_updates_match_rebuild(self):
+        model = model_from(ROWS)
+        events = [("u:2", 30), ("s:b", 10), ("s:b", 40), ("u:1", 10), ("s:a", 40)]
+
+        for actor, product_id in events:
+            model.add(actor, product_id)
+
+        rebuilt = model_from(ROWS + [(actor, product_id, 1) for actor, product_id in events])
+        for product_id in (10, 20, 30, 40):
+            assert model.related(product_id, 10) == rebuilt.related(product_id, 10)
+
+        assert model.compact() > 0
+        for product_id in (10, 20, 30, 40):
+            assert model.related(product_id, 10) == rebuilt.related(product_id, 10)
+        assert model.stats()["pending_pairs"] == 0
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        model = model_from(ROWS)
+        model.add("s:c", 40)
+        model.add("s:c", 10)
+        path = str(tmp_path / "model.npz")
+
+        model.save(path)
+        loaded = CooccurrenceModel()
+
+        assert loaded.load(path)
+        assert loaded.ready
+        for product_id in (10, 20, 30, 40):
+            assert loaded.related(product_id, 10) == model.related(product_id, 10)
+        assert not CooccurrenceModel().load(str(tmp_path / "missing.npz"))
+
+    def test_anonymous_events_without_session_are_ignored(self):
+        model = model_from(ROWS)
+
+        model.add(actor_key(None, None), 10)
+
+        assert model.stats()["events"] == 0
+
+class TestRelatedProductsSource:
+    def test_service_prefers_ready_model(self, db_session, sample_product):
+        model = model_from([("u:1", sample_product.id, 1), ("u:1", 500, 1)])
+        service = RecommendationService(
+            InteractionRepository(db_session),
+            ProductRepository(db_session),
+            cooccurrence=model
+        )
+
+        assert service._get_related_product_ids(sample_product.id) == [500]
+
+    def test_service_falls_back_to_queries_until_ready(self, db_session, sample_product):
+        service = RecommendationService(
+            InteractionRepository(db_session),
+            ProductRepository(db_session),
+            cooccurrence=CooccurrenceModel()
+        )
+
+        assert service._get_related_product_ids(sample_product.id) == []
+
+class TestCooccurrenceLifecycle:
+    def test_session_keys_are_hashed_to_a_fixed_length(self):
+        key = actor_key(None, "x" * 10000)
+
+        assert key.startswith("s:") and len(key) == 18
+        assert key == actor_key(None, "x" * 10000)
+        assert key != actor_key(None, "y")
+        assert actor_key(7, "x") == "u:7"
+
+    def test_actors_over_the_cap_are_evicted_first_seen_first(self):
+        model = CooccurrenceModel(max_actors=2)
+        model.build(ROWS)
+
+        assert model.stats()["actors"] == 2
+        assert model.stats()["evictions"] == 1
+        assert model.related(10, 5) == [20]
+
+        model.add("s:new", 10)
+        model.compact()
+
+        assert model.stats()["actors"] == 2
+        assert model._actor_keys == ["s:a", "s:new"]
+
+    def test_idle_actors_expire(self, monkeypatch):
+        model = model_from(ROWS)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 2 * 86400)
+        model.add("u:1", 40)
+        monkeypatch.setattr(time, "time", lambda: now + 8 * 86400)
+
+        model.compact()
+
+        assert model._actor_keys == ["u:1"]
+        assert model.related(40, 5) == [10, 20, 30]
+
+    def test_returning_evicted_actor_is_counted_once(self):
+        model = CooccurrenceModel(max_actors=2)
+        model.build(ROWS)
+
+        model.add("u:1", 10, 3)
+        model.add("u:1", 20)
+        model.add("u:1", 30)
+        model.compact()
+
+        rebuilt = model_from([row for row in ROWS if row[0] != "u:2"])
+        for product_id in (10, 20, 30):
+            assert model.related(product_id, 10) == rebuilt.related(product_id, 10)
+            assert model._row(product_id)[1].tolist() == rebuilt._row(product_id)[1].tolist()
+
+    def test_catch_up_from_watermark_matches_rebuild(self, tmp_path):
+        path = str(tmp_path / "model.npz")
+        snapshot = model_from([])
+        snapshot.build(ROWS, watermark=7)
+        snapshot.save(path)
+
+        model = CooccurrenceModel()
+        assert model.load(path)
+        assert model.watermark == 7
+
+        later = [("u:2", 30, 1), ("s:b", 10, 2), ("s:b", 40, 1)]
+        model.catch_up(later, watermark=10)
+
+        rebuilt = model_from(ROWS + later)
+        assert model.watermark == 10
+        for product_id in (10, 20, 30, 40):
+            assert model.related(product_id, 10) == rebuilt.related(product_id, 10)
+
+    def test_startup_ignores_a_snapshot_ahead_of_the_database(self, db_session, sample_product, tmp_path, monkeypatch):
+        from sqlalchemy.orm import sessionmaker
+        from app import main
+        from app.core.config import settings
+
+        path = str(tmp_path / "model.npz")
+        stale = CooccurrenceModel()
+        stale.build(ROWS, watermark=1000)
+        stale.save(path)
+
+        model = CooccurrenceModel()
+        monkeypatch.setattr(settings, "cooccurrence_model_path", path)
+        monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+        monkeypatch.setattr(main, "cooccurrence_model", model)
+
+        main.load_cooccurrence_model()
+
+        assert model.ready
+        assert model.watermark == 0
+        assert model.related(10, 5) == []
+
+    def test_periodic_catch_up_reads_new_interactions_once(self, db_session, sample_product, monkeypatch):
+        from sqlalchemy.orm import sessionmaker
+        from app import main
+        from app.models.product import Product
+        from app.models.product_interaction import ProductInteraction
+
+        other = Product(title="Kite", price=5, category="Outdoor", stock=1)
+        db_session.add(other)
+        db_session.commit()
+
+        model = CooccurrenceModel()
+        model.build([])
+        monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+        monkeypatch.setattr(main, "cooccurrence_model", model)
+
+        db_session.add_all([
+            ProductInteraction(user_id=None, session_id="s1", product_id=product_id, interaction_type="view")
+            for product_id in (sample_product.id, other.id)
+        ])
+        db_session.commit()
+
+        assert main.catch_up_cooccurrence_model() == 2
+        assert main.catch_up_cooccurrence_model() == 0
+
+        assert model.watermark == InteractionRepository(db_session).get_max_id()
+        assert model._row(sample_product.id)[1].tolist() == [1]
@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime
+
+from app.core.interaction_buffer import InteractionBuffer
+from app.models.product_interaction import ProductInteraction
+from app.repositories.interaction_repository import InteractionRepository
+
+def event(product_id, session_id="s1"):
+    return {
+        "user_id": None,
+        "product_id": product_id,
+        "interaction_type": "view",
+        "session_id": session_id,
+        "user_agent": None,
+        "ip_address": None,
+        "timestamp": datetime.utcnow(),
+    }
+
+class TestInteractionBuffer:
+    def test_flushes_in_batches(self, db_session, sample_product):
+        buffer = InteractionBuffer(capacity=100, batch_size=4)
+        for _ in range(10):
+            assert buffer.offer(event(sample_product.id))
+
+        repository = InteractionRepository(db_session)
+        batches = []
+
+        def writer(rows):
+            batches.append(len(rows))
+            written = repository.create_many(rows)
+            repository.commit()
+            return written
+
+        assert buffer.flush(writer) == 10
+        assert batches == [4, 4, 2]
+        assert db_session.query(ProductInteraction).count() == 10
+
+        stats = buffer.stats()
+        assert (stats["pending"], stats["flushed"], stats["batches"], stats["lost"]) == (0, 10, 3, 0)
+
+    def test_capacity_bounds_memory(self):
+        buffer = InteractionBuffer(capacity=3, batch_size=10)
+
+        accepted = [buffer.offer(event(i)) for i in range(5)]
+
+        assert accepted == [True, True, True, False, False]
+        assert buffer.pending == 3
+        assert buffer.stats()["dropped"] == 2
+
+    def test_failed_batches_are_counted_as_lost(self):
+        buffer = InteractionBuffer(capacity=10, batch_size=2)
+        for i in range(3):
+            buffer.offer(event(i))
+
+        def failing_writer(rows):
+            raise RuntimeError("database unavailable")
+
+        assert buffer.flush(failing_writer) == 0
+        stats = buffer.stats()
+        assert (stats["pending"], stats["lost"], stats["flush_errors"]) == (0, 3, 2)
+
+    def test_full_batch_wakes_flush_loop(self):
+        buffer = InteractionBuffer(capacity=10, batch_size=2)
+
+        async def scenario():
+            buffer.bind_loop()
+            waiter = asyncio.create_task(buffer.wait_for_batch(timeout=5))
+            await asyncio.sleep(0)
+            buffer.offer(event(1))
+            buffer.offer(event(2))
+            await asyncio.wait_for(waiter, timeout=1)
+
+        asyncio.run(scenario())
+
+    def test_unknown_products_do_not_sink_the_batch(self, db_session, sample_product, monkeypatch):
+        from sqlalchemy.orm import sessionmaker
+        from app import main
+
+        monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+        buffer = InteractionBuffer(capacity=10, batch_size=10)
+        for product_id in (sample_product.id, 9999, sample_product.id):
+            buffer.offer(event(product_id))
+
+        assert buffer.flush(main.write_interactions) == 2
+        assert db_session.query(ProductInteraction).count() == 2
+        assert buffer.stats()["lost"] == 1
@@ -0,0 +1,87 @@
+import os
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.database import Base
+import app.models
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+def alembic_config(url):
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+class TestMigrations:
+    def test_head_matches_models(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'migrated.db'}"
+        command.upgrade(alembic_config(url), "head")
+
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+        engine.dispose()
+
+        assert diff == []
+
+    def test_hot_path_indexes_added_and_removed(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'migrated.db'}"
+        config = alembic_config(url)
+        engine = create_engine(url)
+
+        command.upgrade(config, "head")
+        indexes = {index["name"] for index in inspect(engine).get_indexes("product_interactions")}
+        assert "ix_product_interactions_session_id_timestamp" in indexes
+
+        command.downgrade(config, "0001")
+        indexes = {index["name"] for index in inspect(engine).get_indexes("product_interactions")}
+        assert "ix_product_interactions_session_id_timestamp" not in indexes
+        engine.dispose()
+
+    def test_pre_series_database_upgrades_with_backfill(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        config = alembic_config(url)
+        engine = create_engine(url)
+
+        command.upgrade(config, "0001")
+        assert "revoked_tokens" not in inspect(engine).get_table_names()
+
+        with engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO users (id, username, email, password_hash, role, created_at, updated_at) "
+                "VALUES (1, 'u', 'u@test.com', 'x', 'customer', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ))
+            for product_id, rating in ((1, 5), (2, 4), (3, 0)):
+                conn.execute(text(
+                    "INSERT INTO products (id, title, price, category, stock, rating, created_at, updated_at) "
+                    f"VALUES ({product_id}, 'Toy', 1, 'Sets', 1, {rating}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ))
+            for rating in (3, 4, 4):
+                conn.execute(text(
+                    "INSERT INTO reviews (product_id, user_id, rating, created_at, updated_at) "
+                    f"VALUES (1, 1, {rating}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ))
+
+        command.upgrade(config, "head")
+
+        tables = inspect(engine).get_table_names()
+        assert {"revoked_tokens", "refresh_tokens"} <= set(tables)
+        with engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT id, rating, rating_sum, rating_count, rating_3_count, rating_4_count "
+                "FROM products ORDER BY id"
+            )).fetchall()
+        assert [tuple(row) for row in rows] == [
+            (1, 4, 11, 3, 1, 2),
+            (2, 4, 0, 0, 0, 0),
+            (3, 0, 0, 0, 0, 0),
+        ]
+
+        command.downgrade(config, "0001")
+        assert "rating_sum" not in {column["name"] for column in inspect(engine).get_columns("products")}
+        engine.dispose()
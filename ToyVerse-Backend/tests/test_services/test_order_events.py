@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from app.core.events import EventBroker
+
+class TestEventBroker:
+    def test_publish_fans_out_to_topic_subscribers(self):
+        async def scenario():
+            broker = EventBroker()
+            first = broker.subscribe(1)
+            second = broker.subscribe(1)
+            other = broker.subscribe(2)
+
+            delivered = broker.publish(1, {'status': 'shipped'})
+
+            assert delivered == 2
+            assert await first.get(timeout=0.1) == {'status': 'shipped'}
+            assert await second.get(timeout=0.1) == {'status': 'shipped'}
+            assert await other.get(timeout=0.01) is None
+
+            for subscription in (first, second, other):
+                subscription.close()
+
+            assert broker.subscriber_count() == 0
+
+        asyncio.run(scenario())
+
+    def test_slow_subscriber_keeps_latest_events(self):
+        async def scenario():
+            broker = EventBroker(max_pending=2)
+            subscription = broker.subscribe(1)
+
+            for status in ('pending', 'processing', 'shipped'):
+                broker.publish(1, {'status': status})
+
+            assert subscription.dropped == 1
+            assert (await subscription.get(timeout=0.1))['status'] == 'processing'
+            assert (await subscription.get(timeout=0.1))['status'] == 'shipped'
+            subscription.close()
+
+        asyncio.run(scenario())
+
+    def test_publish_from_worker_thread(self):
+        async def scenario():
+            broker = EventBroker()
+            subscription = broker.subscribe(7)
+
+            await asyncio.to_thread(broker.publish, 7, {'status': 'delivered'})
+
+            assert await subscription.get(timeout=1) == {'status': 'delivered'}
+            subscription.close()
+
+        asyncio.run(scenario())
+
+class TestOrderEventsRoute:
+    def test_stream_releases_session_before_streaming(self, db_session, customer_user):
+        from app.api.routes.orders import stream_order_events
+        from app.core.principal_cache import Principal
+        from app.models.order import Order
+        from app.repositories.cart_repository import CartRepository
+        from app.repositories.order_repository import OrderRepository
+        from app.repositories.product_repository import ProductRepository
+        from app.services.order_service import OrderService
+
+        order = Order(
+            user_id=customer_user.id,
+            order_number="ORD-STREAM",
+            items_json="[]",
+            customer_details_json="{}",
+            total=0,
+            status="pending",
+            payment_method="COD"
+        )
+        db_session.add(order)
+        db_session.commit()
+        order_id = order.id
+        db_session.expire_all()
+
+        service = OrderService(
+            OrderRepository(db_session),
+            CartRepository(db_session),
+            ProductRepository(db_session)
+        )
+        principal = Principal(customer_user.id, customer_user.username, "customer", (), "token")
+
+        async def scenario():
+            response = await stream_order_events(order_id, None, principal, service, db_session)
+            assert not db_session.in_transaction()
+            assert response.media_type == "text/event-stream"
+            await response.body_iterator.aclose()
+
+        asyncio.run(scenario())
@@ -0,0 +1,53 @@
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.cart import CartItem
+from app.models.order import Order
+from app.models.product import Product
+from app.repositories.cart_repository import CartRepository
+from app.repositories.order_repository import OrderRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.order_service import OrderService
+
+def order_service(db_session):
+    return OrderService(
+        OrderRepository(db_session),
+        CartRepository(db_session),
+        ProductRepository(db_session)
+    )
+
+class TestCreateFromCart:
+    def test_checkout_decrements_stock(self, db_session, customer_user, sample_product):
+        db_session.add(CartItem(user_id=customer_user.id, product_id=sample_product.id, quantity=3))
+        db_session.commit()
+
+        order = order_service(db_session).create_from_cart(customer_user.id, {'name': 'Test'})
+        db_session.commit()
+
+        assert order is not None
+        assert db_session.get(Product, sample_product.id).stock == 7
+
+    def test_stale_stock_read_fails_the_order(self, db_session, customer_user, sample_product):
+        db_session.add(CartItem(user_id=customer_user.id, product_id=sample_product.id, quantity=3))
+        db_session.commit()
+
+        service = order_service(db_session)
+        products = service._product_repository
+        stale_get = products.get_by_id
+
+        def get_then_sell_out(id):
+            product = stale_get(id)
+            with Session(db_session.get_bind()) as other:
+                other.execute(update(Product).where(Product.id == id).values(stock=2))
+                other.commit()
+            assert product.stock == 10
+            return product
+
+        products.get_by_id = get_then_sell_out
+
+        assert service.create_from_cart(customer_user.id, {'name': 'Test'}) is None
+
+        db_session.expire_all()
+        assert db_session.get(Product, sample_product.id).stock == 2
+        assert db_session.query(Order).count() == 0
+        assert db_session.query(CartItem).count() == 1
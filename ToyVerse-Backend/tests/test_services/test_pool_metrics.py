@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.db_profiles import engine_options
+from app.core.pool_metrics import InstrumentedQueuePool, PoolMonitor
+
+@pytest.fixture
+def monitored(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **engine_options(url, overrides={"pool_size": 1, "max_overflow": 1, "pool_timeout": 0.05}))
+    monitor = PoolMonitor()
+    monitor.instrument(engine, "primary")
+    yield engine, monitor
+    engine.dispose()
+
+class TestPoolMetrics:
+    def test_overrides_replace_profile_defaults(self):
+        options = engine_options("postgresql://server/db", overrides={"pool_size": 3, "max_overflow": None})
+
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 20
+        assert options["poolclass"] is InstrumentedQueuePool
+
+    def test_tracks_in_use_overflow_and_peak(self, monitored):
+        engine, monitor = monitored
+
+        first = engine.connect()
+        second = engine.connect()
+        first.execute(text("SELECT 1"))
+
+        stats = monitor.stats()["primary"]
+        assert stats["in_use"] == 2
+        assert stats["checked_out"] == 2
+        assert stats["overflow"] == 1
+        assert stats["connects"] == 2
+
+        first.close()
+        second.close()
+
+        stats = monitor.stats()["primary"]
+        assert stats["in_use"] == 0
+        assert stats["peak_in_use"] == 2
+        assert stats["suggested_pool_size"] == 3
+
+    def test_records_timeouts_and_pre_ping(self, monitored):
+        engine, monitor = monitored
+
+        with engine.connect():
+            pass
+
+        held = [engine.connect(), engine.connect()]
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        for conn in held:
+            conn.close()
+
+        stats = monitor.stats()["primary"]
+        assert stats["timeouts"] == 1
+        assert stats["wait_ms_max"] >= 50
+        assert stats["pre_pings"] >= 1
+        assert stats["pre_ping_failures"] == 0
+
+    def test_dispose_keeps_wait_observer(self, monitored):
+        engine, monitor = monitored
+
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert monitor.stats()["primary"]["checkouts"] == 1
+        assert engine.pool.wait_observer is not None
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+from app.core.popularity import PopularityTracker
+from app.core.product_catalog import ProductCatalog
+from app.models.product import Product
+from app.repositories.interaction_repository import InteractionRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.product_service import ProductService
+from app.services.recommendation_service import RecommendationService
+
+HOUR = 3600.0
+
+class TestPopularityTracker:
+    def test_recent_interactions_outrank_older_ones(self):
+        tracker = PopularityTracker(half_life_seconds=HOUR, top_k=10)
+        now = 1_000_000.0
+
+        for _ in range(3):
+            tracker.record(1, at=now - 3 * HOUR)
+        for _ in range(2):
+            tracker.record(2, at=now)
+
+        top = tracker.snapshot(now=now)
+
+        assert [product_id for product_id, _ in top] == [2, 1]
+        assert abs(top[0][1] - 2.0) < 1e-9
+        assert abs(top[1][1] - 3 / 8) < 1e-9
+
+    def test_snapshot_keeps_only_top_k(self):
+        tracker = PopularityTracker(half_life_seconds=HOUR, top_k=3)
+        for product_id in range(1, 7):
+            for _ in range(product_id):
+                tracker.record(product_id)
+
+        assert [product_id for product_id, _ in tracker.snapshot()] == [6, 5, 4]
+        assert len(tracker.top(10)) == 3
+
+    def test_scores_survive_rescaling(self):
+        tracker = PopularityTracker(half_life_seconds=1.0, top_k=5)
+        tracker.record(1, at=0.0)
+        tracker.record(2, at=100.0)
+        tracker.record(2, at=100.0)
+
+        top = tracker.snapshot(now=100.0)
+
+        assert tracker.stats()["rescales"] == 1
+        assert top == [(2, 2.0)]
+
+    def test_seed_from_timestamps(self):
+        tracker = PopularityTracker(half_life_seconds=HOUR)
+        now = datetime.utcnow()
+
+        seeded = tracker.seed([(1, now)] + [(2, now - timedelta(hours=1))] * 3)
+
+        assert seeded == 4
+        assert tracker.ready
+        assert [product_id for product_id, _ in tracker.top(2)] == [2, 1]
+
+class TestPopularRecommendations:
+    def service(self, db_session, tracker):
+        return RecommendationService(
+            InteractionRepository(db_session),
+            ProductRepository(db_session),
+            popularity=tracker
+        )
+
+    def test_uses_tracker_then_top_rated(self, db_session, sample_product):
+        db_session.add_all([
+            Product(title="Plain", price=5, category="Toys", stock=1, rating=2, rating_count=1),
+            Product(title="Loved", price=5, category="Toys", stock=1, rating=5, rating_count=10),
+        ])
+        db_session.commit()
+
+        tracker = PopularityTracker(half_life_seconds=HOUR)
+        tracker.seed([])
+        tracker.record(sample_product.id)
+        tracker.snapshot()
+
+        popular = self.service(db_session, tracker)._get_popular_products(limit=3)
+
+        assert [p['reason'] for p in popular] == ['Popular choice', 'Highly rated', 'Highly rated']
+        assert popular[0]['id'] == sample_product.id
+        assert [p['title'] for p in popular[1:]] == ["Loved", "Plain"]
+
+    def test_track_interaction_feeds_tracker_with_known_products(self, db_session, sample_product):
+        tracker = PopularityTracker(half_life_seconds=HOUR)
+        tracker.seed([])
+        catalog = ProductCatalog()
+        service = RecommendationService(
+            InteractionRepository(db_session),
+            ProductRepository(db_session),
+            popularity=tracker,
+            catalog=catalog
+        )
+
+        service.track_interaction(sample_product.id, 'view', session_id="s1")
+        assert tracker.stats()["events"] == 0
+
+        catalog.load([(sample_product.id, sample_product.category)])
+        service.track_interaction(sample_product.id, 'view', session_id="s1")
+        service.track_interaction(9999, 'view', session_id="s1")
+
+        assert tracker.stats()["events"] == 1
+        assert [product_id for product_id, _ in tracker.snapshot()] == [sample_product.id]
+
+    def test_deleted_products_leave_the_tracker(self, db_session, sample_product):
+        tracker = PopularityTracker(half_life_seconds=HOUR)
+        tracker.seed([])
+        tracker.record(sample_product.id)
+        tracker.snapshot()
+        repo = ProductRepository(db_session)
+
+        ProductService(repo, catalog=ProductCatalog(), popularity=tracker).delete(sample_product.id)
+        repo.commit()
+
+        assert tracker.top(5) == []
+        assert tracker.stats()["products"] == 0
@@ -0,0 +1,69 @@
+from app.core.interaction_buffer import InteractionBuffer
+from app.core.popularity import PopularityTracker
+from app.core.product_catalog import ProductCatalog
+from app.repositories.interaction_repository import InteractionRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.product_service import ProductService
+from app.services.recommendation_service import RecommendationService
+
+class TestProductCatalog:
+    def test_counts_unknown_products_once_loaded(self):
+        catalog = ProductCatalog()
+        assert not catalog.knows(42)
+        assert catalog.stats()["unknown"] == 0
+
+        catalog.load([(1, "Trains")])
+
+        assert catalog.knows(1)
+        assert not catalog.knows(42)
+        assert catalog.category(1) == "Trains"
+        assert catalog.stats()["unknown"] == 1
+
+    def test_writes_during_load_survive_the_snapshot(self):
+        catalog = ProductCatalog()
+        catalog.begin_load()
+        snapshot = [(1, "Trains"), (2, "Puzzles")]
+
+        catalog.put(3, "Plush")
+        catalog.put(1, "Sets")
+        catalog.remove(2)
+        catalog.load(snapshot)
+
+        assert [catalog.category(pid) for pid in (1, 2, 3)] == ["Sets", None, "Plush"]
+        assert not catalog.knows(2)
+
+class TestCatalogValidation:
+    def test_unknown_products_are_buffered_but_kept_out_of_live_models(self, db_session, sample_product):
+        catalog = ProductCatalog()
+        catalog.load([(sample_product.id, sample_product.category)])
+        buffer = InteractionBuffer()
+        tracker = PopularityTracker()
+        service = RecommendationService(
+            InteractionRepository(db_session),
+            ProductRepository(db_session),
+            buffer=buffer,
+            popularity=tracker,
+            catalog=catalog
+        )
+
+        assert service.track_interaction(sample_product.id, 'view', session_id="s1")
+        assert service.track_interaction(9999, 'view', session_id="s1")
+
+        assert buffer.pending == 2
+        assert tracker.stats()["events"] == 1
+
+    def test_product_service_writes_update_catalog(self, db_session):
+        catalog = ProductCatalog()
+        catalog.load([])
+        repo = ProductRepository(db_session)
+        service = ProductService(repo, catalog=catalog)
+
+        product = service.create({'title': 'Wooden Train', 'price': 10, 'category': 'Trains'})
+        assert not catalog.knows(product.id)
+
+        repo.commit()
+        assert catalog.category(product.id) == "Trains"
+
+        service.delete(product.id)
+        repo.commit()
+        assert not catalog.knows(product.id)
@@ -0,0 +1,71 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.query_stats import QueryMetrics, QueryStats, QueryTimingMiddleware, query_metrics
+
+def build_app(detect_repeats):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    app = FastAPI()
+    app.add_middleware(QueryTimingMiddleware, detect_repeats=detect_repeats)
+
+    @app.get("/items")
+    async def items():
+        with engine.connect() as conn:
+            return [conn.execute(text("SELECT :id"), {"id": i}).scalar() for i in range(6)]
+
+    return app
+
+class TestQueryStats:
+    def test_records_count_total_and_slowest(self):
+        stats = QueryStats()
+        stats.record("SELECT 1", 2.0)
+        stats.record("SELECT 2", 5.0)
+
+        assert stats.count == 2
+        assert stats.total_ms == 7.0
+        assert stats.slowest_statement == "SELECT 2"
+        assert stats.server_timing() == 'db;dur=7.00;desc="2 queries", db-slowest;dur=5.00'
+
+    def test_repeats_tracked_only_in_debug(self):
+        quiet, debug = QueryStats(), QueryStats(track_repeats=True)
+        for _ in range(5):
+            quiet.record("SELECT * FROM reviews WHERE id = ?", 1.0)
+            debug.record("SELECT * FROM reviews WHERE id = ?", 1.0)
+
+        assert quiet.repeated_statements(5) == []
+        assert debug.repeated_statements(5) == [("SELECT * FROM reviews WHERE id = ?", 5)]
+
+    def test_metrics_flag_repeated_routes(self):
+        metrics = QueryMetrics(repeat_threshold=3)
+        stats = QueryStats(track_repeats=True)
+        for _ in range(3):
+            stats.record("SELECT * FROM users WHERE id = ?", 1.0)
+
+        metrics.observe("/api/reviews/{product_id}", stats)
+
+        assert metrics.stats()["n_plus_one_routes"] == {"/api/reviews/{product_id}": 1}
+        assert metrics.stats()["max_statements"] == 3
+
+class TestQueryTimingMiddleware:
+    def test_server_timing_header(self):
+        response = TestClient(build_app(detect_repeats=False)).get("/items")
+
+        assert response.status_code == 200
+        assert 'desc="6 queries"' in response.headers["server-timing"]
+        assert "db-repeated" not in response.headers["server-timing"]
+
+    def test_debug_mode_flags_repeated_statements(self):
+        before = query_metrics.stats()["n_plus_one_routes"].get("/items", 0)
+
+        response = TestClient(build_app(detect_repeats=True)).get("/items")
+
+        assert 'db-repeated;desc="1 repeated"' in response.headers["server-timing"]
+        assert query_metrics.stats()["n_plus_one_routes"]["/items"] == before + 1
+
+    def test_api_responses_carry_server_timing(self, client, sample_product):
+        response = client.get(f"/api/products/{sample_product.id}")
+
+        assert response.status_code == 200
+        assert response.headers["server-timing"].startswith("db;dur=")
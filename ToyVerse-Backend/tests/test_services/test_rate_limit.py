@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+from app.core.rate_limit import MemoryBucketStore, SQLiteBucketStore, RateLimiter
+
+class TestBucketStores:
+    def test_memory_bucket_allows_burst_then_rejects(self):
+        store = MemoryBucketStore()
+
+        results = [store.take("key", capacity=3, rate=1.0)[0] for _ in range(4)]
+
+        assert results == [True, True, True, False]
+        assert 0 < store.take("key", capacity=3, rate=1.0)[1] <= 1.0
+
+    def test_memory_store_is_bounded(self):
+        store = MemoryBucketStore(max_entries=2)
+
+        for key in ("a", "b", "c"):
+            store.take(key, capacity=1, rate=1.0)
+
+        assert store.stats()["buckets"] == 2
+        assert store.stats()["evictions"] == 1
+
+    def test_sqlite_store_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "buckets.db")
+        first = SQLiteBucketStore(path)
+        second = SQLiteBucketStore(path)
+
+        assert first.take("key", capacity=2, rate=0.001)[0]
+        assert second.take("key", capacity=2, rate=0.001)[0]
+        assert not first.take("key", capacity=2, rate=0.001)[0]
+
+    def test_disabled_limiter_always_allows(self):
+        limiter = RateLimiter(MemoryBucketStore(), enabled=False)
+
+        assert all(limiter.hit("key", burst=1, per_minute=1)[0] for _ in range(5))
+
+    def test_blocking_store_runs_off_the_event_loop(self, tmp_path):
+        store = SQLiteBucketStore(str(tmp_path / "buckets.db"))
+        limiter = RateLimiter(store)
+        threads = []
+        take = store.take
+
+        def recording_take(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return take(*args, **kwargs)
+
+        store.take = recording_take
+
+        async def scenario():
+            loop_thread = threading.get_ident()
+            assert (await limiter.hit_async("key", burst=1, per_minute=1))[0]
+            assert not (await limiter.hit_async("key", burst=1, per_minute=1))[0]
+            return loop_thread
+
+        loop_thread = asyncio.run(scenario())
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.read_replica import ReplicaRouter, RoutingSession, use_read_replica
+from app.models.product import Product
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+
+    for engine, title in ((primary, "Primary Robot"), (replica, "Replica Robot")):
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            db.add(Product(title=title, price=10, category="Robots", stock=3))
+            db.commit()
+
+    yield primary, replica
+
+    primary.dispose()
+    replica.dispose()
+
+def make_session(primary, router):
+    return sessionmaker(class_=RoutingSession, bind=primary, autoflush=False, router=router)()
+
+class TestReadReplicaRouting:
+    def test_reads_go_to_replica(self, engines):
+        primary, replica = engines
+        db = use_read_replica(make_session(primary, ReplicaRouter([replica])))
+
+        assert db.query(Product.title).scalar() == "Replica Robot"
+        db.close()
+
+    def test_sessions_without_read_flag_use_primary(self, engines):
+        primary, replica = engines
+        db = make_session(primary, ReplicaRouter([replica]))
+
+        assert db.query(Product.title).scalar() == "Primary Robot"
+        db.close()
+
+    def test_reads_after_write_stay_on_primary(self, engines):
+        primary, replica = engines
+        router = ReplicaRouter([replica])
+        db = use_read_replica(make_session(primary, router))
+
+        assert db.query(Product).count() == 1
+
+        db.add(Product(title="Fresh Robot", price=12, category="Robots", stock=1))
+        db.flush()
+        db.commit()
+
+        titles = {title for (title,) in db.query(Product.title).all()}
+        assert titles == {"Primary Robot", "Fresh Robot"}
+        assert router.stats()["primary_fallbacks"] == 1
+        db.close()
+
+    def test_lagging_replica_falls_back_to_primary(self, engines):
+        primary, replica = engines
+        router = ReplicaRouter([replica], max_lag_seconds=1.0, lag_query="SELECT 30")
+
+        assert router.check() == 0
+
+        db = use_read_replica(make_session(primary, router))
+        assert db.query(Product.title).scalar() == "Primary Robot"
+        assert router.stats()["unavailable"] == 1
+        db.close()
+
+    def test_disabled_router_leaves_session_on_primary(self, engines):
+        primary, _ = engines
+        db = use_read_replica(make_session(primary, ReplicaRouter([])))
+
+        assert not db.info.get("read_replica")
+        assert db.query(Product.title).scalar() == "Primary Robot"
+        db.close()
@@ -0,0 +1,60 @@
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_MISS
+
+from app.models.cart import CartItem
+from app.models.wishlist import Wishlist
+from app.repositories.cart_repository import CartRepository
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.user_repository import UserRepository
+from app.repositories.wishlist_repository import WishlistRepository
+
+def record_compiles(engine, misses):
+    def record(conn, cursor, statement, parameters, context, executemany):
+        misses.append(context.cache_hit is CACHE_MISS)
+    event.listen(engine, "after_cursor_execute", record)
+    return record
+
+class TestRepositoryStatements:
+    def test_hot_paths_reuse_compiled_statements(self, db_session, customer_user, sample_product):
+        db_session.add(CartItem(user_id=customer_user.id, product_id=sample_product.id, quantity=2))
+        db_session.add(Wishlist(user_id=customer_user.id, product_id=sample_product.id))
+        db_session.commit()
+
+        users = UserRepository(db_session)
+        carts = CartRepository(db_session)
+        wishlists = WishlistRepository(db_session)
+
+        def hot_paths(username, user_id):
+            users.get_by_username(username)
+            carts.get_by_user_id(user_id)
+            carts.get_by_user_and_product(user_id, sample_product.id)
+            wishlists.is_in_wishlist(user_id, sample_product.id)
+
+        hot_paths("warmup", 0)
+        username, user_id = customer_user.username, customer_user.id
+
+        misses = []
+        listener = record_compiles(db_session.get_bind(), misses)
+        hot_paths(username, user_id)
+        event.remove(db_session.get_bind(), "after_cursor_execute", listener)
+
+        assert len(misses) == 4
+        assert not any(misses)
+        assert users.get_by_username(customer_user.username).id == customer_user.id
+        assert carts.get_by_user_and_product(customer_user.id, sample_product.id).quantity == 2
+        assert wishlists.is_in_wishlist(customer_user.id, sample_product.id)
+        assert not wishlists.is_in_wishlist(customer_user.id, sample_product.id + 1)
+
+    def test_paged_user_queries_are_ordered(self, db_session, customer_user, sample_product):
+        from app.models.review import Review
+        db_session.add_all([
+            Review(product_id=sample_product.id, user_id=customer_user.id, rating=r, text=f"Review {r}")
+            for r in (5, 3, 4)
+        ])
+        db_session.commit()
+
+        reviews = ReviewRepository(db_session)
+
+        page = reviews.get_by_user_id(customer_user.id, skip=1, limit=1)
+        assert [r.rating for r in page] == [3]
+        assert [r.rating for r in reviews.get_by_user_id(customer_user.id)] == [5, 3, 4]
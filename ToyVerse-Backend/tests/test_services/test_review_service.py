@@ -0,0 +1,103 @@
+import pytest
+from app.services.review_service import ReviewService
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.product_repository import ProductRepository
+from app.models.user import Customer
+
+def _make_customers(db_session, count):
+    customers = []
+    for index in range(count):
+        customer = Customer(
+            username=f"reviewer{index}",
+            email=f"reviewer{index}@test.com",
+            password_hash="not-a-real-hash",
+            role="customer"
+        )
+        db_session.add(customer)
+        customers.append(customer)
+    db_session.commit()
+    return customers
+
+class TestReviewService:
+    def test_create_review_updates_aggregates(self, db_session, sample_product):
+        service = ReviewService(ReviewRepository(db_session), ProductRepository(db_session))
+        first, second = _make_customers(db_session, 2)
+
+        service.create({'product_id': sample_product.id, 'user_id': first.id, 'rating': 5})
+        service.create({'product_id': sample_product.id, 'user_id': second.id, 'rating': 2})
+
+        db_session.refresh(sample_product)
+        assert sample_product.rating_count == 2
+        assert sample_product.rating_sum == 7
+        assert sample_product.average_rating == 3.5
+        assert sample_product.rating == 4
+        assert sample_product.rating_histogram == {'1': 0, '2': 1, '3': 0, '4': 0, '5': 1}
+
+    def test_update_and_delete_review_adjust_aggregates(self, db_session, sample_product):
+        service = ReviewService(ReviewRepository(db_session), ProductRepository(db_session))
+        customer, = _make_customers(db_session, 1)
+
+        review = service.create({'product_id': sample_product.id, 'user_id': customer.id, 'rating': 4})
+        service.update(review.id, {'rating': 1})
+
+        db_session.refresh(sample_product)
+        assert sample_product.rating_histogram['4'] == 0
+        assert sample_product.rating_histogram['1'] == 1
+        assert sample_product.rating == 1
+
+        assert service.delete(review.id)
+
+        db_session.refresh(sample_product)
+        assert sample_product.rating_count == 0
+        assert sample_product.average_rating == 0.0
+        assert sample_product.rating == 0
+
+    def test_rebuild_rating_aggregates(self, db_session, sample_product):
+        review_repo = ReviewRepository(db_session)
+        service = ReviewService(review_repo, ProductRepository(db_session))
+        first, second, third = _make_customers(db_session, 3)
+
+        for customer, rating in ((first, 5), (second, 4), (third, 4)):
+            service.create({'product_id': sample_product.id, 'user_id': customer.id, 'rating': rating})
+
+        sample_product.rating_sum = 0
+        sample_product.rating_count = 0
+        db_session.commit()
+
+        assert service.rebuild_rating_aggregates() == 1
+
+        db_session.refresh(sample_product)
+        assert sample_product.rating_count == 3
+        assert sample_product.rating_sum == 13
+        assert sample_product.rating_histogram['4'] == 2
+
+    def test_product_reviews_keyset_pages(self, db_session, sample_product):
+        service = ReviewService(ReviewRepository(db_session), ProductRepository(db_session))
+        customers = _make_customers(db_session, 3)
+
+        for customer, rating in zip(customers, (3, 5, 4)):
+            service.create({'product_id': sample_product.id, 'user_id': customer.id, 'rating': rating})
+
+        first_page, cursor = service.get_product_reviews_page(sample_product.id, "rating", None, 2)
+        assert [review.rating for review in first_page] == [5, 4]
+        assert first_page[0].user.username == "reviewer1"
+        assert cursor is not None
+
+        second_page, cursor = service.get_product_reviews_page(sample_product.id, "rating", cursor, 2)
+        assert [review.rating for review in second_page] == [3]
+        assert cursor is None
+
+        newest, _ = service.get_product_reviews_page(sample_product.id, "newest", None, 3)
+        assert [review.user_id for review in newest] == [customers[2].id, customers[1].id, customers[0].id]
+
+    def test_product_reviews_rejects_foreign_cursor(self, db_session, sample_product):
+        service = ReviewService(ReviewRepository(db_session), ProductRepository(db_session))
+        customers = _make_customers(db_session, 2)
+
+        for customer in customers:
+            service.create({'product_id': sample_product.id, 'user_id': customer.id, 'rating': 4})
+
+        _, cursor = service.get_product_reviews_page(sample_product.id, "newest", None, 1)
+
+        with pytest.raises(ValueError):
+            service.get_product_reviews_page(sample_product.id, "rating", cursor, 1)
@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime
+
+from app.core.revocation import BloomFilter, RevocationList
+
+class TestBloomFilter:
+    def test_added_keys_are_always_found(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [uuid.uuid4().hex for _ in range(1000)]
+
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+        assert len(bloom) == 1000
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for _ in range(1000):
+            bloom.add(uuid.uuid4().hex)
+
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+
+        assert false_positives < 300
+
+class TestRevocationList:
+    def test_rebuild_replaces_filter(self):
+        revocations = RevocationList(capacity=100, error_rate=0.001)
+        revocations.add("old-token")
+
+        synced_at = datetime.utcnow()
+        assert revocations.rebuild(["new-token"], synced_at) == 1
+
+        assert revocations.might_be_revoked("new-token")
+        assert not revocations.might_be_revoked("old-token")
+        assert revocations.synced_at == synced_at
+
+    def test_needs_rebuild_when_over_capacity(self):
+        revocations = RevocationList(capacity=2, error_rate=0.01)
+        revocations.add_many(["a", "b"])
+        assert not revocations.needs_rebuild
+
+        revocations.add("c")
+        assert revocations.needs_rebuild
+
+class TestRevocationSync:
+    def test_sync_overlaps_transactions_committed_late(self, db_session, monkeypatch):
+        from datetime import timedelta
+        from app.models.auth_token import RevokedToken
+        from app.repositories.token_repository import TokenRepository
+        from app.repositories.user_repository import UserRepository
+        from app.services import auth_service
+        from app.services.auth_service import AuthService
+
+        revocations = RevocationList(capacity=100, error_rate=0.01)
+        monkeypatch.setattr(auth_service, "revocation_list", revocations)
+
+        now = datetime.utcnow()
+        revocations.rebuild([], now)
+
+        db_session.add(RevokedToken(
+            jti="late-commit",
+            expires_at=now + timedelta(hours=1),
+            created_at=now - timedelta(seconds=5)
+        ))
+        db_session.commit()
+
+        service = AuthService(UserRepository(db_session), TokenRepository(db_session))
+
+        assert service.sync_revocation_list() == 1
+        assert revocations.might_be_revoked("late-commit")
+        assert revocations.synced_at > now
@@ -0,0 +1,80 @@
+import time
+
+from app.core.product_catalog import ProductCatalog
+from app.core.session_profiles import SessionProfileStore
+from app.models.product import Product
+from app.repositories.interaction_repository import InteractionRepository
+from app.repositories.product_repository import ProductRepository
+from app.services.recommendation_service import RecommendationService
+
+class TestSessionProfileStore:
+    def test_recent_views_are_unique_and_bounded(self):
+        store = SessionProfileStore(recent_limit=3)
+        for product_id in (1, 2, 3, 2, 4):
+            store.record("s1", product_id, "Toys" if product_id % 2 else "Sets")
+
+        profile = store.get("s1")
+
+        assert profile.recent == (4, 2, 3)
+        assert profile.categories == {"Toys": 2, "Sets": 3}
+
+    def test_sessions_expire(self, monkeypatch):
+        store = SessionProfileStore(ttl_seconds=10)
+        store.record("s1", 1, "Toys")
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+
+        assert store.get("s1") is None
+        assert store.stats()["expirations"] == 1
+
+    def test_least_recently_active_session_is_evicted(self):
+        store = SessionProfileStore(max_sessions=2)
+        store.record("s1", 1)
+        store.record("s2", 1)
+        store.record("s1", 2)
+        store.record("s3", 1)
+
+        assert store.get("s2") is None
+        assert store.get("s1").recent == (2, 1)
+        assert store.stats()["evictions"] == 1
+
+class TestSessionRecommendations:
+    def test_anonymous_recommendations_use_profile(self, db_session, sample_product):
+        db_session.add_all([
+            Product(title="Another Set", price=5, category="Sets", stock=1),
+            Product(title="Puzzle", price=5, category="Puzzles", stock=1),
+        ])
+        db_session.commit()
+
+        store = SessionProfileStore()
+        interactions = InteractionRepository(db_session)
+        products = ProductRepository(db_session)
+        catalog = ProductCatalog()
+        catalog.load(products.get_categories())
+        service = RecommendationService(interactions, products, sessions=store, catalog=catalog)
+
+        def forbidden(*args, **kwargs):
+            raise AssertionError("query issued")
+        products.get_by_id = forbidden
+
+        service.track_interaction(sample_product.id, 'view', session_id="s1")
+        assert store.get("s1").categories == {"Sets": 1}
+
+        del products.get_by_id
+        interactions.get_session_interactions = forbidden
+
+        recs = service.get_recommendations_for_user(session_id="s1", rec_type='category')
+
+        assert [r['title'] for r in recs] == ["Another Set"]
+
+    def test_unknown_session_gets_popular_products(self, db_session, sample_product):
+        service = RecommendationService(
+            InteractionRepository(db_session),
+            ProductRepository(db_session),
+            sessions=SessionProfileStore()
+        )
+
+        recs = service.get_recommendations_for_user(session_id="new-session")
+
+        assert [r['id'] for r in recs] == [sample_product.id]
@@ -0,0 +1,123 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.unit_of_work import UnitOfWork
+from app.models.product import Product
+from app.models.user import Customer
+from app.repositories.product_repository import ProductRepository
+from app.repositories.user_repository import UserRepository
+
+CUSTOMER_DETAILS = {
+    "name": "Test Customer",
+    "email": "customer@test.com",
+    "phone": "1234567890",
+    "address": "123 Test St",
+    "city": "Test City",
+    "postal_code": "12345"
+}
+
+@pytest.fixture
+def commit_counter():
+    commits = []
+
+    def record(session):
+        if not session.in_nested_transaction():
+            commits.append(session)
+
+    event.listen(Session, "after_commit", record)
+    yield commits
+    event.remove(Session, "after_commit", record)
+
+class TestUnitOfWork:
+    def test_read_only_work_skips_commit(self, db_session, commit_counter):
+        unit_of_work = UnitOfWork(db_session)
+        db_session.query(Product).all()
+
+        unit_of_work.commit()
+
+        assert commit_counter == []
+
+    def test_callbacks_run_after_commit(self, db_session, commit_counter):
+        unit_of_work = UnitOfWork(db_session)
+        calls = []
+
+        db_session.add(Product(title="Kite", price=5, category="Outdoor", stock=1))
+        db_session.flush()
+        unit_of_work.after_commit(lambda: calls.append(len(commit_counter)))
+
+        assert calls == []
+        unit_of_work.commit()
+
+        assert calls == [1]
+
+    def test_rollback_discards_callbacks(self, db_session):
+        unit_of_work = UnitOfWork(db_session)
+        calls = []
+
+        db_session.add(Product(title="Kite", price=5, category="Outdoor", stock=1))
+        db_session.flush()
+        unit_of_work.after_commit(lambda: calls.append(True))
+        unit_of_work.rollback()
+        unit_of_work.commit()
+
+        assert calls == []
+        assert db_session.query(Product).count() == 0
+
+    def test_failed_write_keeps_earlier_writes(self, db_session, customer_user):
+        unit_of_work = UnitOfWork(db_session)
+        products = ProductRepository(db_session)
+        users = UserRepository(db_session)
+
+        kite = products.create(Product(title="Kite", price=5, category="Outdoor", stock=1))
+        duplicate = users.create(Customer(
+            username=customer_user.username,
+            email="other@test.com",
+            password_hash="x",
+            role="customer"
+        ))
+
+        assert kite is not None
+        assert duplicate is None
+        assert unit_of_work.has_pending_writes
+
+        unit_of_work.commit()
+        db_session.expire_all()
+
+        assert db_session.query(Product).filter(Product.title == "Kite").count() == 1
+
+    def test_checkout_commits_once(self, client, customer_token, sample_product, commit_counter):
+        headers = {"Authorization": f"Bearer {customer_token}"}
+        client.post("/api/cart/add", json={"product_id": sample_product.id, "quantity": 2}, headers=headers)
+        commit_counter.clear()
+
+        response = client.post(
+            "/api/orders",
+            json={"customer_details": CUSTOMER_DETAILS, "payment_method": "COD"},
+            headers=headers
+        )
+
+        assert response.status_code == 201
+        assert len(commit_counter) == 1
+
+    def test_failed_checkout_leaves_stock_untouched(self, client, db_session, customer_token, sample_product):
+        headers = {"Authorization": f"Bearer {customer_token}"}
+        scarce = Product(title="Rare Toy", price=99, category="Sets", stock=5)
+        db_session.add(scarce)
+        db_session.commit()
+
+        client.post("/api/cart/add", json={"product_id": sample_product.id, "quantity": 2}, headers=headers)
+        client.post("/api/cart/add", json={"product_id": scarce.id, "quantity": 5}, headers=headers)
+
+        scarce.stock = 1
+        db_session.commit()
+
+        response = client.post(
+            "/api/orders",
+            json={"customer_details": CUSTOMER_DETAILS, "payment_method": "COD"},
+            headers=headers
+        )
+
+        assert response.status_code == 400
+        db_session.expire_all()
+        assert db_session.get(Product, sample_product.id).stock == 10